@@ -1,17 +1,32 @@
-import sys, subprocess, os, shutil, chardet, logging
+import sys, subprocess, os, shutil, logging
 
-from PyQt6.QtCore import QSize, Qt, QEvent, QRect, QFileInfo, QMimeData, QUrl, QSettings, QPoint, pyqtSignal
+from PyQt6.QtCore import QSize, Qt, QEvent, QRect, QFileInfo, QMimeData, QUrl, QSettings, QPoint, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QHBoxLayout, QVBoxLayout, QTabWidget, QWidget, QFrame,
-                             QSplitter, QTextEdit, QFileDialog, QListWidget, QListWidgetItem, QMessageBox)
-from PyQt6.QtGui import QCursor, QIcon, QDrag, QColor, QDesktopServices, QGuiApplication
+                             QSplitter, QTextEdit, QFileDialog, QMessageBox)
+from PyQt6.QtGui import QCursor, QIcon, QDrag, QDesktopServices, QGuiApplication
 
 from src.custom_title_bar import CustomTitleBar
 from src.side_bar import SideBar
-from src.monaco_editor import MonacoEditor
+from src.editor_tab import EditorTab
+from src.editor_pool import MonacoEditorPool
+from src.tab_hibernator import TabHibernator
+from src.frame_pacer import GeometryPacer
+from src.session_restore import SessionRestorer
+from src.hot_exit import HotExitJournal
+from src.document_registry import DocumentRegistry
+from src.log_viewer import LogViewer
+from src.editor_settings import load_editor_settings
+from src.monaco_scheme import register_monaco_scheme
+from src.editor_profile import editor_profile
+from src import file_sniffer
 from src.secondary_bar import SecondaryBar
 from src.activity_bar import ActivityBar
 from src.status_bar import StatusBar
-from src.pylint_worker import PylintWorker
+from src.file_saver import FileSaveService
+from src.lint_daemon import LintDaemon
+from src.lint_cache import LintCache
+from src.lint_scheduler import LintScheduler
+from src.problems_view import ProblemsView
 from src.terminal import TerminalWidget
 from src.process_worker import ProcessMonitor
 from src.developer_tools import DeveloperToolsPanel, HoverEventFilter
@@ -33,10 +48,14 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self.clear_recent_files()
-
-        # Initialize a dictionary to keep track of file paths for each tab
-        self.file_paths = {}  # Maps QTextEdit widgets to file paths
+        self.documents = DocumentRegistry() # Open documents by tab widget and by file
+        self.editor_settings = load_editor_settings()
+        editor_profile(self.editor_settings["http_cache_mb"]) # Created by the first window, shared by all later ones
+        self.journal = HotExitJournal.instance() if self.editor_settings["hot_exit"] else None
+        self.lint_cache = LintCache.instance(self.editor_settings["lint_cache_mb"])
+        self.lint_scheduler = LintScheduler(LintDaemon.instance(), self.lint_cache, self.editor_settings["lint_delay_ms"], self)
+        self.lint_scheduler.results_ready.connect(self.on_lint_results)
+        self.lint_scheduler.failed.connect(self.on_lint_failed)
         self.is_welcome_open = False
         self.is_release_notes_open = False
 
@@ -45,6 +64,9 @@ class MainWindow(QMainWindow):
         self.initialize_tabs()
         self.apply_styles()
 
+        if self.journal is not None:
+            QTimer.singleShot(0, self.offer_backup_restore) # Asked once the window is up
+
         ############################# - Should be removed from here -  #############################
         self.handleReleaseSignal.connect(self.side_bar.trigger_mouse_release)
         self.splitter.splitterMoved.connect(self.on_splitter_moved)
@@ -88,7 +110,13 @@ class MainWindow(QMainWindow):
         self.is_resizing_top = False
         self.is_resizing_bottom = False
 
+        self.restoring_session = False
+        self.session_restorer = SessionRestorer(self)
+
         self.dragging = False
+        self.system_moving = False # The window manager is moving the window; it also handles snapping
+        self.use_system_geometry = True # Let the platform move and resize the window where it can
+        self.geometry_pacer = GeometryPacer(self)
         self.start_size = self.size()
         self.original_geometry = None
         self.has_snapped = False  # Track if it has snapped during drag
@@ -112,7 +140,7 @@ class MainWindow(QMainWindow):
     def _get_tab_signals(self):
         return {
             self.tabs.tabCloseRequested: self.close_tab,
-            self.tabs.currentChanged: self.status_bar.update_status_bar,
+            self.tabs.currentChanged: self.on_current_tab_changed,
         }
 
     def apply_styles(self):
@@ -170,14 +198,21 @@ class MainWindow(QMainWindow):
             signal.connect(slot)
 
     def initialize_tabs(self):
+        """Restores last session's tabs as placeholders. Only the tab that was active builds its editor and reads
+        its file right away; the others follow in the background, so startup does not grow with the tab count."""
         file_paths = self.load_recent_files() # Method to fetch recently opened files dynamically
+        cursor_positions = self.load_recent_cursor_positions()
+        restored_tabs = []
+
+        self.restoring_session = True # Adding the first tab would otherwise make it current and load it
 
         for file_path in file_paths:
             file_name = file_path.split('/')[-1]
 
-            widget = self.create_text_edit(file_path)
+            widget = self.create_text_edit(file_path, lazy=True, cursor_position=cursor_positions.get(file_path))
 
-            self.file_paths[widget] = file_path
+            if isinstance(widget, EditorTab):
+                restored_tabs.append(widget)
 
             icon_index = self.side_bar.file_system_model.index(file_path)
             icon = self.side_bar.file_system_model.data(icon_index, role=Qt.ItemDataRole.DecorationRole)
@@ -192,6 +227,84 @@ class MainWindow(QMainWindow):
                 """
             )
 
+        self.restoring_session = False
+
+        if file_paths:
+            active_file = QSettings(self.COMPANY_NAME, self.APPLICATION_NAME).value("recentActiveFile", "")
+            active_index = file_paths.index(active_file) if active_file in file_paths else 0
+
+            self.tabs.setCurrentIndex(active_index)
+            self.on_current_tab_changed(active_index)
+
+            current_widget = self.tabs.currentWidget()
+            current_tab = current_widget if isinstance(current_widget, EditorTab) else None # Log viewers load nothing to wait for
+            self.session_restorer.restore([tab for tab in restored_tabs if tab is not current_widget], current_tab)
+
+    def offer_backup_restore(self):
+        """Offers to bring back the unsaved changes the previous session left in its hot exit backups."""
+        backups = self.journal.take_backups()
+
+        if not backups:
+            return
+
+        response = QMessageBox.question(
+            self, "Restore Unsaved Changes",
+            f"{len(backups)} document(s) had unsaved changes when the editor last closed. Do you want to restore them?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+
+        if response == QMessageBox.StandardButton.Yes:
+            for backup in backups:
+                self.restore_backup(backup)
+
+            logging.info(f"Restored {len(backups)} document(s) from hot exit backups.")
+
+        # Restored documents are journaled again under new ids as soon as they are shown
+        self.journal.delete_backups(backups)
+
+    def restore_backup(self, backup):
+        if backup.file_path and os.path.exists(backup.file_path):
+            widget = self.open_file_in_tab(backup.file_path)
+        else:
+            self.create_new_tab()
+            widget = self.tabs.currentWidget()
+            self.tabs.setTabText(self.tabs.indexOf(widget), backup.title)
+
+        if isinstance(widget, EditorTab):
+            widget.restore_backup(backup.text)
+
+    def load_recent_cursor_positions(self):
+        """Cursor positions of last session's tabs, by file path."""
+        settings = QSettings(self.COMPANY_NAME, self.APPLICATION_NAME)
+        positions = settings.value("recentCursorPositions", {}) or {}
+
+        return {file_path: tuple(int(value) for value in position) for file_path, position in positions.items()}
+
+    def save_session_state(self):
+        """Remembers the cursor of every open tab and which tab was active, for the next session's restore."""
+        positions = {}
+
+        for index in range(self.tabs.count()):
+            widget = self.tabs.widget(index)
+
+            if isinstance(widget, EditorTab) and widget.file_path:
+                positions[widget.file_path] = list(widget.cursor_position)
+
+        current_widget = self.tabs.currentWidget()
+
+        settings = QSettings(self.COMPANY_NAME, self.APPLICATION_NAME)
+        settings.setValue("recentCursorPositions", positions)
+        settings.setValue("recentActiveFile", current_widget.file_path if isinstance(current_widget, EditorTab) else "")
+
+    def closeEvent(self, event):
+        self.save_session_state()
+
+        if self.journal is not None:
+            self.journal.flush() # Unsaved tabs are kept as backups instead of prompting
+
+        super().closeEvent(event)
+
     def load_recent_files(self):
         """Load the list of recently opened files."""
         settings = QSettings(self.COMPANY_NAME, self.APPLICATION_NAME)
@@ -224,21 +337,37 @@ class MainWindow(QMainWindow):
 
     def get_tab_index_by_file(self, file_name):
         """Helper function to check if a file is already open and return the tab index."""
-        for tab_index in range(self.tabs.count()):
-            current_widget = self.tabs.widget(tab_index)
-
-            if self.file_paths.get(current_widget) == file_name:
-                return tab_index
-            
-        return None
-
-    def create_text_edit(self, file_path=None):
-        widget = MonacoEditor(self)
+        handle = self.documents.find(file_name)
+
+        return self.tabs.indexOf(handle.widget) if handle is not None else None
+
+    def create_text_edit(self, file_path=None, lazy=False, cursor_position=None):
+        """Creates an editor tab, backed by the shared Monaco page when the shared host mode is enabled,
+        and starts streaming the file into it if one is given. Files too big for Monaco get a read-only log viewer.
+        Lazy tabs are placeholders that only do this once they are first shown."""
+        if file_path and self.is_log_viewer_file(file_path):
+            widget = LogViewer(self, file_path)
+            self.documents.register(widget, file_path)
+
+            return widget
+
+        widget = EditorTab(self, file_path=file_path, shared_editor=self.shared_editor, editor_pool=self.editor_pool,
+                           lazy=lazy, cursor_position=cursor_position, journal=self.journal)
+        widget.cursor_position_changed.connect(lambda line, col: self.status_bar.on_cursor_position_changed(widget, line, col))
+        widget.file_loaded.connect(self.status_bar.update_status_bar)
+        widget.save_failed.connect(lambda error: self.on_save_failed(widget, error))
+        widget.changed_on_disk.connect(lambda: self.on_changed_on_disk(widget))
+        widget.content_changed.connect(lambda: self.lint_scheduler.schedule(widget))
+        widget.file_loaded.connect(lambda: self.lint_scheduler.schedule(widget))
+
+        # Atomic saves give the file a new inode
+        self.documents.register(widget, file_path)
+        widget.file_loaded.connect(lambda: self.documents.update_file_id(widget, widget.file_stat))
+        widget.file_saved.connect(lambda: self.documents.update_file_id(widget, widget.file_stat))
 
         if file_path:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                widget.setText(content)
+            widget.load_file(self.editor_settings["large_file_threshold_mb"] * 1024 * 1024,
+                             self.editor_settings["stream_chunk_kb"] * 1024)
 
         # Connect the textChanged signal to a method that checks for problems and updates status_bar
         #widget.textChanged.connect(self.check_for_problems)
@@ -246,6 +375,12 @@ class MainWindow(QMainWindow):
 
         return widget
 
+    def is_log_viewer_file(self, file_path):
+        try:
+            return os.path.getsize(file_path) >= self.editor_settings["log_viewer_threshold_mb"] * 1024 * 1024
+        except OSError:
+            return False
+
     def create_tabs(self):
         """Create and return the tabs for the window (this method should be defined elsewhere)."""
         tabs = QTabWidget()
@@ -257,49 +392,8 @@ class MainWindow(QMainWindow):
 
         return tabs
 
-    def detect_encoding(self, text=None, file_path=None):
-        """Detect the file encoding."""
-        if text is None and file_path is None:
-            return None # Should handle the case when neither is provided
-
-        if file_path:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                result = chardet.detect(raw_data)
-                encoding = result["encoding"]
-
-        # If `text` is provided, you could try to detect the encoding of the text itself
-        # (though this might be less accurate)
-        if text:
-            # Some kind of detection logic for the string text (using chardet or similar)
-            return "UTF-8"  # Default fallback, assuming UTF-8 for now
-
-        return encoding
-
-    def detect_line_endings(self, text):
-        if "\r\n" in text:
-            return "CRLF"
-        elif "\n" in text:
-            return "LF"
-        elif "\r" in text:
-            return "CR"
-        return "None"
-
     def detect_language(self, file_path):
-        extension_to_language = {
-            ".py": "{ } Python",
-            ".js": "{ } JavaScript",
-            ".html": "{ } HTML",
-            ".css": "{ } CSS",
-            ".qss": "{ } QSS",
-            ".java": "{ } Java",
-            ".cpp": "{ } C++",
-            # Add more as needed
-        }
-    
-        file_extension = file_path.split('.')[-1] if '.' in file_path else ''
-
-        return extension_to_language.get('.' + file_extension, "{ } Plain Text")
+        return f"{{ }} {file_sniffer.detect_language(file_path)[1]}"
 
     def create_main_layout(self):
         """Creates and returns the main layout for the window."""
@@ -308,11 +402,19 @@ class MainWindow(QMainWindow):
         self.panel.tabBar().setCursor(Qt.CursorShape.PointingHandCursor)
 
         self.tabs = self.create_tabs()
+        self.editor_pool = MonacoEditorPool.instance(self.editor_settings["pool_size"])
+        self.shared_editor = self.create_shared_editor()
         self.status_bar = StatusBar(self)
+        self.problems_view.model.counts_changed.connect(self.status_bar.set_problem_counts) # Totals over all files
         self.side_bar = SideBar(self)
         self.secondary_bar = SecondaryBar(self)
+        self.tab_hibernator = TabHibernator(self.tabs, self.editor_settings["hibernate_after_minutes"], self.editor_settings["memory_budget_mb"], self)
         self.table = ProcessMonitor()
+        self.table.set_tab_hibernator(self.tab_hibernator)
         self.developer_tools = DeveloperToolsPanel()
+        self.developer_tools.set_editor_pool(self.editor_pool)
+        self.developer_tools.set_lint_cache(self.lint_cache)
+        self.developer_tools.set_file_saver(FileSaveService.instance())
         self.issue_reporter = IssueReporterWindow()
 
         splitter1 = QSplitter()
@@ -394,6 +496,30 @@ class MainWindow(QMainWindow):
 
         return container
 
+    def create_shared_editor(self):
+        """Creates the single long-lived Monaco page that hosts every tab's model, if the shared host mode is enabled."""
+        if not self.editor_settings["shared_host"]:
+            return None
+
+        shared_editor = self.editor_pool.acquire(self)
+        shared_editor.hide() # Shown once it is moved into the first editor tab
+
+        return shared_editor
+
+    def on_current_tab_changed(self, index):
+        """Swaps the current tab's model into the editor and refreshes the status bar."""
+        if self.restoring_session:
+            return
+
+        current_widget = self.tabs.widget(index)
+
+        if isinstance(current_widget, EditorTab):
+            current_widget.attach()
+            self.lint_scheduler.lint(current_widget) # Usually answered from the lint cache right away
+
+        self.secondary_bar.outline_view.set_tab(current_widget if isinstance(current_widget, EditorTab) else None)
+        self.status_bar.update_status_bar()
+
     def create_additional_tabs_panel(self):
         panel = QTabWidget()
         panel.setMovable(True)
@@ -411,9 +537,9 @@ class MainWindow(QMainWindow):
 
     def create_additional_tab_widget(self, tab_name):
         if tab_name == "PROBLEMS": # PROBLEMS tab
-            widget = QListWidget()
-            widget.setObjectName("PanelTab")
-            self.problems_widget = widget
+            widget = ProblemsView()
+            widget.problem_activated.connect(self.on_problem_activated)
+            self.problems_view = widget
         elif tab_name == "TERMINAL":
             widget = TerminalWidget()
             self.terminal_widget = widget
@@ -426,12 +552,10 @@ class MainWindow(QMainWindow):
 
     def create_new_tab(self, initial_content=None):
         """Creates a new tab with a text editor and optional initial content."""
-        new_tab = MonacoEditor(self)
+        new_tab = self.create_text_edit()
 
-        if initial_content:
-            new_tab.set_content(initial_content)
-        else:
-            new_tab.append_content("Select a language, or fill with template, or open a different editor to get started.\nStart typing to dismiss or don't show this again.")
+        # Set rather than appended, so the hint counts as the tab's unmodified content
+        new_tab.set_content(initial_content or "Select a language, or fill with template, or open a different editor to get started.\nStart typing to dismiss or don't show this again.")
 
         # Connect the textChanged signal to a method that checks for problems
         # - # new_tab.textChanged.connect(self.check_for_problems)
@@ -467,55 +591,45 @@ class MainWindow(QMainWindow):
                                                    options=options)
 
         if file_name:
-            # Check if the file is already opened in a tab
-            
-            existing_tab_index = self.get_tab_index_by_file(file_name)
+            self.open_file_in_tab(file_name)
 
-            if existing_tab_index is not None:
-                self.tabs.setCurrentIndex(existing_tab_index) # Switch to the existing tab
-                logging.info("File is already open in another tab.")
+    def open_file_in_tab(self, file_name):
+        """Opens a file in a new tab, or switches to the tab already showing it. Returns the tab."""
+        existing_tab_index = self.get_tab_index_by_file(file_name)
 
-                return
+        if existing_tab_index is not None:
+            self.tabs.setCurrentIndex(existing_tab_index) # Switch to the existing tab
+            logging.info("File is already open in another tab.")
 
-            # Add logic to handle the opened file, e.g., opening it in a new tab
-            new_tab = MonacoEditor(self, file_path=file_name)
+            return self.tabs.widget(existing_tab_index)
 
-            # Load the file content
-            try:
-                with open(file_name, 'r') as file:
-                    content = file.read()
-                    new_tab.set_content(content)
-                    
-                    # Connect the textChanged signal to a method that checks for problems
-                    #new_tab.textChanged.connect(self.check_for_problems)
-                    #new_tab.cursorPositionChanged.connect(self.status_bar.update_status_bar)
-
-                    logging.info(f"Opening file: {file_name}.")
-            except Exception as e:
-                new_tab.set_content(f"Error loading file: {e}.")
-                logging.error(f"Error opening file {file_name}: {e}.")
-
-            # Set file path and update the recent files list
-            self.file_paths[new_tab] = file_name
-            self.save_recent_file(file_name)
-            
-            # Set the tab icon based on the file system model
-            icon_index = self.side_bar.file_system_model.index(file_name)
-            icon = self.side_bar.file_system_model.data(icon_index, role=Qt.ItemDataRole.DecorationRole)
+        # Add logic to handle the opened file, e.g., opening it in a new tab
+        new_tab = self.create_text_edit(file_name) # Streams the file content in off the UI thread
 
-            tab_name = QFileInfo(file_name).fileName()
+        logging.info(f"Opening file: {file_name}.")
 
-            self.tabs.addTab(new_tab, QIcon(icon), tab_name)
-            self.tabs.setCurrentWidget(new_tab)  # Switch to the new tab
-            self.tabs.tabBar().setTabToolTip(self.tabs.indexOf(new_tab), file_name)
+        # Update the recent files list
+        self.save_recent_file(file_name)
+        
+        # Set the tab icon based on the file system model
+        icon_index = self.side_bar.file_system_model.index(file_name)
+        icon = self.side_bar.file_system_model.data(icon_index, role=Qt.ItemDataRole.DecorationRole)
 
-            self.tabs.setStyleSheet(
-                """
-                    QTabWidget#TabBar::pane {
-                        border-top: 1px solid #e5e5e5;
-                    }
-                """
-            )
+        tab_name = QFileInfo(file_name).fileName()
+
+        self.tabs.addTab(new_tab, QIcon(icon), tab_name)
+        self.tabs.setCurrentWidget(new_tab)  # Switch to the new tab
+        self.tabs.tabBar().setTabToolTip(self.tabs.indexOf(new_tab), file_name)
+
+        self.tabs.setStyleSheet(
+            """
+                QTabWidget#TabBar::pane {
+                    border-top: 1px solid #e5e5e5;
+                }
+            """
+        )
+
+        return new_tab
 
     def open_folder(self):
         """Open a folder using a file dialog and display it in the sidebar."""
@@ -538,13 +652,14 @@ class MainWindow(QMainWindow):
 
             return
 
-        current_index = self.tabs.currentIndex()
         current_widget = self.tabs.currentWidget()
-        current_file_path = self.file_paths.get(current_index)
 
-        if current_file_path:
-            # Save to the existing file
-            current_widget.get_content(self._save_to_file, current_file_path)
+        if not isinstance(current_widget, EditorTab):
+            return
+
+        if current_widget.file_path:
+            # Save to the existing file, in the background
+            current_widget.save()
         else:
             # Trigger Save As if no file path is stored
             self.save_as()
@@ -562,9 +677,8 @@ class MainWindow(QMainWindow):
         if file_name:
             current_widget = self.tabs.currentWidget()
 
-            if current_widget:
-                current_widget.get_content(self._save_to_file, file_name)
-                self.file_paths[self.tabs.currentIndex()] = file_name # Store the file path for future saves
+            if isinstance(current_widget, EditorTab) and current_widget.save(file_name):
+                self.documents.rename(current_widget, file_name) # Store the file path for future saves
                 self.tabs.setTabText(self.tabs.currentIndex(), QFileInfo(file_name).fileName()) # Update tab name
 
     def save_all(self):
@@ -574,12 +688,12 @@ class MainWindow(QMainWindow):
 
             return
 
+        # Every modified tab is handed to the save service at once, which writes them in parallel
         for index in range(self.tabs.count()):
             current_widget = self.tabs.widget(index)
-            current_file_path = self.file_paths.get(index)
 
-            if current_widget and current_file_path:
-                current_widget.get_content(self._save_to_file, current_file_path)
+            if isinstance(current_widget, EditorTab) and current_widget.file_path and current_widget.is_modified():
+                current_widget.save()
 
     def close_editor(self):
         current_index = self.tabs.currentIndex()
@@ -597,71 +711,113 @@ class MainWindow(QMainWindow):
     def exit(self):
         QApplication.quit() # Exit the application
 
-    def _save_to_file(self, content, file_path):
-        """Save the content to the specified file path. Handles errors gracefully and provides feedback to the user."""
-        if content is None:
-            logging.warning(f"Content is None. Failed to save {file_path}.")
+    def on_save_failed(self, widget, error):
+        """Tells the user a background save did not make it to disk; the file on disk is left as it was."""
+        QMessageBox.warning(self, "Save Failed", f"Failed to save {widget.file_path}.\n\n{error}")
+
+    def on_changed_on_disk(self, widget):
+        """Another program changed the file of a tab with unsaved changes; the user decides which version wins."""
+        response = QMessageBox.question(
+            self, "File Changed on Disk",
+            f"{widget.file_path} has been changed by another program. Do you want to reload it and lose your unsaved changes?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
 
-            return
-        
-        try:
-            with open(file_path, 'w', encoding="utf-8") as file:
-                file.write(content)
-                logging.info(f"File saved successfully at {file_path}.")
-        except Exception as e:
-            logging.error(f"Failed to save file {file_path}. Error: {e}.")
+        if response == QMessageBox.StandardButton.Yes and widget.disk_change is not None:
+            widget.apply_disk_change(widget.disk_change)
+        else:
+            widget.disk_change = None
 
     def close_tab(self, index):
         """Close a tab and remove its associated data and resources."""
         if index >= 0: # Ensure the index is valid
             current_widget = self.tabs.widget(index)
 
-            # Check if the current widget has unsaved changes
-            if isinstance(current_widget, MonacoEditor):
-                current_widget.is_modified()
-                
-                if current_widget.is_modified:
-                    # Ask the user if they want to save before closing
-                    response = QMessageBox.question(
-                        self, "Unsaved Changes", 
-                        "You have unsaved changes. Do you want to save before closing?", 
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
-                        QMessageBox.StandardButton.Yes
-                    )
-
-                    if response == QMessageBox.StandardButton.Yes:
-                        current_index = self.tabs.currentIndex()
-                        file_path = self.file_paths.get(current_index)
-                        print(self.file_paths)
-                        print(file_path, file_path)
-                        current_widget.get_content(self._save_to_file, file_path)
-                    elif response == QMessageBox.StandardButton.Cancel:
-                        return  # User chose to cancel the close operation
-                    
-                # Disconnect any signals related to the tab (if necessary)
-                #current_widget.textChanged.disconnect(self.check_for_problems)
-                #current_widget.cursorPositionChanged.disconnect(self.status_bar.update_status_bar)
+            # Check if the current widget has unsaved changes before closing it
+            if isinstance(current_widget, EditorTab) and not self._confirm_close_tab(current_widget):
+                return
+
+            self._remove_tab(current_widget)
+
+    def _confirm_close_tab(self, widget):
+        """Asks whether to save a modified tab. Returns False if the user cancels closing it, or if the tab is to be
+        closed once its save has finished."""
+        if widget.is_modified():
+            # Ask the user if they want to save before closing
+            response = QMessageBox.question(
+                self, "Unsaved Changes", 
+                "You have unsaved changes. Do you want to save before closing?", 
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Yes
+            )
+
+            if response == QMessageBox.StandardButton.Yes:
+                if widget.file_path:
+                    if widget.save():
+                        self._close_after_save(widget)
+
+                        return False # Closed once the file is on disk
+                else:
+                    logging.warning("No file path associated with the tab. Closing without saving.")
+            elif response == QMessageBox.StandardButton.Cancel:
+                return False # User chose to cancel the close operation
+
+        return True
+
+    def _close_after_save(self, widget):
+        """Removes a tab once its save has reached the disk. Until then the tab keeps its text and its hot exit
+        backup; if the save fails, on_save_failed shows the error and the tab stays open."""
+        def on_saved():
+            if widget.is_modified() and widget.saver is not None:
+                return # An earlier save finished; the one with the latest text is still being written
+
+            stop_waiting()
+
+            if not widget.is_modified():
+                self._remove_tab(widget)
+
+        def stop_waiting(_error=None):
+            widget.file_saved.disconnect(on_saved)
+            widget.save_failed.disconnect(stop_waiting)
+
+        widget.file_saved.connect(on_saved)
+        widget.save_failed.connect(stop_waiting)
+
+    def _remove_tab(self, widget):
+        """Removes the tab showing the given widget and releases its editor resources."""
+        index = self.tabs.indexOf(widget)
+
+        if index < 0:
+            return
 
-            # Remove the file path associated with the tab before closing
-            if current_widget in self.file_paths:
-                del self.file_paths[current_widget]
+        # Forget the document before closing
+        self.documents.unregister(widget)
 
-            if self.is_welcome_open:
-                self.is_welcome_open = False
+        if isinstance(widget, EditorTab):
+            self.lint_scheduler.forget(widget)
+            self.problems_view.model.remove_file(widget)
 
-            if self.is_release_notes_open:
-                self.is_release_notes_open = False
+        if self.is_welcome_open:
+            self.is_welcome_open = False
 
-            self.tabs.removeTab(index) # Remove the tab at the given index
+        if self.is_release_notes_open:
+            self.is_release_notes_open = False
 
-            if self.tabs.count() == 0:
-                self.tabs.setStyleSheet(
-                    """
-                        QTabWidget#TabBar::pane {
-                            border: none;
-                        }
-                    """
-                )
+        self.tabs.removeTab(index) # Remove the tab at the given index
+
+        if isinstance(widget, (EditorTab, LogViewer)):
+            widget.dispose()
+            widget.deleteLater()
+
+        if self.tabs.count() == 0:
+            self.tabs.setStyleSheet(
+                """
+                    QTabWidget#TabBar::pane {
+                        border: none;
+                    }
+                """
+            )
 
     def show_problems(self):
         if self.panel.isHidden():
@@ -696,7 +852,7 @@ class MainWindow(QMainWindow):
             return
         
         current_widget = self.tabs.currentWidget()
-        current_file_path = self.file_paths.get(current_widget)
+        current_file_path = self.documents.file_path(current_widget)
 
         if not current_file_path:
             self.terminal_widget.append(f"Warning: No file path associated with the current tab.")
@@ -873,59 +1029,31 @@ class MainWindow(QMainWindow):
         else:
             super().dropEvent(event)
 
-    def add_problem(self, message, file_name = None, line_number = None, problem_type = "Error"):
-        formatted_message = f"{problem_type}: {message}"
-
-        if file_name and line_number:
-            formatted_message += f" (File: {file_name}, Line: {line_number})"
-
-        item = QListWidgetItem(formatted_message)
-
-        if problem_type == "Error":
-            item.setForeground(Qt.GlobalColor.red)
-        elif problem_type == "Warning":
-            item.setForeground(QColor(255, 165, 0))
-        else:
-            item.setForeground(Qt.GlobalColor.black)
-        
-        self.problems_widget.addItem(item)
-
     def check_for_problems(self):
-        self.problems_widget.clear() # Clear previous problems
-
         current_widget = self.tabs.currentWidget() # Get the current QTextEdit widget
 
-        if current_widget is not None:  # Check if there's a current widget
-            code = current_widget.get_content() # Get the current text in the editor
-
-            # Start Pylint in a separate thread
-            self.pylint_worker = PylintWorker(code)
-            self.pylint_worker.finished.connect(self.process_pylint_output)
-            self.pylint_worker.start()
+        if isinstance(current_widget, EditorTab):  # Check if there's a current editor
+            self.lint_scheduler.lint(current_widget, force=True) # Published straight away when the cache has it
 
-    def process_pylint_output(self, output):
-        for line in output.splitlines():
-            if any(code in line for code in ["E", "W"]): # Error or Warning
-                parts = line.split(":", 4)
+    def on_lint_results(self, tab, version, diagnostics):
+        """Hands one version's diagnostics, as a batch, to the tab's markers and to the Problems panel, whose
+        counts feed the status bar. Results for a version the document has moved past, or for a closed tab, are
+        dropped."""
+        if tab.disposed or self.tabs.indexOf(tab) < 0 or version != tab.version_id:
+            return
 
-                if len(parts) >= 4:
-                    file_name = parts[0].strip() # File name
-                    line_number = parts[1].strip() # Line number
-                    column_number = parts[2].strip() # Column number
-                    error_code = parts[3].strip() # Error code
-                    message = ':'.join(parts[4:]).strip() # Join the rest for the message
+        tab.set_diagnostics(diagnostics)
+        self.problems_view.model.set_file_problems(tab, self.tabs.tabText(self.tabs.indexOf(tab)), tab.file_path, diagnostics)
 
-                    # Determine problem type based on error code
+    def on_lint_failed(self, tab, error):
+        logging.error(f"Failed to run Pylint on {tab.file_path or 'an untitled document'}: {error}.")
 
-                    if error_code.startswith("E"): # Error
-                        problem_type = "Error"
-                    elif error_code.startswith("W"): # Warning
-                        problem_type = "Warning"
-                    else:
-                        problem_type = "Info"
+    def on_problem_activated(self, tab, line, column):
+        if self.tabs.indexOf(tab) < 0:
+            return
 
-                    # Add the problem to the widget
-                    self.add_problem(message, file_name, f"{line_number} {column_number}", problem_type)
+        self.tabs.setCurrentWidget(tab)
+        tab.reveal_line(line, column)
 
     def clear_terminal(self):
         self.terminal_widget.clear_terminal()
@@ -1023,16 +1151,24 @@ class MainWindow(QMainWindow):
         self.drag_start_pos = QCursor.pos()  # Store the starting position of the cursor
         self.original_geometry = self.geometry() # Store the original geometry
 
+        # A system move is composited by the window manager and never blocks on our event loop
+        self.system_moving = self.use_system_geometry and self.windowHandle().startSystemMove()
+
     def handle_movement(self):
+        if self.system_moving:
+            return
+
         self.dragging = True
 
-        # Calculate the new position of the window
+        # Calculate the new position of the window, from where the previous moves are taking it
         delta = QCursor.pos() - self.drag_start_pos
-        new_position = self.pos() + delta
-        self.move(new_position.x(), new_position.y())
+        self.geometry_pacer.request_move(self.geometry_pacer.target_geometry().topLeft() + delta)
         self.drag_start_pos = QCursor.pos() # Update the start position for the next move
 
     def stop_dragging(self):
+        self.system_moving = False
+        self.geometry_pacer.flush()
+
         if self.dragging:
             screen_rect = self.screen().availableGeometry()
             global_x, global_y = QCursor.pos().x(), QCursor.pos().y()
@@ -1065,14 +1201,29 @@ class MainWindow(QMainWindow):
             mouse_pos = event.pos()
 
             # Check if the mouse is near the edges (resize zones)
+            edges = Qt.Edge(0)
+
             if mouse_pos.x() <= self.resize_edge_size:
                 self.is_resizing_left = True
+                edges |= Qt.Edge.LeftEdge
             if mouse_pos.x() >= self.width() - self.resize_edge_size:
                 self.is_resizing_right = True
+                edges |= Qt.Edge.RightEdge
             if mouse_pos.y() <= self.resize_edge_size:
                 self.is_resizing_top = True
+                edges |= Qt.Edge.TopEdge
             if mouse_pos.y() >= self.height() - self.resize_edge_size:
                 self.is_resizing_bottom = True
+                edges |= Qt.Edge.BottomEdge
+
+            if edges == Qt.Edge(0):
+                return
+
+            # The platform resizes in step with the compositor; the manual resize below is the fallback
+            if self.use_system_geometry and self.windowHandle().startSystemResize(edges):
+                self.is_resizing_left = self.is_resizing_right = self.is_resizing_top = self.is_resizing_bottom = False
+
+                return
 
             # Save the initial mouse position
             self.last_mouse_pos = event.globalPosition()
@@ -1094,13 +1245,13 @@ class MainWindow(QMainWindow):
         self.setCursor(cursor)
 
         if self.resizing:
-            self.setUpdatesEnabled(False)  # Disable updates during resizing
-
             # Calculate new size based on direction and mouse movement
             delta = event.globalPosition() - self.last_mouse_pos
 
-            # Resize based on which edge/corner the user is dragging
-            new_rect = self.geometry()
+            # Resize based on which edge/corner the user is dragging, starting from where earlier events left it
+            new_rect = self.geometry_pacer.target_geometry()
+            width = new_rect.width()
+            height = new_rect.height()
 
             if self.is_resizing_left:
                 if width == self.MINIMUM_WINDOW_WIDTH:
@@ -1119,17 +1270,16 @@ class MainWindow(QMainWindow):
             if self.is_resizing_bottom:
                 new_rect.setBottom(int(new_rect.bottom() + delta.y()))
 
-            self.setGeometry(new_rect) # Resize the window
+            self.geometry_pacer.request_geometry(new_rect) # Applied with the next frame
 
             # Update the last mouse position
             self.last_mouse_pos = event.globalPosition()
 
             event.accept()
 
-            self.setUpdatesEnabled(True)  # Re-enable updates after resizing
-
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
+            self.geometry_pacer.flush()
             self.resizing = False
             self.is_resizing_left = False
             self.is_resizing_right = False
@@ -1144,6 +1294,8 @@ class MainWindow(QMainWindow):
         print(pos, index)
 
 if __name__ == "__main__":
+    register_monaco_scheme() # Custom schemes must be registered before the application is created
+
     app = QApplication(sys.argv)
     app.setStyle('windowsvista')
 
@@ -0,0 +1,123 @@
+"""Measures what hot exit journaling costs while typing.
+
+Synthetic keystrokes are delivered to a shadow document the way the Monaco page reports them, one change event
+at a time from a precise timer. Each keystroke is handled as EditorTab.on_content_changed handles it: the change is
+applied to the shadow document and, with the journal on, recorded for the journal. The time spent handling each
+keystroke and how late each keystroke timer fired (event loop latency, which is where a busy UI thread or a writer
+thread holding the GIL would show up) are reported with the journal off and on.
+
+Runs without a display or a Monaco page. Usage (from the repository root):
+    python benchmarks/journal_benchmark.py --lines 20000 --keystrokes 3000
+"""
+import os, sys, time, random, argparse, tempfile, statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt6.QtCore import Qt, QTimer, QCoreApplication
+
+from src.shadow_buffer import ShadowDocument
+from src.hot_exit import HotExitJournal, JOURNAL_SUFFIX
+
+KEYSTROKE_INTERVAL_MS = 8 # A fast typist, with key repeat
+
+class TypingTab:
+    """The parts of an EditorTab the journal looks at."""
+
+    def __init__(self, text):
+        self.document = ShadowDocument(text)
+        self.modified = True
+        self.disposed = False
+
+    def backup_header(self):
+        return {"path": "", "title": "benchmark", "encoding": "utf-8"}
+
+def sample_text(lines):
+    return "\n".join(f"    value_{i} = compute(value_{i - 1}, {i}) # Line {i}" for i in range(lines))
+
+def percentile(values, fraction):
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+def run(app, lines, keystrokes, journal_on):
+    directory = tempfile.mkdtemp(prefix="journal-benchmark-")
+    tab = TypingTab(sample_text(lines))
+    journal = HotExitJournal(directory) if journal_on else None
+    randomizer = random.Random(1)
+    handler_times, lateness = [], []
+    state = {"sent": 0, "line": lines // 2, "column": 5, "expected": None}
+
+    def keystroke():
+        now = time.perf_counter()
+
+        if state["expected"] is not None:
+            lateness.append(max(0.0, (now - state["expected"]) * 1000))
+
+        state["expected"] = now + KEYSTROKE_INTERVAL_MS / 1000
+
+        if state["sent"] % 40 == 39:
+            state["line"], state["column"] = randomizer.randrange(1, lines), 1 # Jump elsewhere, like a click
+
+        line, column = state["line"], state["column"]
+        changes = [[line, column, line, column, randomizer.choice("abcdefgh (),.")]]
+        state["column"] += 1
+
+        start = time.perf_counter()
+        tab.document.apply_changes(tab.document.version + 1, changes, "\n", False)
+
+        if journal is not None:
+            journal.record(tab, changes, "\n", False)
+
+        handler_times.append((time.perf_counter() - start) * 1_000_000)
+
+        state["sent"] += 1
+
+        if state["sent"] >= keystrokes:
+            typing.stop()
+            app.quit()
+
+    typing = QTimer()
+    typing.setTimerType(Qt.TimerType.PreciseTimer)
+    typing.timeout.connect(keystroke)
+    typing.start(KEYSTROKE_INTERVAL_MS)
+    app.exec()
+
+    result = {
+        "handler_p50_us": statistics.median(handler_times),
+        "handler_p99_us": percentile(handler_times, 0.99),
+        "handler_max_us": max(handler_times),
+        "lateness_p50_ms": statistics.median(lateness),
+        "lateness_p99_ms": percentile(lateness, 0.99),
+        "lateness_max_ms": max(lateness),
+    }
+
+    if journal is not None:
+        journal.close()
+        journal_files = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(JOURNAL_SUFFIX)]
+        result.update(records=journal.writer.records, compactions=journal.writer.compactions,
+                      journal_kb=sum(os.path.getsize(path) for path in journal_files) / 1024,
+                      document_kb=len(tab.document.get_text().encode("utf-8")) / 1024)
+
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=20000, help="Lines in the document being typed into")
+    parser.add_argument("--keystrokes", type=int, default=3000)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+
+    for journal_on in (False, True):
+        result = run(app, args.lines, args.keystrokes, journal_on)
+
+        print(f"journal {'on' if journal_on else 'off'}: handler p50 {result['handler_p50_us']:.1f} us, "
+              f"p99 {result['handler_p99_us']:.1f} us, max {result['handler_max_us']:.0f} us; "
+              f"event loop lateness p50 {result['lateness_p50_ms']:.2f} ms, p99 {result['lateness_p99_ms']:.2f} ms, "
+              f"max {result['lateness_max_ms']:.1f} ms")
+
+        if journal_on:
+            print(f"    {result['records']} records, {result['compactions']} compactions, journal "
+                  f"{result['journal_kb']:.0f} KB for a {result['document_kb']:.0f} KB document")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compares a cold pylint run, a fresh `python -m pylint` process per check as the editor used to do, with a check
+handed to the warm lint server.
+
+Each check lints the repository's own app.py. Cold runs are timed from spawning the process to its exit; warm runs
+from LintDaemon.lint to its finished signal, after one untimed job that starts the server and warms astroid up.
+
+Runs without a display. Usage (from the repository root):
+    python benchmarks/lint_benchmark.py --runs 5
+"""
+import os, sys, time, argparse, subprocess, statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt6.QtCore import QEventLoop, QCoreApplication
+
+from src.lint_daemon import LintDaemon
+
+def cold_run(file_path):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "pylint", file_path], capture_output=True, text=True, check=False)
+
+    return time.perf_counter() - start
+
+def warm_run(daemon, file_path):
+    loop = QEventLoop() # Not app.exec(), whose return emits aboutToQuit and so stops the server
+    state = {}
+
+    def on_finished(job_id, output):
+        if job_id == state["job"]:
+            state["output"] = output
+            loop.quit()
+
+    daemon.finished.connect(on_finished)
+    start = time.perf_counter()
+    state["job"] = daemon.lint(file_path)
+    loop.exec()
+    daemon.finished.disconnect(on_finished)
+
+    return time.perf_counter() - start, state["output"]
+
+def summary(times):
+    return f"median {statistics.median(times):.2f} s, min {min(times):.2f} s, max {max(times):.2f} s"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--file", default="app.py", help="File to lint, relative to the repository root")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    app = QCoreApplication(sys.argv) # Kept referenced for the event loops below
+    daemon = LintDaemon.instance()
+
+    cold = [cold_run(args.file) for _ in range(args.runs)]
+    print(f"cold spawn:  {summary(cold)}")
+
+    first, output = warm_run(daemon, args.file)
+    print(f"warm daemon: first job (server start) {first:.2f} s, {len(output.splitlines())} output lines")
+
+    warm = [warm_run(daemon, args.file)[0] for _ in range(args.runs)]
+    print(f"warm daemon: {summary(warm)}")
+    print(f"speedup {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+    daemon.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measures the Problems panel's model with workspace-sized numbers of diagnostics.
+
+Synthetic pylint-like diagnostics are spread over many files and loaded into the model file by file, the way lint
+results arrive. Then one file is updated with a single new diagnostic, as after an edit, and the severity filter,
+a text filter and the sort order are changed. Times and the rows inserted and removed are reported for each step.
+
+Runs without a display. Usage (from the repository root):
+    python benchmarks/problems_benchmark.py --files 1000 --per-file 100
+"""
+import os, sys, time, random, argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.diagnostics import Diagnostic, ERROR, WARNING, INFO, HINT
+from src.problems_view import ProblemsModel, SORT_BY_SEVERITY
+
+MESSAGES = [
+    (ERROR, "E0602", "undefined-variable", "Undefined variable 'value_{}'"),
+    (WARNING, "W0611", "unused-import", "Unused import module_{}"),
+    (WARNING, "W0612", "unused-variable", "Unused variable 'temp_{}'"),
+    (INFO, "C0301", "line-too-long", "Line too long ({}/100)"),
+    (INFO, "C0116", "missing-function-docstring", "Missing function or method docstring"),
+    (HINT, "R1705", "no-else-return", "Unnecessary \"else\" after \"return\""),
+]
+
+def file_diagnostics(randomizer, count, version=1):
+    diagnostics = []
+
+    for _ in range(count):
+        severity, message_id, symbol, message = randomizer.choice(MESSAGES)
+        line = randomizer.randrange(1, 5000)
+        diagnostics.append(Diagnostic(severity, sys.intern(message_id), sys.intern(symbol),
+                                      message.format(randomizer.randrange(1000)), line, 1, line, None, version))
+
+    return diagnostics
+
+def timed(label, model, step):
+    counts = {"inserted": 0, "removed": 0, "resets": 0}
+
+    def on_inserted(parent, first, last):
+        counts["inserted"] += last - first + 1
+
+    def on_removed(parent, first, last):
+        counts["removed"] += last - first + 1
+
+    def on_reset():
+        counts["resets"] += 1
+
+    model.rowsInserted.connect(on_inserted)
+    model.rowsRemoved.connect(on_removed)
+    model.modelReset.connect(on_reset)
+
+    start = time.perf_counter()
+    step()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    model.rowsInserted.disconnect(on_inserted)
+    model.rowsRemoved.disconnect(on_removed)
+    model.modelReset.disconnect(on_reset)
+
+    print(f"{label:<32} {elapsed:9.1f} ms  {model.shown_count:>7} rows shown, {counts['inserted']} inserted, "
+          f"{counts['removed']} removed, {counts['resets']} resets")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--per-file", type=int, default=100)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv) # Kept referenced for the model's signals
+    randomizer = random.Random(1)
+    model = ProblemsModel()
+    batches = [file_diagnostics(randomizer, args.per_file) for _ in range(args.files)]
+
+    def load():
+        for number, diagnostics in enumerate(batches):
+            model.set_file_problems(number, f"module_{number}.py", f"/workspace/module_{number}.py", diagnostics)
+
+    def edit():
+        line = max(diagnostic.line for diagnostic in batches[0]) + 1
+        diagnostics = batches[0] + [Diagnostic(ERROR, "E0602", "undefined-variable", "Undefined variable 'typo'",
+                                               line, 5, line, 9, 2)]
+        model.set_file_problems(0, "module_0.py", "/workspace/module_0.py", diagnostics)
+
+    timed(f"load {args.files} x {args.per_file} diagnostics", model, load)
+    timed("one file gains a diagnostic", model, edit)
+    timed("errors and warnings only", model, lambda: model.set_severity_mask(ERROR | WARNING))
+    timed("text filter 'unused'", model, lambda: model.set_filter_text("unused"))
+    timed("sort by severity", model, lambda: model.set_sort_mode(SORT_BY_SEVERITY))
+    timed("clear filters", model, lambda: (model.set_filter_text(""), model.set_severity_mask(ERROR | WARNING | INFO | HINT)))
+    timed("close one file", model, lambda: model.remove_file(1))
+    print(f"{model.errors} errors, {model.warnings} warnings in total")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Replays a synthetic window resize drag and reports how many display frames were dropped.
+
+A mouse move is sent to the window every millisecond, the way a high polling rate mouse delivers them, while a
+frame clock ticks at the screen's refresh rate. Whenever the event loop is busy applying geometry, frame ticks
+come late; every whole frame interval a tick is late by counts as a dropped frame.
+
+The system resize is switched off so the window's own frame-paced fallback is measured. --mode unpaced applies
+every move right away, as the window did before, for comparison.
+
+Usage (from the repository root):
+    python benchmarks/resize_benchmark.py --mode both --tabs 4
+"""
+import os, sys, json, argparse, subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DRAG_MS = 3000
+MOVE_INTERVAL_MS = 1
+DRAG_PIXELS_PER_MOVE = 1
+SETTLE_MS = 3000 # Lets the editors load before the drag starts
+
+def run_child(mode, tabs):
+    os.chdir(ROOT) # The window reads its configuration relative to the repository root
+
+    import time
+
+    from PyQt6.QtCore import Qt, QTimer, QPointF, QEvent
+    from PyQt6.QtGui import QMouseEvent
+    from PyQt6.QtWidgets import QApplication
+
+    from src.monaco_scheme import register_monaco_scheme
+
+    register_monaco_scheme()
+    app = QApplication(sys.argv)
+
+    from app import MainWindow
+
+    window = MainWindow()
+    window.use_system_geometry = False
+    window.geometry_pacer.paced = mode == "paced"
+    window.resize(1000, 700)
+    window.show()
+
+    for _ in range(tabs):
+        window.create_new_tab()
+
+    frame_interval_ms = window.geometry_pacer.frame_interval_ms()
+    frame_times = []
+    moves = {"sent": 0}
+
+    frame_clock = QTimer()
+    frame_clock.setTimerType(Qt.TimerType.PreciseTimer)
+    frame_clock.timeout.connect(lambda: frame_times.append(time.perf_counter()))
+
+    cursor = {}
+
+    def send_mouse(event_type, button_state):
+        button = Qt.MouseButton.LeftButton if event_type != QEvent.Type.MouseMove else Qt.MouseButton.NoButton
+        global_position = cursor["position"]
+        local = QPointF(window.mapFromGlobal(global_position.toPoint()))
+        event = QMouseEvent(event_type, local, global_position, button, button_state, Qt.KeyboardModifier.NoModifier)
+        QApplication.sendEvent(window, event)
+
+    def move():
+        # Dragging the bottom-right corner outwards, so every move grows the window
+        cursor["position"] += QPointF(DRAG_PIXELS_PER_MOVE, DRAG_PIXELS_PER_MOVE)
+        send_mouse(QEvent.Type.MouseMove, Qt.MouseButton.LeftButton)
+        moves["sent"] += 1
+
+    mover = QTimer()
+    mover.setTimerType(Qt.TimerType.PreciseTimer)
+    mover.timeout.connect(move)
+
+    def start_drag():
+        cursor["position"] = QPointF(window.mapToGlobal(window.rect().bottomRight()))
+        send_mouse(QEvent.Type.MouseButtonPress, Qt.MouseButton.LeftButton)
+        frame_clock.start(frame_interval_ms)
+        mover.start(MOVE_INTERVAL_MS)
+        QTimer.singleShot(DRAG_MS, stop_drag)
+
+    def stop_drag():
+        mover.stop()
+        frame_clock.stop()
+        send_mouse(QEvent.Type.MouseButtonRelease, Qt.MouseButton.NoButton)
+
+        gaps = [(later - earlier) * 1000 for earlier, later in zip(frame_times, frame_times[1:])]
+        dropped = sum(max(0, int(gap // frame_interval_ms) - 1) for gap in gaps)
+
+        print(json.dumps({
+            "frames": len(frame_times),
+            "expected_frames": DRAG_MS // frame_interval_ms,
+            "dropped_frames": dropped,
+            "worst_frame_ms": max(gaps, default=0),
+            "moves": moves["sent"],
+            "geometry_updates": window.geometry_pacer.applied,
+        }))
+        app.quit()
+
+    QTimer.singleShot(SETTLE_MS, start_drag)
+    app.exec()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["paced", "unpaced", "both"], default="both")
+    parser.add_argument("--tabs", type=int, default=4, help="Editor tabs open during the drag")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.mode, args.tabs)
+
+        return
+
+    for mode in (["unpaced", "paced"] if args.mode == "both" else [args.mode]):
+        output = subprocess.run([sys.executable, __file__, "--child", "--mode", mode, "--tabs", str(args.tabs)],
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        print(f"{mode}: {result['dropped_frames']} dropped of {result['expected_frames']} frames "
+              f"(worst {result['worst_frame_ms']:.0f} ms), {result['geometry_updates']} geometry updates "
+              f"for {result['moves']} mouse moves")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Measures first-editor-ready time: how long a fresh MonacoEditor takes from construction until Monaco reports ready.
+
+Every run happens in a new process. --source both (the default) measures Monaco from cdnjs, as the editor loaded
+it before the vsclone:// archive, and then from the archive, and reports the speedup; the archive must be packed.
+
+The editor profile lives in a scratch directory: with --cache cold it is wiped before every run, with --cache warm
+it is filled once by an unmeasured run and then reused, which is what a relaunch of the editor sees. --cache both
+reports the two side by side and the speedup. Chromium only keeps V8 code caches for http(s) scripts, so the warm
+cache helps the cdn source; the local archive is compiled afresh on every start either way.
+
+Usage (from the repository root):
+    python benchmarks/startup_benchmark.py --runs 5
+    python benchmarks/startup_benchmark.py --source cdn --runs 5 --cache both
+"""
+import os, sys, json, shutil, argparse, tempfile, statistics, subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monaco_scheme import is_local_monaco_available
+
+TIMEOUT_MS = 60000
+
+def run_child(source, profile_dir):
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    import src.monaco_editor as monaco_editor
+    import src.editor_profile as editor_profile
+    from src.monaco_scheme import register_monaco_scheme, MONACO_CDN_URL, MONACO_LOCAL_URL
+
+    if source == "local" and monaco_editor.monaco_base_url() != MONACO_LOCAL_URL:
+        sys.exit("The Monaco archive is missing. Pack it first with: python -m src.monaco_scheme <package dir>")
+
+    monaco_editor.monaco_base_url = lambda: MONACO_LOCAL_URL if source == "local" else MONACO_CDN_URL
+    editor_profile.profile_storage_path = lambda: profile_dir
+
+    register_monaco_scheme()
+    app = QApplication(sys.argv)
+
+    editor = monaco_editor.MonacoEditor(None)
+    editor.resize(800, 600)
+    editor.show()
+
+    def poll():
+        if editor.ready_time is not None:
+            print(json.dumps({"ready_ms": editor.ready_time * 1000}))
+            app.quit()
+        else:
+            QTimer.singleShot(5, poll)
+
+    QTimer.singleShot(0, poll)
+    QTimer.singleShot(TIMEOUT_MS, lambda: (print(json.dumps({"ready_ms": None})), app.quit()))
+    app.exec()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=["cdn", "local", "both"], default="both")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cache", choices=["cold", "warm", "both"], default="cold")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--profile-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.source, args.profile_dir)
+
+        return
+
+    if args.source != "cdn" and not is_local_monaco_available():
+        parser.error("the Monaco archive is missing; pack it first with: python -m src.monaco_scheme <package dir>")
+
+    medians = {}
+
+    for source in (["cdn", "local"] if args.source == "both" else [args.source]):
+        for cache in (["cold", "warm"] if args.cache == "both" else [args.cache]):
+            median = run_series(source, cache, args.runs)
+
+            if median is not None:
+                medians[source, cache] = median
+
+    for cache in ("cold", "warm"):
+        if ("cdn", cache) in medians and ("local", cache) in medians:
+            print(f"{cache} cache: local archive {medians['cdn', cache] / medians['local', cache]:.1f}x faster than cdn")
+
+    for source in ("cdn", "local"):
+        if (source, "cold") in medians and (source, "warm") in medians:
+            print(f"{source}: warm cache {medians[source, 'cold'] / medians[source, 'warm']:.1f}x faster than cold")
+
+def run_series(source, cache, runs):
+    """Measures runs editor starts and prints them; returns the median ready time in ms, or None."""
+    profile_dir = tempfile.mkdtemp(prefix="monaco-profile-")
+    results = []
+
+    try:
+        if cache == "warm":
+            measure(source, profile_dir) # Fills the cache; not counted
+
+        for run in range(runs):
+            if cache == "cold":
+                shutil.rmtree(profile_dir, ignore_errors=True)
+
+            ready_ms = measure(source, profile_dir)
+
+            print(f"{source}, {cache} run {run + 1}: {'timed out' if ready_ms is None else f'{ready_ms:.0f} ms'}")
+
+            if ready_ms is not None:
+                results.append(ready_ms)
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    if not results:
+        return None
+
+    print(f"{source}, {cache} cache: median {statistics.median(results):.0f} ms, "
+          f"min {min(results):.0f} ms, max {max(results):.0f} ms over {len(results)} runs")
+
+    return statistics.median(results)
+
+def measure(source, profile_dir):
+    """Starts one editor in a new process and returns its ready time in ms, or None if it timed out."""
+    output = subprocess.run([sys.executable, __file__, "--child", "--source", source, "--profile-dir", profile_dir],
+                            capture_output=True, text=True, check=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])["ready_ms"]
+
+if __name__ == "__main__":
+    main()
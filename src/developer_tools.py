@@ -2,18 +2,70 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QAbstractItemView, QLa
 from PyQt6.QtCore import QEvent, QObject, Qt
 from PyQt6.QtGui import QFont
 
+from src.monaco_editor import MonacoEditor
+
 class DeveloperToolsPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
         layout = QVBoxLayout(self)
 
+        # Label to display editor pool statistics
+        self.editor_pool_label = QLabel("Editor Pool: N/A", self)
+        layout.addWidget(self.editor_pool_label)
+
+        # Label to display lint cache statistics
+        self.lint_cache_label = QLabel("Lint Cache: N/A", self)
+        layout.addWidget(self.lint_cache_label)
+
+        # Label to display file save statistics
+        self.file_saver_label = QLabel("File Saves: N/A", self)
+        layout.addWidget(self.file_saver_label)
+
         # Label to display widget info
         self.info_label = QLabel("Hover over a widget to inspect it", self)
         layout.addWidget(self.info_label)
 
         self.setLayout(layout)
 
+    def set_editor_pool(self, editor_pool):
+        """Shows the given pool's hit/miss statistics and keeps them up to date."""
+        self.editor_pool = editor_pool
+        self.editor_pool.stats_changed.connect(self.update_editor_pool_info)
+        self.update_editor_pool_info()
+
+    def update_editor_pool_info(self):
+        pool = self.editor_pool
+        self.editor_pool_label.setText(
+            f"Editor Pool: {pool.warm_count}/{pool.size} warm, {pool.hits} hits, {pool.misses} misses "
+            f"({pool.hit_rate:.0%} hit rate)"
+        )
+
+    def set_lint_cache(self, lint_cache):
+        """Shows the lint cache's hit rate and disk usage and keeps them up to date."""
+        self.lint_cache = lint_cache
+        self.lint_cache.stats_changed.connect(self.update_lint_cache_info)
+        self.update_lint_cache_info()
+
+    def update_lint_cache_info(self):
+        cache = self.lint_cache
+        self.lint_cache_label.setText(
+            f"Lint Cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate:.0%} hit rate), "
+            f"{len(cache.memory)} in memory, {cache.disk_bytes / 1024:.0f} KB on disk"
+        )
+
+    def set_file_saver(self, file_saver):
+        """Shows how many writes the save service ran and how many saves it coalesced, and keeps them up to date."""
+        self.file_saver = file_saver
+        self.file_saver.stats_changed.connect(self.update_file_saver_info)
+        self.update_file_saver_info()
+
+    def update_file_saver_info(self):
+        saver = self.file_saver
+        self.file_saver_label.setText(
+            f"File Saves: {saver.writes} writes, {saver.coalesced} coalesced, {len(saver.requests)} in flight"
+        )
+
     def update_widget_info(self, widget):
         """Update the panel with detailed widget information when hovered."""
         if not self.hasFocus():
@@ -74,6 +126,11 @@ class DeveloperToolsPanel(QWidget):
         if isinstance(widget, QAbstractItemView):
             widget_info += f"Selection Model: {widget.selectionModel()}\n"
 
+        # Script batching of a Monaco page (the hovered widget is usually the view's render child)
+        editor = widget if isinstance(widget, MonacoEditor) else widget.parentWidget()
+        if isinstance(editor, MonacoEditor):
+            widget_info += f"Monaco Scripts: {editor.scripts_issued} issued for {editor.ops_submitted} operations\n"
+
         # Dynamic Properties
         dynamic_properties = widget.dynamicPropertyNames()
         if dynamic_properties:
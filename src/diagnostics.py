@@ -0,0 +1,80 @@
+import sys, json
+
+# Monaco's MarkerSeverity values, so diagnostics go to the page as they are
+HINT = 1
+INFO = 2
+WARNING = 4
+ERROR = 8
+
+PYLINT_SEVERITIES = {
+    "fatal": ERROR,
+    "error": ERROR,
+    "warning": WARNING,
+    "convention": INFO,
+    "refactor": HINT,
+    "info": INFO,
+}
+
+SEVERITY_NAMES = {ERROR: "Error", WARNING: "Warning", INFO: "Info", HINT: "Hint"}
+
+class Diagnostic:
+    """One problem pylint reported in a document version. Positions are 1-based, in Monaco's terms; end_column is
+    None when pylint gave no end, meaning the end of end_line."""
+
+    __slots__ = ("severity", "message_id", "symbol", "message", "line", "column", "end_line", "end_column", "version")
+
+    def __init__(self, severity, message_id, symbol, message, line, column, end_line, end_column, version):
+        self.severity = severity
+        self.message_id = message_id # E.g. "E0602"; interned, as a few ids cover most diagnostics
+        self.symbol = symbol # E.g. "undefined-variable"; interned too
+        self.message = message
+        self.line = line
+        self.column = column
+        self.end_line = end_line
+        self.end_column = end_column
+        self.version = version # Document version the diagnostic was computed for
+
+    @property
+    def severity_name(self):
+        return SEVERITY_NAMES[self.severity]
+
+    def marker(self):
+        """The compact form setModelMarkers takes on the page."""
+        return [self.severity, self.line, self.column, self.end_line, self.end_column, self.message,
+                f"{self.message_id} ({self.symbol})"]
+
+def parse_pylint_json(output, version):
+    """Diagnostics from the output of pylint's JSON reporter, in pylint's order."""
+    diagnostics = []
+
+    for message in json.loads(output or "[]"):
+        line = message["line"] or 1 # Module-level messages may come without a position
+        column = (message["column"] or 0) + 1
+        end_line = message.get("endLine") or line
+        end_column = message.get("endColumn")
+
+        diagnostics.append(Diagnostic(
+            PYLINT_SEVERITIES.get(message["type"], INFO),
+            sys.intern(message["message-id"]),
+            sys.intern(message["symbol"]),
+            message["message"],
+            line,
+            column,
+            end_line,
+            end_column + 1 if end_column is not None else None,
+            version,
+        ))
+
+    return diagnostics
+
+def count_severities(diagnostics):
+    """(errors, warnings) among diagnostics."""
+    errors = warnings = 0
+
+    for diagnostic in diagnostics:
+        if diagnostic.severity == ERROR:
+            errors += 1
+        elif diagnostic.severity == WARNING:
+            warnings += 1
+
+    return errors, warnings
@@ -0,0 +1,49 @@
+import hashlib
+
+def content_digest(text):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+class DirtyTracker:
+    """Knows whether a document differs from what was last loaded from or saved to disk.
+
+    Monaco's alternative version id returns to the same value when edits are undone, so being back at the saved
+    version is recognised without looking at the text. Anything else, e.g. retyping a deleted character, is settled
+    by comparing a blake2 digest of the shadow document with the one taken when the file was saved.
+    """
+
+    __slots__ = ("saved_digest", "saved_length", "saved_alternative_version")
+
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text, alternative_version=None):
+        """Takes text as the content on disk, e.g. after the file was loaded."""
+        self.mark_saved(content_digest(text), len(text), alternative_version)
+
+    def mark_saved(self, digest, length, alternative_version):
+        self.saved_digest = digest
+        self.saved_length = length
+        self.saved_alternative_version = alternative_version
+
+    def forget_alternative_version(self):
+        """Version ids start over when the model is rebuilt, so only the digest can be trusted afterwards."""
+        self.saved_alternative_version = None
+
+    def is_saved_version(self, alternative_version):
+        return alternative_version is not None and alternative_version == self.saved_alternative_version
+
+    def differs(self, text, alternative_version):
+        """Compares text with the saved content. When they match, alternative_version becomes the saved version, so
+        coming back to it later needs no digest."""
+        if self.is_saved_version(alternative_version):
+            return False
+
+        if len(text) != self.saved_length:
+            return True
+
+        if content_digest(text) != self.saved_digest:
+            return True
+
+        self.saved_alternative_version = alternative_version
+
+        return False
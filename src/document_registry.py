@@ -0,0 +1,121 @@
+import os
+
+class DocumentHandle:
+    """An open document. The same handle stays valid for as long as the document is open, across Save As."""
+
+    __slots__ = ("widget", "file_path", "key", "file_id")
+
+    def __init__(self, widget, file_path):
+        self.widget = widget # EditorTab or LogViewer showing the document
+        self.file_path = file_path # As given when opened, for display; empty for untitled documents
+        self.key = None # Canonical path
+        self.file_id = None # (device, inode), once known
+
+    @property
+    def is_untitled(self):
+        return not self.file_path
+
+class DocumentRegistry:
+    """Every open document of a window, indexed by tab widget, by canonical path and by (device, inode), so finding
+    the tab of a file costs the same with three tabs as with three hundred."""
+
+    def __init__(self):
+        self.by_widget = {}
+        self.by_key = {}
+        self.by_file_id = {} # Catches hard links and other spellings of a path that canonicalising misses
+
+    @staticmethod
+    def path_key(file_path):
+        return os.path.normcase(os.path.realpath(file_path))
+
+    @staticmethod
+    def stat_file_id(stat):
+        return (stat.st_dev, stat.st_ino) if stat is not None and stat.st_ino else None
+
+    def register(self, widget, file_path=None):
+        handle = DocumentHandle(widget, file_path or "")
+        self.by_widget[widget] = handle
+        self._index(handle)
+
+        return handle
+
+    def unregister(self, widget):
+        handle = self.by_widget.pop(widget, None)
+
+        if handle is not None:
+            self._unindex(handle)
+
+        return handle
+
+    def rename(self, widget, file_path):
+        """Points a document at a new path, e.g. after Save As."""
+        handle = self.by_widget.get(widget)
+
+        if handle is None:
+            return self.register(widget, file_path)
+
+        self._unindex(handle)
+        handle.file_path = file_path
+        handle.file_id = None
+        self._index(handle)
+
+        return handle
+
+    def update_file_id(self, widget, stat):
+        """Records the (device, inode) of a document's file from a stat taken anyway, e.g. when it was loaded or
+        saved. Atomic saves replace the inode, so this is repeated after every save."""
+        handle = self.by_widget.get(widget)
+        file_id = self.stat_file_id(stat)
+
+        if handle is None or file_id == handle.file_id:
+            return
+
+        if handle.file_id is not None and self.by_file_id.get(handle.file_id) is handle:
+            del self.by_file_id[handle.file_id]
+
+        handle.file_id = file_id
+
+        if file_id is not None:
+            self.by_file_id[file_id] = handle
+
+    def handle_for(self, widget):
+        return self.by_widget.get(widget)
+
+    def file_path(self, widget):
+        handle = self.by_widget.get(widget)
+
+        return handle.file_path if handle is not None else None
+
+    def find(self, file_path):
+        """The handle of the document showing file_path, if it is open."""
+        handle = self.by_key.get(self.path_key(file_path))
+
+        if handle is not None or not self.by_file_id:
+            return handle
+
+        try:
+            return self.by_file_id.get(self.stat_file_id(os.stat(file_path)))
+        except OSError:
+            return None
+
+    def handles(self):
+        return self.by_widget.values()
+
+    def __len__(self):
+        return len(self.by_widget)
+
+    def _index(self, handle):
+        if handle.is_untitled:
+            handle.key = None
+
+            return
+
+        handle.key = self.path_key(handle.file_path)
+        self.by_key[handle.key] = handle
+
+    def _unindex(self, handle):
+        if handle.key is not None and self.by_key.get(handle.key) is handle:
+            del self.by_key[handle.key]
+
+        if handle.file_id is not None and self.by_file_id.get(handle.file_id) is handle:
+            del self.by_file_id[handle.file_id]
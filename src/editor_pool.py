@@ -0,0 +1,92 @@
+import logging
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from src.monaco_editor import MonacoEditor
+
+REFILL_DELAY_MS = 500 # Leave the event loop alone for a moment after a hand-out before warming the next editor
+
+class MonacoEditorPool(QObject):
+    """Keeps a few MonacoEditor pages loaded in the background so new tabs and windows get one that is already ready."""
+
+    stats_changed = pyqtSignal()
+
+    _instance = None
+
+    def __init__(self, size=2, parent=None):
+        super().__init__(parent)
+
+        self.size = size
+        self.editors = [] # Idle editors, warm or still loading, oldest first
+        self.hits = 0
+        self.misses = 0
+
+        self.schedule_refill(0)
+
+    @classmethod
+    def instance(cls, size=2):
+        """Returns the application-wide pool shared by every window."""
+        if cls._instance is None:
+            cls._instance = cls(size)
+
+        return cls._instance
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    @property
+    def warm_count(self):
+        return sum(1 for editor in self.editors if editor.monaco_ready)
+
+    def acquire(self, parent):
+        """Hands out a ready editor if there is one, otherwise the furthest-along or a brand new one."""
+        warm_editors = [editor for editor in self.editors if editor.monaco_ready]
+
+        if warm_editors:
+            editor = warm_editors[0]
+            self.hits += 1
+        else:
+            editor = self.editors[0] if self.editors else MonacoEditor(None)
+            self.misses += 1
+            logging.debug("Editor pool miss. Handing out an editor that is still loading.")
+
+        if editor in self.editors:
+            self.editors.remove(editor)
+
+        editor.setParent(parent)
+
+        self.stats_changed.emit()
+        self.schedule_refill()
+
+        return editor
+
+    def release(self, editor):
+        """Takes back an editor whose tab closed, or destroys it if the pool is already full."""
+        if len(self.editors) >= self.size or editor.models or not editor.monaco_ready:
+            editor.deleteLater()
+
+            return
+
+        editor.hide()
+        editor.setParent(None)
+        self.editors.append(editor)
+        self.stats_changed.emit()
+
+    def schedule_refill(self, delay=REFILL_DELAY_MS):
+        QTimer.singleShot(delay, self.refill)
+
+    def refill(self):
+        """Starts warming one editor; the next one is started once it reports ready."""
+        if len(self.editors) >= self.size or any(not editor.monaco_ready for editor in self.editors):
+            return
+
+        editor = MonacoEditor(None)
+        editor.ready.connect(self.on_editor_ready)
+        self.editors.append(editor)
+
+    def on_editor_ready(self):
+        self.stats_changed.emit()
+        self.schedule_refill()
@@ -0,0 +1,64 @@
+import os, logging
+
+from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
+
+from src.monaco_scheme import install_monaco_scheme_handler
+
+PROFILE_NAME = "MonacoEditor"
+APPLICATION_DIR = "VSCodeClone"
+
+_profile = None
+_started_warm = False
+
+def profile_storage_path():
+    """Directory holding the profile's HTTP cache, code cache and local storage across launches."""
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+
+    return os.path.join(cache_root, APPLICATION_DIR, PROFILE_NAME)
+
+def is_cache_filled():
+    """True when an earlier launch has already filled the on-disk cache, so Monaco's scripts will not be fetched
+    and compiled from scratch."""
+    cache_path = os.path.join(profile_storage_path(), "cache")
+
+    return os.path.isdir(cache_path) and any(os.scandir(cache_path))
+
+def editor_profile(http_cache_mb=256):
+    """Returns the profile every Monaco page uses, creating it on first use.
+
+    Unlike the default profile it is named, so Chromium keeps its disk HTTP cache between launches. Chromium
+    stores the V8 code cache next to cached scripts, so a warm start skips both the download and the compile.
+    The profile is parented to the application and therefore outlives every window and page.
+    """
+    global _profile, _started_warm
+
+    if _profile is not None:
+        return _profile
+
+    storage_path = profile_storage_path()
+    _started_warm = is_cache_filled()
+
+    _profile = QWebEngineProfile(PROFILE_NAME, QApplication.instance())
+    _profile.setPersistentStoragePath(storage_path)
+    _profile.setCachePath(os.path.join(storage_path, "cache"))
+    _profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+    _profile.setHttpCacheMaximumSize(http_cache_mb * 1024 * 1024)
+    _profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies)
+
+    settings = _profile.settings()
+    settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
+    settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
+    settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
+    settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
+
+    install_monaco_scheme_handler(_profile)
+
+    logging.info(f"Editor profile at '{storage_path}' ({boot_kind()} cache, {http_cache_mb} MB limit).")
+
+    return _profile
+
+def boot_kind():
+    """Returns "warm" if this launch started from a cache filled by an earlier one, "cold" otherwise."""
+    return "warm" if _started_warm else "cold"
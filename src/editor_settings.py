@@ -0,0 +1,32 @@
+import os, json, logging
+
+DEFAULT_EDITOR_SETTINGS = {
+    "shared_host": True, # Host every tab's model in one long-lived Monaco page
+    "pool_size": 2, # Monaco pages kept loaded in the background for new tabs and windows
+    "large_file_threshold_mb": 20, # Files at least this big open in large-file mode
+    "stream_chunk_kb": 1024, # Size of the chunks files are streamed into the editor in
+    "log_viewer_threshold_mb": 512, # Files at least this big open read-only in the memory-mapped log viewer
+    "hibernate_after_minutes": 30, # Background tabs idle this long give up their Monaco model
+    "memory_budget_mb": 1024, # Above this, the least recently used background tab is hibernated too
+    "http_cache_mb": 256, # On-disk cache of the editor profile, which also holds the compiled Monaco scripts
+    "hot_exit": True, # Keep unsaved changes in backups across quitting and crashes instead of prompting
+    "lint_delay_ms": 750, # Typing pause after which a Python document is linted
+    "lint_cache_mb": 32, # On-disk cache of lint results, so unchanged code is not linted again across launches
+}
+
+def load_editor_settings(config_file="configuration/config.json"):
+    """Load the "editor" section of the configuration file, falling back to the defaults."""
+    settings = dict(DEFAULT_EDITOR_SETTINGS)
+
+    if not os.path.exists(config_file):
+        logging.warning(f"Config file '{config_file}' not found. Using default editor settings.")
+
+        return settings
+
+    try:
+        with open(config_file, 'r') as file:
+            settings.update(json.load(file).get("editor", {}))
+    except (OSError, json.JSONDecodeError) as e:
+        logging.error(f"Failed to load editor settings from '{config_file}': {e}.")
+
+    return settings
@@ -0,0 +1,675 @@
+import os, json, time, itertools, logging
+
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QProgressBar
+
+from src.monaco_editor import MonacoEditor, model_language
+from src.shadow_buffer import ShadowDocument
+from src.file_streamer import ChunkedFileReader
+from src.file_loader import FileLoadService
+from src.file_saver import FileSaveService
+from src.file_watcher import FileWatchService
+from src.outline_index import OutlineIndexer
+from src.dirty_tracker import DirtyTracker, content_digest
+
+OUTLINE_DELAY_MS = 300 # Typing pause after which the outline is rebuilt
+DIRTY_CHECK_DELAY_MS = 300 # Typing pause after which the content is compared with the saved one
+
+class EditorTab(QWidget):
+    """A tab page for one document. The document lives as a model inside a MonacoEditor page, which is either
+    owned by this tab or shared by all tabs of the window and moved into whichever tab is current."""
+
+    cursor_position_changed = pyqtSignal(int, int) # Line, column
+    content_changed = pyqtSignal(int) # Model version id
+    modification_changed = pyqtSignal(bool)
+    hibernation_changed = pyqtSignal(bool)
+    file_loaded = pyqtSignal()
+    file_saved = pyqtSignal()
+    save_failed = pyqtSignal(str) # Error message
+    changed_on_disk = pyqtSignal() # The file changed while the tab had unsaved changes; see disk_change
+    outline_changed = pyqtSignal()
+
+    _untitled_ids = itertools.count(1)
+
+    def __init__(self, parent, file_path=None, shared_editor=None, editor_pool=None, lazy=False, cursor_position=None,
+                 journal=None):
+        super().__init__(parent)
+
+        self.setObjectName("EditorTab")
+
+        self.file_path = file_path or ""
+        self.model_id = self.create_model_id(self.file_path)
+        self.is_shared = shared_editor is not None
+        self.shared_editor = shared_editor
+        self.editor_pool = editor_pool
+        self.editor = None
+        self.materialized = False # Restored tabs stay placeholders until they are first shown
+        self.disposed = False
+        self.pending_load = None # load_file arguments of a placeholder
+        self.restore_cursor = cursor_position # Cursor from the last session, applied once the file is in
+        self.modified = False
+        self.dirty_tracker = DirtyTracker()
+        self.alternative_version = None # Monaco alternative version id of the model, None until it reports one
+        self.saves_in_flight = {} # Document version -> (digest, length, alternative version) of the text being saved
+        self.journal = journal # HotExitJournal backing up unsaved changes, if hot exit is enabled
+        self.pending_backup = None # Recovered text to show once the file is loaded
+        self.watcher = None # FileWatchService, once the file is watched
+        self.watched_path = None
+        self.disk_change = None # DiskChange waiting for the user to decide about it
+        self.settle_next_change = False # The next change event is a reload, which is checked right away
+        self.cursor_position = cursor_position or (1, 1)
+        self.document = ShadowDocument() # Local copy of the model, so reads never cross into the page
+        self.large_file = False
+        self.loader = None
+        self.load_future = None # Pending FileLoadService request
+        self.reader = None # Streams large files in once the service has looked at them
+        self.chunk_size = 0
+        self.encoding = "utf-8"
+        self.file_info = None # FileInfo sniffed when the file was loaded
+        self.saver = None # FileSaveService, while a save of this tab is in flight
+        self.file_stat = None # os.stat_result of the file as it was loaded
+        self.last_active = time.monotonic()
+        self.hibernation_state = "active" # "active", "hibernating" (snapshot requested) or "hibernated"
+        self.snapshot = None
+        self.reclaimed_bytes = 0
+        self.outline = None # OutlineIndex of the latest version indexed so far
+        self.breadcrumb_scope = []
+        self.diagnostics = [] # Diagnostics of the latest version linted
+        self.outline_indexer = OutlineIndexer.instance() if model_language(self.file_path) == "python" else None
+
+        self.outline_timer = QTimer(self)
+        self.outline_timer.setSingleShot(True)
+        self.outline_timer.setInterval(OUTLINE_DELAY_MS)
+        self.outline_timer.timeout.connect(self.request_outline)
+
+        self.dirty_timer = QTimer(self)
+        self.dirty_timer.setSingleShot(True)
+        self.dirty_timer.setInterval(DIRTY_CHECK_DELAY_MS)
+        self.dirty_timer.timeout.connect(self.verify_modified)
+
+        if self.outline_indexer is not None:
+            self.outline_indexer.outline_ready.connect(self.on_outline_ready)
+
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+
+        # Thin bar shown while a file is being streamed in
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setObjectName("LoadProgress")
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(2)
+        self.progress_bar.hide()
+        self.main_layout.addWidget(self.progress_bar)
+
+        if not lazy:
+            self.materialize()
+
+    def materialize(self):
+        """Builds the tab's model, and its page when it owns one, then loads the file of a restored tab."""
+        if self.materialized:
+            return
+
+        self.materialized = True
+
+        if self.is_shared:
+            self.editor = self.shared_editor
+        elif self.editor_pool is not None:
+            self.editor = self.editor_pool.acquire(self) # Usually already loaded, so content lands in the same turn
+        else:
+            self.editor = MonacoEditor(self)
+
+        if not self.is_shared:
+            self.main_layout.addWidget(self.editor)
+            self.editor.show() # Pooled editors come back explicitly hidden
+
+        self.editor.bridge.content_changed.connect(self.on_content_changed)
+        self.editor.bridge.cursor_changed.connect(self.on_cursor_changed)
+        self.editor.bridge.chunk_appended.connect(self.on_chunk_appended)
+
+        self.editor.open_model(self.model_id, file_path=self.file_path)
+
+        if not self.is_shared:
+            self.editor.activate_model(self.model_id)
+
+        if self.pending_load is not None:
+            self.load_file(*self.pending_load)
+            self.pending_load = None
+
+    @classmethod
+    def create_model_id(cls, file_path):
+        """Builds the Monaco model URI used to address this tab's document inside the page."""
+        if file_path:
+            return "file:///" + os.path.abspath(file_path).replace("\\", "/").lstrip("/")
+
+        return f"untitled:Untitled-{next(cls._untitled_ids)}"
+
+    def attach(self):
+        """Moves the shared editor into this tab and swaps its document in, restoring the saved view state."""
+        self.materialize()
+        self.last_active = time.monotonic()
+
+        if self.hibernation_state == "hibernating":
+            self.hibernation_state = "active" # Activated before the snapshot came back; keep the model
+        elif self.hibernation_state == "hibernated":
+            self.restore()
+
+        if self.is_shared and self.editor.parentWidget() is not self:
+            self.main_layout.addWidget(self.editor)
+            self.editor.show()
+
+        self.editor.activate_model(self.model_id)
+
+    @property
+    def is_hibernated(self):
+        return self.hibernation_state == "hibernated"
+
+    def hibernate(self):
+        """Frees the page-side model of an idle tab. The text stays in the shadow document, and the
+        view state and breakpoints are snapshotted first so restore() can rebuild it."""
+        if not self.materialized or self.hibernation_state != "active" or self.is_loading:
+            return
+
+        self.hibernation_state = "hibernating"
+        self.editor.snapshot_model(self.model_id, self.on_snapshot_taken)
+
+    def on_snapshot_taken(self, snapshot):
+        if self.hibernation_state != "hibernating":
+            return
+
+        self.snapshot = json.loads(snapshot) if snapshot else {"viewState": None, "breakpoints": []}
+
+        if self.is_shared:
+            self.reclaimed_bytes = 2 * len(self.document.get_text()) # JS strings are UTF-16
+            self.editor.close_model(self.model_id)
+        else:
+            self.reclaimed_bytes = self.editor.renderer_memory()
+            self.editor.close_model(self.model_id)
+            self.editor.discard()
+
+        self.hibernation_state = "hibernated"
+        self.hibernation_changed.emit(True)
+
+        logging.debug(f"Hibernated {self.model_id}, reclaiming about {self.reclaimed_bytes // 1024} KB.")
+
+    def restore(self):
+        """Rebuilds the model from the shadow document and the snapshot."""
+        if not self.is_shared:
+            self.editor.wake()
+
+        self.editor.open_model(self.model_id, file_path=self.file_path)
+
+        # The new model counts its versions from scratch
+        self.document.version = 0
+        self.alternative_version = None
+        self.dirty_tracker.forget_alternative_version()
+        self.editor.set_content(self.document.get_text(), model_id=self.model_id)
+        self.editor.restore_model(self.model_id, dict(self.snapshot, largeFile=self.large_file))
+
+        if self.outline is not None:
+            self.editor.set_folding_ranges(self.model_id, self.outline.folding_ranges)
+            self.editor.set_breadcrumb_scope(self.model_id, self.breadcrumb_scope)
+
+        if self.outline_indexer is not None:
+            # Outlines are keyed by version too; the next one is built from scratch for the renumbered versions
+            self.outline = None
+            self.outline_indexer.forget(self.model_id)
+
+        self.snapshot = None
+        self.reclaimed_bytes = 0
+        self.hibernation_state = "active"
+        self.hibernation_changed.emit(False)
+
+    def dispose(self):
+        """Releases this tab's model, and its page when the tab owns one."""
+        self.disposed = True
+        self.dirty_timer.stop()
+
+        if self.journal is not None:
+            self.journal.discard(self) # Closing a tab is the answer to whether its changes should be kept
+
+        self.unwatch_file()
+
+        if self.outline_indexer is not None:
+            self.outline_timer.stop()
+            self.outline_indexer.outline_ready.disconnect(self.on_outline_ready)
+            self.outline_indexer.forget(self.model_id)
+
+        if not self.materialized:
+            logging.debug(f"Disposed placeholder tab for {self.model_id}.")
+
+            return
+
+        if self.load_future is not None:
+            self._end_load_request()
+            self.loader.cancel(self.file_path)
+
+        if self.saver is not None:
+            self._end_save_request() # The write itself still completes
+
+        if self.reader is not None:
+            if self.reader.isRunning():
+                self.reader.cancel()
+            else:
+                # Still waiting for the page to become ready
+                try:
+                    self.editor.ready.disconnect(self.reader.start)
+                except TypeError:
+                    pass
+
+                self.reader.deleteLater()
+
+        self.editor.bridge.content_changed.disconnect(self.on_content_changed)
+        self.editor.bridge.cursor_changed.disconnect(self.on_cursor_changed)
+        self.editor.bridge.chunk_appended.disconnect(self.on_chunk_appended)
+        self.editor.close_model(self.model_id)
+
+        if self.is_shared:
+            if self.editor.parentWidget() is self:
+                # Keep the shared page alive when the tab that currently shows it goes away
+                self.editor.hide()
+                self.editor.setParent(self.window())
+        elif self.editor_pool is not None:
+            self.editor_pool.release(self.editor)
+        else:
+            self.editor.deleteLater()
+
+        logging.debug(f"Disposed editor tab for {self.model_id}.")
+
+    def load_file(self, large_file_threshold, chunk_size):
+        """Loads the tab's file through the file load service, off the UI thread. Files of at least
+        large_file_threshold bytes are then streamed in. Placeholders remember the request until they are materialized."""
+        if not self.materialized:
+            self.pending_load = (large_file_threshold, chunk_size)
+
+            return
+
+        self.chunk_size = chunk_size
+        self.loader = FileLoadService.instance()
+        self.loader.loaded.connect(self.on_load_result)
+        self.loader.failed.connect(self.on_load_error)
+        self.load_future = self.loader.load(self.file_path, large_file_threshold - 1)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+    def _end_load_request(self):
+        self.loader.loaded.disconnect(self.on_load_result)
+        self.loader.failed.disconnect(self.on_load_error)
+        self.load_future = None
+
+    def on_load_result(self, path_key, result):
+        if self.load_future is None or path_key != FileLoadService.path_key(self.file_path):
+            return
+
+        self._end_load_request()
+        self.encoding = result.encoding
+        self.file_stat = result.stat
+        self.apply_file_info(result.info)
+
+        if result.content is not None:
+            # Small enough to have been read in one piece; it goes into the model as a single chunk
+            self.document.set_text(result.content)
+            self.editor.begin_stream(self.model_id, False)
+            self.editor.append_chunk(result.content, self.model_id)
+            self.on_file_loaded()
+
+            return
+
+        self.large_file = True
+        self.stream_file()
+
+    def apply_file_info(self, info):
+        self.file_info = info
+        self.editor.set_model_format(self.model_id, info.language, info.insert_spaces, info.indent_size)
+
+        # Extensionless scripts only turn out to be Python once their #! line has been seen
+        if info.language == "python" and self.outline_indexer is None:
+            self.outline_indexer = OutlineIndexer.instance()
+            self.outline_indexer.outline_ready.connect(self.on_outline_ready)
+
+    def on_load_error(self, path_key, error):
+        if self.load_future is None or path_key != FileLoadService.path_key(self.file_path):
+            return
+
+        self._end_load_request()
+        self.progress_bar.hide()
+        self.set_content(f"Error loading file: {error}.")
+
+    def stream_file(self):
+        """Streams a large file into the model in chunks read off the UI thread."""
+        logging.info(f"Opening {self.file_path} ({self.file_stat.st_size // (1024 * 1024)} MB) in large-file mode.")
+
+        self.document.set_text("")
+        self.editor.begin_stream(self.model_id, self.large_file)
+
+        self.reader = ChunkedFileReader(self.file_path, self.chunk_size, self.encoding)
+        self.reader.chunk_read.connect(self.on_chunk_read)
+        self.reader.progress.connect(self.on_load_progress)
+        self.reader.loaded.connect(self.on_file_loaded)
+        self.reader.failed.connect(self.on_load_failed)
+        self.reader.finished.connect(self.reader.deleteLater)
+
+        # Chunks only start flowing once the page can take them, instead of piling up in its script queue
+        if self.editor.monaco_ready:
+            self.reader.start()
+        else:
+            self.editor.ready.connect(self.reader.start, Qt.ConnectionType.SingleShotConnection)
+
+    def on_chunk_read(self, chunk):
+        self.document.append(chunk)
+        self.editor.append_chunk(chunk, self.model_id)
+
+    def on_chunk_appended(self, model_id):
+        # The reader only gets its credit back once the page has applied the chunk, not when the script is queued
+        if model_id == self.model_id and self.reader is not None:
+            self.reader.chunk_consumed()
+
+    def on_load_progress(self, read_bytes, total_bytes):
+        if total_bytes:
+            self.progress_bar.setValue(read_bytes * 1000 // total_bytes)
+
+    def on_file_loaded(self):
+        self.reader = None
+        self.progress_bar.hide()
+        self.editor.end_stream(self.model_id)
+        self.dirty_tracker.reset(self.document.get_text())
+        self.watch_file()
+
+        if self.pending_backup is not None:
+            self.restore_backup(self.pending_backup)
+
+        self.request_outline()
+        self.file_loaded.emit()
+
+        if self.restore_cursor is not None:
+            self.editor.reveal_line(self.model_id, *self.restore_cursor)
+            self.restore_cursor = None
+
+    def on_load_failed(self, error):
+        self.reader = None
+        self.progress_bar.hide()
+        self.editor.end_stream(self.model_id)
+        self.set_content(f"Error loading file: {error}.")
+
+    @property
+    def is_loading(self):
+        return self.load_future is not None or self.reader is not None
+
+    @property
+    def version_id(self):
+        return self.document.version
+
+    @property
+    def language(self):
+        """Monaco language id, as sniffed once the file is loaded and guessed from the path before."""
+        return self.file_info.language if self.file_info is not None else model_language(self.file_path)
+
+    def get_content(self, callback, file_path):
+        """Hands the shadow document's text to the callback right away. A placeholder has nothing loaded, so it
+        hands over None rather than an empty document."""
+        callback(self.document.get_text() if self.materialized else None, file_path)
+
+    def save(self, file_path=None):
+        """Writes the document to its file, or to file_path for Save As, off the UI thread. Returns False when
+        there is nothing to save yet."""
+        if not self.materialized or self.is_loading:
+            return False
+
+        if file_path:
+            self.file_path = file_path
+
+        text = self.document.get_text()
+        original_eol = self.file_info.eol if self.file_info is not None else self.document.eol
+        self.saves_in_flight[self.version_id] = (content_digest(text), len(text), self.alternative_version)
+
+        if self.saver is None:
+            self.saver = FileSaveService.instance()
+            self.saver.saved.connect(self.on_saved)
+            self.saver.failed.connect(self.on_save_failed)
+
+        self.saver.save(self.file_path, text, self.encoding,
+                        eol=original_eol if original_eol != self.document.eol else None, version=self.version_id)
+
+        return True
+
+    def _end_save_request(self):
+        self.saver.saved.disconnect(self.on_saved)
+        self.saver.failed.disconnect(self.on_save_failed)
+        self.saver = None
+
+    def on_saved(self, path_key, result):
+        if path_key != FileSaveService.path_key(self.file_path):
+            return
+
+        self.file_stat = result.stat
+        self.watch_file() # Save As moves the watch to the new file
+
+        if not self.saver.is_saving(self.file_path):
+            self._end_save_request()
+
+        saved = self.saves_in_flight.pop(result.version, None)
+
+        # Saves coalesced into this one never report back
+        for version in [version for version in self.saves_in_flight if version < result.version]:
+            del self.saves_in_flight[version]
+
+        if saved is not None:
+            self.dirty_tracker.mark_saved(*saved)
+            self.verify_modified() # Still modified if there was typing while the file was written
+
+        self.file_saved.emit()
+
+    def on_save_failed(self, path_key, error):
+        if path_key != FileSaveService.path_key(self.file_path):
+            return
+
+        if not self.saver.is_saving(self.file_path):
+            self._end_save_request()
+
+        self.save_failed.emit(error)
+
+    def set_content(self, content):
+        # Applied locally too, so the shadow is right even while the page is still loading
+        self.document.set_text(content)
+        self.dirty_tracker.reset(content)
+        self.editor.set_content(content, model_id=self.model_id)
+
+    def restore_backup(self, text):
+        """Shows text recovered from a hot exit backup. The file stays the saved state, so the tab comes back
+        modified and gets journaled again."""
+        if not self.materialized or self.is_loading:
+            self.pending_backup = text
+
+            return
+
+        self.pending_backup = None
+        self.document.set_text(text)
+        self.editor.set_content(text, model_id=self.model_id)
+
+    def backup_header(self):
+        return {"path": self.file_path, "title": os.path.basename(self.file_path) or self.model_id, "encoding": self.encoding}
+
+    def append_content(self, additional_content):
+        self.editor.append_content(additional_content, model_id=self.model_id)
+
+    def is_modified(self):
+        """Whether the document differs from the file, settled from the shadow document without asking the page."""
+        if self.dirty_timer.isActive():
+            self.dirty_timer.stop()
+            self.verify_modified()
+
+        return self.modified
+
+    def verify_modified(self):
+        self.set_modified(self.dirty_tracker.differs(self.document.get_text(), self.alternative_version))
+
+    def set_modified(self, modified):
+        if modified != self.modified:
+            self.modified = modified
+            self.modification_changed.emit(modified)
+
+            if not modified and self.journal is not None:
+                self.journal.discard(self)
+
+    def update_modified(self, immediate=False):
+        """Cheap check on every change: back at the saved version is clean at once, anything else counts as
+        modified until a comparison with the saved content after a typing pause says otherwise."""
+        if self.is_loading:
+            return
+
+        if self.dirty_tracker.is_saved_version(self.alternative_version):
+            self.dirty_timer.stop()
+            self.set_modified(False)
+        elif immediate:
+            self.dirty_timer.stop()
+            self.verify_modified()
+        else:
+            self.set_modified(True)
+            self.dirty_timer.start()
+
+    # The bridge reports events for every model in the page, so each tab picks out its own
+    def on_content_changed(self, model_id, version_id, alternative_version_id, eol, is_flush, changes):
+        if model_id == self.model_id:
+            self.last_active = time.monotonic()
+            self.document.apply_changes(version_id, changes, eol, is_flush)
+            self.alternative_version = alternative_version_id
+            self.content_changed.emit(version_id)
+
+            if self.journal is not None and (changes or is_flush) and not self.is_loading and not self.large_file:
+                self.journal.record(self, changes, eol, is_flush)
+
+            # Whole-model replacements and the end of a load are rare enough to settle right away
+            self.update_modified(immediate=is_flush or not changes or self.settle_next_change)
+            self.settle_next_change = False
+
+            if self.outline_indexer is not None and not self.is_loading:
+                self.outline_timer.start()
+
+    def on_cursor_changed(self, model_id, line, column):
+        if model_id == self.model_id:
+            self.cursor_position = (line, column)
+            self.cursor_position_changed.emit(line, column)
+            self.update_breadcrumb_scope()
+
+    def watch_file(self):
+        """Starts noticing when the tab's file is changed by another program."""
+        if self.watched_path == self.file_path or not self.file_path:
+            return
+
+        self.unwatch_file()
+
+        self.watcher = FileWatchService.instance()
+        self.watcher.files_changed.connect(self.on_files_changed)
+        self.watcher.diff_ready.connect(self.on_disk_diff)
+        self.watcher.watch(self.file_path)
+        self.watched_path = self.file_path
+
+    def unwatch_file(self):
+        if self.watched_path is None:
+            return
+
+        self.watcher.unwatch(self.watched_path)
+        self.watcher.files_changed.disconnect(self.on_files_changed)
+        self.watcher.diff_ready.disconnect(self.on_disk_diff)
+        self.watched_path = None
+
+    def on_files_changed(self, path_keys):
+        if FileWatchService.path_key(self.watched_path) in path_keys:
+            self.check_disk_change()
+
+    def check_disk_change(self):
+        """Has the file diffed against the document off the UI thread; on_disk_diff gets the result."""
+        if not self.materialized or self.is_loading or self.saver is not None:
+            return # Loads read the new content anyway, and saves report the stat they leave behind
+
+        if self.large_file:
+            logging.info(f"{self.file_path} changed on disk; files in large-file mode are not reloaded.")
+
+            return
+
+        self.watcher.diff(self.file_path, self.encoding, self.document.get_text(), self.document.eol, self.version_id,
+                          self.file_stat)
+
+    def on_disk_diff(self, path_key, change):
+        if change is None or self.disposed or path_key != FileWatchService.path_key(self.file_path):
+            return
+
+        if change.version != self.version_id:
+            self.check_disk_change() # Edited while the diff was being worked out
+
+            return
+
+        if self.is_modified():
+            self.disk_change = change
+            self.changed_on_disk.emit()
+
+            return
+
+        self.apply_disk_change(change)
+
+    def apply_disk_change(self, change):
+        """Brings the document up to date with the file by replacing only the lines that changed. The edits go in
+        as one undoable step, so the cursor, the scroll position and the undo history survive."""
+        self.disk_change = None
+
+        if change.version != self.version_id:
+            return
+
+        self.file_stat = change.stat
+        self.dirty_tracker.reset(change.text)
+
+        if not change.edits:
+            self.verify_modified()
+
+            return
+
+        if self.hibernation_state != "active":
+            # Nothing to edit in the page; restore() rebuilds the model from the shadow document
+            self.document.set_text(change.text)
+            self.set_modified(False)
+        else:
+            self.settle_next_change = True
+            self.editor.apply_edits(self.model_id, change.edits)
+
+        logging.info(f"Reloaded {len(change.edits)} changed range(s) of {self.file_path} from disk.")
+
+    def request_outline(self):
+        """Hands the current version to the outline indexer, unless it has been indexed already."""
+        if self.outline_indexer is None or self.large_file:
+            return
+
+        if self.outline is None or self.outline.version != self.document.version:
+            self.outline_indexer.submit(self.model_id, self.document.version, self.document.get_text())
+
+    def on_outline_ready(self, model_id, outline):
+        if model_id != self.model_id or (self.outline is not None and outline.version < self.outline.version):
+            return
+
+        self.outline = outline
+        self.editor.set_folding_ranges(self.model_id, outline.folding_ranges)
+        self.update_breadcrumb_scope()
+        self.outline_changed.emit()
+
+    def update_breadcrumb_scope(self):
+        """Pushes the symbols enclosing the cursor to the breadcrumbs when they change."""
+        if self.outline is None:
+            return
+
+        scope = [symbol.name for symbol in self.outline.scope_at(self.cursor_position[0])]
+
+        if scope != self.breadcrumb_scope:
+            self.breadcrumb_scope = scope
+            self.editor.set_breadcrumb_scope(self.model_id, scope)
+
+    def set_diagnostics(self, diagnostics):
+        """Keeps a version's diagnostics and shows them as markers in the model."""
+        self.diagnostics = diagnostics
+
+        if self.materialized and not self.disposed:
+            self.editor.set_markers(self.model_id, "pylint", [diagnostic.marker() for diagnostic in diagnostics])
+
+    def reveal_line(self, line, column=1):
+        if self.materialized:
+            self.editor.reveal_line(self.model_id, line, column)
@@ -0,0 +1,154 @@
+import os, logging, threading
+
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal
+
+from src.file_sniffer import SNIFF_BYTES, sniff, cached_info, cache_info
+
+MAX_WORKERS = 4
+READ_CHUNK_BYTES = 1024 * 1024 # Cancellation is checked between chunks
+
+class FileLoadResult:
+    """What the service found out about a file. content is None for files too big to be read in one piece; those
+    are streamed in by the caller using the sniffed encoding."""
+
+    __slots__ = ("file_path", "content", "info", "stat")
+
+    def __init__(self, file_path, content, info, stat):
+        self.file_path = file_path
+        self.content = content
+        self.info = info # FileInfo: encoding, line breaks, indentation and language
+        self.stat = stat # os.stat_result
+
+    @property
+    def encoding(self):
+        return self.info.encoding
+
+class FileLoadService(QObject):
+    """Stats, sniffs and reads files on a thread pool so no open path blocks the UI on a slow disk.
+
+    load() returns a concurrent.futures.Future; results are also delivered on the UI thread through the loaded
+    and failed signals. Requests for a path that is already loading share the same future, and a load is only
+    cancelled once every requester has given up on it.
+    """
+
+    loaded = pyqtSignal(str, object) # Path, FileLoadResult
+    failed = pyqtSignal(str, str) # Path, error message
+    _finished = pyqtSignal(str, object) # Emitted from the pool; queued over to the UI thread
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = FileLoadService()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.shutdown)
+
+        return cls._instance
+
+    def __init__(self, max_workers=MAX_WORKERS, parent=None):
+        super().__init__(parent)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FileLoader")
+        self.requests = {} # Path -> [future, cancel event, number of requesters]
+
+        self._finished.connect(self.on_finished)
+
+    @staticmethod
+    def path_key(file_path):
+        # Purely lexical, as resolving links would touch the disk on the UI thread
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def load(self, file_path, max_content_bytes):
+        """Starts loading a file, or joins the load already running for it. Files bigger than max_content_bytes
+        are only stat'ed and sniffed."""
+        key = self.path_key(file_path)
+        request = self.requests.get(key)
+
+        if request is not None:
+            request[2] += 1
+
+            return request[0]
+
+        cancelled = threading.Event()
+        future = self.executor.submit(self._load, file_path, max_content_bytes, cancelled)
+        self.requests[key] = [future, cancelled, 1]
+
+        future.add_done_callback(lambda done: self._finished.emit(key, done))
+
+        return future
+
+    def cancel(self, file_path):
+        """Gives up one request for the path; the read stops when nobody is waiting for it any more."""
+        key = self.path_key(file_path)
+        request = self.requests.get(key)
+
+        if request is None:
+            return
+
+        request[2] -= 1
+
+        if request[2] <= 0:
+            del self.requests[key]
+            request[1].set()
+            request[0].cancel()
+
+    def _load(self, file_path, max_content_bytes, cancelled):
+        stat = os.stat(file_path)
+        info = cached_info(file_path, stat)
+
+        with open(file_path, 'rb') as file:
+            if stat.st_size > max_content_bytes:
+                if info is None:
+                    info = sniff(file.read(SNIFF_BYTES), file_path, complete=False)
+                    cache_info(file_path, stat, info)
+
+                return FileLoadResult(file_path, None, info, stat)
+
+            chunks = []
+
+            while not cancelled.is_set():
+                chunk = file.read(READ_CHUNK_BYTES)
+
+                if not chunk:
+                    break
+
+                chunks.append(chunk)
+
+        if cancelled.is_set():
+            raise CancelledError()
+
+        data = b"".join(chunks)
+
+        if info is None:
+            info = sniff(data[:SNIFF_BYTES], file_path, complete=len(data) < SNIFF_BYTES)
+            cache_info(file_path, stat, info)
+
+        # Bytes the sniffed encoding cannot decode become lone surrogates, which the save turns back into those bytes
+        return FileLoadResult(file_path, data.decode(info.encoding, errors="surrogateescape"), info, stat)
+
+    def on_finished(self, key, future):
+        request = self.requests.get(key)
+
+        if request is None or request[0] is not future:
+            return # Cancelled by every requester
+
+        del self.requests[key]
+
+        if future.cancelled():
+            return
+
+        error = future.exception()
+
+        if error is not None:
+            logging.error(f"Failed to load {key}: {error}.")
+            self.failed.emit(key, str(error))
+        else:
+            self.loaded.emit(key, future.result())
+
+    def shutdown(self):
+        for _, cancelled, _ in self.requests.values():
+            cancelled.set()
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,166 @@
+import os, logging, tempfile
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal
+
+from src.shadow_buffer import LINE_BREAK
+
+MAX_WORKERS = 4
+
+class FileSaveResult:
+    """A file that made it to disk. version is whatever the requester passed along with the content."""
+
+    __slots__ = ("file_path", "version", "stat")
+
+    def __init__(self, file_path, version, stat):
+        self.file_path = file_path
+        self.version = version
+        self.stat = stat # os.stat_result of the file as written
+
+def write_atomically(file_path, data):
+    """Writes data next to the file, fsyncs it and renames it over the file, so a crash leaves either the old or the
+    new content and never a truncated mix."""
+    file_path = os.path.realpath(file_path) # Replace a link's target, not the link
+    directory = os.path.dirname(file_path)
+
+    try:
+        mode = os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    descriptor, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory)
+
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        if mode is not None:
+            os.chmod(temp_path, mode) # mkstemp creates the file readable by its owner only
+
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+        raise
+
+    if os.name == "posix":
+        # The rename itself only survives a crash once the directory entry is on disk
+        directory_descriptor = os.open(directory, os.O_RDONLY)
+
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
+
+    return os.stat(file_path)
+
+class FileSaveService(QObject):
+    """Writes files on a small thread pool, atomically, in the encoding and line endings they were opened with.
+
+    At most one write per path runs at a time. Saving a path that is still being written only keeps the latest
+    content, which is written once the running write is done; the ones in between are never written at all.
+    Results come back on the UI thread through the saved and failed signals.
+    """
+
+    saved = pyqtSignal(str, object) # Path, FileSaveResult
+    failed = pyqtSignal(str, str) # Path, error message
+    stats_changed = pyqtSignal()
+    _finished = pyqtSignal(str, object) # Emitted from the pool; queued over to the UI thread
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = FileSaveService()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.shutdown)
+
+        return cls._instance
+
+    def __init__(self, max_workers=MAX_WORKERS, parent=None):
+        super().__init__(parent)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FileSaver")
+        self.requests = {} # Path -> [running future, latest save arguments waiting for it, or None]
+        self.writes = 0 # Writes started; these counts are shown in the developer tools
+        self.coalesced = 0 # Saves replaced by a later save of the same path before they were written
+
+        self._finished.connect(self.on_finished)
+
+    @staticmethod
+    def path_key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def save(self, file_path, content, encoding="utf-8", eol=None, version=None):
+        """Queues content to be written to file_path. eol, when given, is applied to every line break."""
+        key = self.path_key(file_path)
+        arguments = (file_path, content, encoding, eol, version)
+        request = self.requests.get(key)
+
+        if request is not None:
+            if request[1] is not None:
+                self.coalesced += 1
+                self.stats_changed.emit()
+
+            request[1] = arguments
+
+            return
+
+        self._submit(key, arguments)
+
+    def is_saving(self, file_path):
+        return self.path_key(file_path) in self.requests
+
+    def _submit(self, key, arguments):
+        future = self.executor.submit(self._save, *arguments)
+        self.requests[key] = [future, None]
+        self.writes += 1
+        self.stats_changed.emit()
+
+        future.add_done_callback(lambda done: self._finished.emit(key, done))
+
+    def _save(self, file_path, content, encoding, eol, version):
+        if eol is not None:
+            content = LINE_BREAK.sub(eol, content)
+
+        # Bytes that did not decode on load are written back as they were; any other character the encoding cannot
+        # represent fails the save rather than being silently replaced
+        return FileSaveResult(file_path, version, write_atomically(file_path, content.encode(encoding, "surrogateescape")))
+
+    def on_finished(self, key, future):
+        request = self.requests.pop(key, None)
+
+        if request is not None and request[1] is not None:
+            self._submit(key, request[1]) # Started before reporting, so is_saving() tells requesters more is coming
+
+        error = future.exception()
+
+        if error is not None:
+            logging.error(f"Failed to save {key}: {error}.")
+            self.failed.emit(key, str(error))
+        else:
+            logging.info(f"File saved successfully at {key}.")
+            self.saved.emit(key, future.result())
+
+        self.stats_changed.emit()
+
+    def shutdown(self):
+        """Finishes every write that was asked for before the application goes away."""
+        self.executor.shutdown(wait=True)
+
+        for key, (_, pending) in list(self.requests.items()):
+            if pending is None:
+                continue
+
+            try:
+                self._save(*pending)
+            except Exception as e:
+                logging.error(f"Failed to save {key}: {e}.")
+
+        self.requests.clear()
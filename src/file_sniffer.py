@@ -0,0 +1,185 @@
+import os, re, codecs, threading
+
+from collections import Counter, OrderedDict
+
+from chardet.universaldetector import UniversalDetector
+
+SNIFF_BYTES = 64 * 1024 # Only this much of a file is ever looked at
+DETECTOR_BLOCK_BYTES = 4096 # chardet is fed in blocks so it can stop as soon as it is sure
+INDENTATION_LINES = 1000
+CACHE_SIZE = 1024
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Extension -> (Monaco language id, display name)
+LANGUAGES = {
+    ".py": ("python", "Python"),
+    ".pyw": ("python", "Python"),
+    ".js": ("javascript", "JavaScript"),
+    ".html": ("html", "HTML"),
+    ".css": ("css", "CSS"),
+    ".qss": ("css", "QSS"),
+    ".java": ("java", "Java"),
+    ".cpp": ("cpp", "C++"),
+    ".md": ("markdown", "Markdown"),
+    ".json": ("json", "JSON"),
+    ".sh": ("shell", "Shell Script"),
+}
+
+# Interpreter named on a #! line -> (Monaco language id, display name)
+SHEBANG_LANGUAGES = {
+    "python": ("python", "Python"),
+    "node": ("javascript", "JavaScript"),
+    "sh": ("shell", "Shell Script"),
+    "bash": ("shell", "Shell Script"),
+    "zsh": ("shell", "Shell Script"),
+}
+
+PLAIN_TEXT = ("plaintext", "Plain Text")
+LINE_BREAK = re.compile(r"\r\n|\r|\n")
+SHEBANG = re.compile(r"#!\s*(?:\S*/)?(?:env\s+(?:-\S+\s+)*)?([A-Za-z]+)") # Interpreter name, without a version
+
+class FileInfo:
+    """Everything sniffed from the start of a file."""
+
+    __slots__ = ("encoding", "eol", "insert_spaces", "indent_size", "language", "language_name")
+
+    def __init__(self, encoding, eol, insert_spaces, indent_size, language, language_name):
+        self.encoding = encoding
+        self.eol = eol # "\r\n", "\n" or "\r"
+        self.insert_spaces = insert_spaces
+        self.indent_size = indent_size
+        self.language = language # Monaco language id
+        self.language_name = language_name
+
+    @property
+    def indentation_label(self):
+        return f"Spaces: {self.indent_size}" if self.insert_spaces else f"Tab Size: {self.indent_size}"
+
+_cache = OrderedDict() # (path, size, mtime, inode) -> FileInfo, least recently used first
+_cache_lock = threading.Lock() # Sniffing runs on the file load service's threads
+
+def cache_key(file_path, stat):
+    return (os.path.normcase(os.path.abspath(file_path)), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+def cached_info(file_path, stat):
+    with _cache_lock:
+        info = _cache.get(cache_key(file_path, stat))
+
+        if info is not None:
+            _cache.move_to_end(cache_key(file_path, stat))
+
+        return info
+
+def cache_info(file_path, stat, info):
+    with _cache_lock:
+        _cache[cache_key(file_path, stat)] = info
+
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def sniff(data, file_path="", complete=True):
+    """Runs every detector over one bounded prefix. complete tells whether data is the whole file."""
+    data = data[:SNIFF_BYTES]
+    complete = complete and len(data) < SNIFF_BYTES
+    encoding = detect_encoding(data, complete)
+
+    # A prefix may end in the middle of a character, which is not an error
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(data, final=complete)
+
+    insert_spaces, indent_size = detect_indentation(text)
+    language, language_name = detect_language(file_path, text)
+
+    return FileInfo(encoding, detect_eol(text), insert_spaces, indent_size, language, language_name)
+
+def detect_encoding(data, complete=True):
+    """BOM first, then strict UTF-8, then chardet, stopping as soon as it is confident."""
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return encoding
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(data, final=complete)
+
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    detector = UniversalDetector()
+
+    for start in range(0, len(data), DETECTOR_BLOCK_BYTES):
+        detector.feed(data[start:start + DETECTOR_BLOCK_BYTES])
+
+        if detector.done:
+            break
+
+    encoding = detector.close()["encoding"]
+
+    try:
+        return codecs.lookup(encoding).name if encoding else "utf-8"
+    except LookupError:
+        return "utf-8"
+
+def detect_eol(text, default="\n"):
+    """Line break style of the text, taken from its first line break."""
+    match = LINE_BREAK.search(text)
+
+    return match.group() if match else default
+
+def detect_indentation(text):
+    """Returns (insert spaces, size), inferred from how indentation changes between consecutive lines."""
+    tab_lines = space_lines = 0
+    steps = Counter()
+    previous = 0
+
+    for line_number, line in enumerate(text.splitlines()):
+        if line_number >= INDENTATION_LINES:
+            break
+
+        stripped = line.lstrip(" \t")
+
+        if not stripped:
+            continue
+
+        indentation = line[:len(line) - len(stripped)]
+
+        if indentation.startswith("\t"):
+            tab_lines += 1
+            continue
+
+        spaces = len(indentation)
+
+        if spaces:
+            space_lines += 1
+
+        if spaces != previous:
+            steps[abs(spaces - previous)] += 1
+
+        previous = spaces
+
+    if tab_lines > space_lines:
+        return False, 4
+
+    size = max((step for step in (2, 4, 8, 3) if steps[step]), key=lambda step: steps[step], default=4)
+
+    return True, size
+
+def detect_language(file_path, text=""):
+    """(Monaco language id, display name) from the extension, or from a #! line for extensionless scripts."""
+    language = LANGUAGES.get(os.path.splitext(file_path)[1].lower())
+
+    if language is not None:
+        return language
+
+    match = SHEBANG.match(text)
+
+    if match:
+        return SHEBANG_LANGUAGES.get(match.group(1), PLAIN_TEXT)
+
+    return PLAIN_TEXT
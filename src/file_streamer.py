@@ -0,0 +1,66 @@
+import os, codecs, logging
+
+from PyQt6.QtCore import QThread, QSemaphore, pyqtSignal
+
+CHUNKS_IN_FLIGHT = 4 # Chunks the reader may get ahead of the page before it waits
+
+class ChunkedFileReader(QThread):
+    """Reads and decodes a file in chunks off the UI thread, handing each chunk over as soon as it is ready."""
+
+    chunk_read = pyqtSignal(str)
+    progress = pyqtSignal(int, int) # Bytes read, total bytes
+    loaded = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, chunk_size=1024 * 1024, encoding="utf-8"):
+        super().__init__()
+
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.credits = QSemaphore(CHUNKS_IN_FLIGHT) # Keeps a fast disk from queueing the whole file in memory
+
+    def chunk_consumed(self):
+        """Must be called once a chunk has been applied by whatever it was meant for, which frees its credit."""
+        self.credits.release()
+
+    def cancel(self):
+        self.requestInterruption()
+        self.credits.release(CHUNKS_IN_FLIGHT) # Wake the reader up if it is waiting on the UI
+        self.wait()
+
+    def run(self):
+        try:
+            total_bytes = os.path.getsize(self.file_path)
+            decoder = codecs.getincrementaldecoder(self.encoding)(errors="surrogateescape") # Undecodable bytes survive a save
+            read_bytes = 0
+            carry = ""
+
+            with open(self.file_path, 'rb') as file:
+                while not self.isInterruptionRequested():
+                    data = file.read(self.chunk_size)
+                    text = carry + decoder.decode(data, final=not data)
+                    carry = ""
+
+                    # Hold back a trailing CR so a CRLF split across chunks is not read as two line breaks
+                    if data and text.endswith("\r"):
+                        text, carry = text[:-1], "\r"
+
+                    if text:
+                        self.credits.acquire()
+
+                        if self.isInterruptionRequested():
+                            return
+
+                        self.chunk_read.emit(text)
+
+                    read_bytes += len(data)
+                    self.progress.emit(read_bytes, total_bytes)
+
+                    if not data:
+                        self.loaded.emit()
+
+                        return
+        except (OSError, LookupError) as e:
+            logging.error(f"Failed to read file {self.file_path}: {e}.")
+            self.failed.emit(str(e))
@@ -0,0 +1,195 @@
+import os, difflib, logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, QCoreApplication, pyqtSignal
+
+from src.shadow_buffer import LINE_BREAK
+
+DEBOUNCE_MS = 200 # A formatter or a checkout touching many files shows up as one batch
+MAX_WORKERS = 2
+
+def utf16_length(line):
+    return len(line) if line.isascii() else len(line.encode("utf-16-le", "surrogatepass")) // 2
+
+def line_edits(old_text, new_text, eol="\n"):
+    """Monaco edits, as (start line, start column, end line, end column, text) with 1-based positions in old_text,
+    that turn old_text into new_text by replacing only the lines that differ. The edits do not overlap, so they
+    can be applied together."""
+    old_lines = LINE_BREAK.split(old_text)
+    new_lines = LINE_BREAK.split(new_text)
+
+    # Common ends are cheap to skip, and usually almost everything
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    suffix = 0
+    limit -= prefix
+
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    matcher = difflib.SequenceMatcher(None, old_lines[prefix:len(old_lines) - suffix], new_lines[prefix:len(new_lines) - suffix])
+    edits = []
+    last_line = len(old_lines)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+
+        i1, i2, j1, j2 = i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix
+        replacement = new_lines[j1:j2]
+
+        if i2 < last_line:
+            # Whole lines up to the start of the next unchanged one
+            edits.append((i1 + 1, 1, i2 + 1, 1, "".join(line + eol for line in replacement)))
+        elif i1 > 0:
+            # Up to the end of the document, which has no line after it to anchor to
+            end_column = utf16_length(old_lines[-1]) + 1
+            edits.append((i1, utf16_length(old_lines[i1 - 1]) + 1, last_line, end_column,
+                          "".join(eol + line for line in replacement)))
+        else:
+            edits.append((1, 1, last_line, utf16_length(old_lines[-1]) + 1, eol.join(replacement)))
+
+    return edits
+
+def same_file_version(stat, other):
+    return other is not None and (stat.st_size, stat.st_mtime_ns, stat.st_ino) == (other.st_size, other.st_mtime_ns, other.st_ino)
+
+class DiskChange:
+    """A file's new content, and the edits that bring the document at version up to date with it."""
+
+    __slots__ = ("version", "stat", "text", "edits")
+
+    def __init__(self, version, stat, text, edits):
+        self.version = version
+        self.stat = stat
+        self.text = text
+        self.edits = edits
+
+class FileWatchService(QObject):
+    """Watches the files of all open documents with one QFileSystemWatcher.
+
+    Change notifications are debounced and delivered in batches through files_changed. Working out what changed
+    is done on a worker: the file is read and diffed against the document's text, and the result comes back
+    through diff_ready.
+    """
+
+    files_changed = pyqtSignal(object) # Set of path keys
+    diff_ready = pyqtSignal(str, object) # Path key, DiskChange or None when the file is as it was
+    _finished = pyqtSignal(str, object) # Emitted from the pool; queued over to the UI thread
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = FileWatchService()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.shutdown)
+
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watched = {} # Path key -> [path, number of watchers]
+        self.changed = set()
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="FileWatcher")
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_MS)
+        self.timer.timeout.connect(self.flush)
+
+        self._finished.connect(self.on_finished)
+
+    @staticmethod
+    def path_key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def watch(self, file_path):
+        key = self.path_key(file_path)
+        watched = self.watched.get(key)
+
+        if watched is not None:
+            watched[1] += 1
+
+            return
+
+        self.watched[key] = [file_path, 1]
+        self.watcher.addPath(file_path)
+
+    def unwatch(self, file_path):
+        key = self.path_key(file_path)
+        watched = self.watched.get(key)
+
+        if watched is None:
+            return
+
+        watched[1] -= 1
+
+        if watched[1] <= 0:
+            del self.watched[key]
+            self.changed.discard(key)
+            self.watcher.removePath(file_path)
+
+    def on_file_changed(self, file_path):
+        key = self.path_key(file_path)
+
+        if key in self.watched:
+            self.changed.add(key)
+            self.timer.start() # Restarted by every change, so a burst is reported once it is over
+
+    def flush(self):
+        changed, self.changed = self.changed, set()
+        watched_files = set(self.watcher.files())
+
+        for key in changed:
+            file_path = self.watched[key][0]
+
+            # Files replaced by a rename, as atomic saves do, drop out of the watcher
+            if file_path not in watched_files and os.path.exists(file_path):
+                self.watcher.addPath(file_path)
+
+        logging.info(f"{len(changed)} open file(s) changed on disk.")
+        self.files_changed.emit(changed)
+
+    def diff(self, file_path, encoding, text, eol, version, known_stat):
+        """Reads a file on a worker and diffs it against text, the document at version."""
+        key = self.path_key(file_path)
+        future = self.executor.submit(self._diff, file_path, encoding, text, eol, version, known_stat)
+        future.add_done_callback(lambda done: self._finished.emit(key, done))
+
+    def _diff(self, file_path, encoding, text, eol, version, known_stat):
+        stat = os.stat(file_path)
+
+        if same_file_version(stat, known_stat):
+            return None # Touched without being changed, or our own save
+
+        with open(file_path, 'rb') as file:
+            new_text = file.read().decode(encoding, errors="surrogateescape") # As FileLoadService decodes it
+
+        new_text = eol.join(LINE_BREAK.split(new_text)) # As the model will have it
+
+        return DiskChange(version, stat, new_text, line_edits(text, new_text, eol))
+
+    def on_finished(self, key, future):
+        if future.cancelled():
+            return
+
+        error = future.exception()
+
+        if error is not None:
+            logging.error(f"Failed to check {key} for changes: {error}.")
+
+            return
+
+        self.diff_ready.emit(key, future.result())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,74 @@
+import time
+
+from PyQt6.QtCore import QObject, QTimer, Qt
+
+DEFAULT_REFRESH_RATE = 60
+
+class GeometryPacer(QObject):
+    """Coalesces window geometry changes to at most one per display frame.
+
+    Mouse events arrive far more often than the screen refreshes, and every setGeometry relayouts the whole
+    window, including each Monaco page. Requests only record the latest target; a timer running at the
+    screen's refresh rate applies it.
+    """
+
+    def __init__(self, window, paced=True):
+        super().__init__(window)
+
+        self.window = window
+        self.paced = paced # When False, every request is applied right away, as the window used to do
+        self.pending_geometry = None
+        self.requests = 0
+        self.applied = 0
+        self.last_applied_at = None
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.apply_pending)
+
+    def frame_interval_ms(self):
+        screen = self.window.screen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+
+        return max(1, round(1000 / (refresh_rate or DEFAULT_REFRESH_RATE)))
+
+    def target_geometry(self):
+        """The geometry the window is heading to: the pending one if any, the current one otherwise."""
+        return self.pending_geometry if self.pending_geometry is not None else self.window.geometry()
+
+    def request_geometry(self, rect):
+        self.requests += 1
+        self.pending_geometry = rect
+
+        if not self.paced:
+            self.apply_pending()
+        elif not self.timer.isActive():
+            # The first change after a pause goes out on the next turn of the event loop, later ones a frame apart
+            self.timer.start(0 if self.last_applied_at is None or self._since_last_frame_ms() >= self.frame_interval_ms()
+                             else self.frame_interval_ms() - self._since_last_frame_ms())
+
+    def request_move(self, position):
+        rect = self.target_geometry()
+        rect.moveTopLeft(position)
+        self.request_geometry(rect)
+
+    def _since_last_frame_ms(self):
+        return int((time.perf_counter() - self.last_applied_at) * 1000)
+
+    def apply_pending(self):
+        if self.pending_geometry is None:
+            return
+
+        rect, self.pending_geometry = self.pending_geometry, None
+
+        if rect != self.window.geometry():
+            self.window.setGeometry(rect)
+
+        self.applied += 1
+        self.last_applied_at = time.perf_counter()
+
+    def flush(self):
+        """Applies a pending change right away, e.g. when the drag ends."""
+        self.timer.stop()
+        self.apply_pending()
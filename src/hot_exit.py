@@ -0,0 +1,247 @@
+import os, json, uuid, logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer, QStandardPaths, QCoreApplication
+
+from src.shadow_buffer import ShadowDocument
+from src.file_saver import write_atomically
+
+APPLICATION_DIR = "VSCodeClone"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_DELAY_MS = 1000 # Changes are batched for this long before they are handed to the writer
+COMPACT_RECORDS = 500 # A journal is rewritten as a single snapshot after this many delta records...
+COMPACT_MIN_BYTES = 64 * 1024 # ...or once its deltas outgrow the snapshot, and are bigger than this
+
+def backup_directory():
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+
+    return os.path.join(base, APPLICATION_DIR, "Backups")
+
+class Backup:
+    """An unsaved document recovered from its journal."""
+
+    __slots__ = ("journal_id", "file_path", "title", "encoding", "text")
+
+    def __init__(self, journal_id, file_path, title, encoding, text):
+        self.journal_id = journal_id
+        self.file_path = file_path # Empty for untitled documents
+        self.title = title
+        self.encoding = encoding
+        self.text = text
+
+def read_journal(journal_path):
+    """Replays a journal: a JSON header line, a snapshot record followed by the raw text, then one JSON line per
+    batch of changes. A record cut short by a crash ends the replay; everything before it is kept."""
+    with open(journal_path, 'rb') as file:
+        header = json.loads(file.readline())
+        document = None
+
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+
+            if "snapshot" in record:
+                data = file.read(record["snapshot"])
+
+                if len(data) < record["snapshot"]:
+                    break
+
+                document = ShadowDocument(data.decode("utf-8", errors="surrogatepass"))
+                file.readline()
+            elif document is not None:
+                apply_record(document, record)
+
+    if document is None:
+        return None
+
+    journal_id = os.path.basename(journal_path)[:-len(JOURNAL_SUFFIX)]
+
+    return Backup(journal_id, header.get("path", ""), header.get("title", ""), header.get("encoding", "utf-8"),
+                  document.get_text())
+
+def apply_record(document, record):
+    for changes, eol, is_flush in record["changes"]:
+        document.apply_changes(document.version + 1, changes, eol, is_flush)
+
+def load_backups(directory):
+    backups = []
+
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(JOURNAL_SUFFIX))
+    except FileNotFoundError:
+        return backups
+
+    for name in names:
+        try:
+            backup = read_journal(os.path.join(directory, name))
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read the backup {name}: {e}.")
+            continue
+
+        if backup is not None:
+            backups.append(backup)
+
+    return backups
+
+class JournalWriter:
+    """The file side of the journal. Only ever used from the journal's single writer thread, so it needs no locks;
+    it keeps its own copy of each document to compact journals without asking the UI thread for their text."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.journals = {} # Journal id -> [header, ShadowDocument, open file, delta records, delta bytes, snapshot bytes]
+        self.records = 0
+        self.compactions = 0
+
+    def journal_path(self, journal_id):
+        return os.path.join(self.directory, journal_id + JOURNAL_SUFFIX)
+
+    def begin(self, journal_id, header, text):
+        self.discard(journal_id)
+        self.journals[journal_id] = [header, ShadowDocument(text), None, 0, 0, 0]
+        self.compact(journal_id)
+
+    def append(self, journal_id, changes):
+        journal = self.journals.get(journal_id)
+
+        if journal is None:
+            return
+
+        record = {"changes": changes}
+        apply_record(journal[1], record)
+
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8", errors="surrogatepass") + b"\n"
+        journal[2].write(data)
+        journal[2].flush() # In the OS's hands from here, which is enough to survive the application crashing
+        journal[3] += 1
+        journal[4] += len(data)
+        self.records += 1
+
+        if journal[3] >= COMPACT_RECORDS or journal[4] > max(journal[5], COMPACT_MIN_BYTES):
+            self.compact(journal_id)
+
+    def compact(self, journal_id):
+        """Rewrites a journal as its header and one snapshot of the document."""
+        journal = self.journals[journal_id]
+        snapshot = journal[1].get_text().encode("utf-8", errors="surrogatepass")
+
+        if journal[2] is not None:
+            journal[2].close()
+
+        os.makedirs(self.directory, exist_ok=True)
+        write_atomically(self.journal_path(journal_id),
+                         json.dumps(journal[0]).encode("utf-8") + b"\n" +
+                         json.dumps({"snapshot": len(snapshot)}).encode("utf-8") + b"\n" + snapshot + b"\n")
+
+        journal[2] = open(self.journal_path(journal_id), 'ab')
+        journal[3:] = [0, 0, len(snapshot)]
+        self.compactions += 1
+
+    def discard(self, journal_id):
+        journal = self.journals.pop(journal_id, None)
+
+        if journal is not None and journal[2] is not None:
+            journal[2].close()
+
+        try:
+            os.remove(self.journal_path(journal_id))
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        for journal in self.journals.values():
+            if journal[2] is not None:
+                journal[2].close()
+
+        self.journals.clear()
+
+class HotExitJournal(QObject):
+    """Write-behind backups of unsaved documents, so neither quitting nor a crash loses them.
+
+    Tabs hand over the change events they already get from the page; on the UI thread that is one list append
+    per change. Every JOURNAL_DELAY_MS the collected changes of each modified document go to a single writer
+    thread, which appends them as one compact record to the document's journal and compacts the journal into a
+    snapshot when it grows. A document's journal is deleted as soon as it is saved or closed unsaved.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = HotExitJournal()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.close)
+
+        return cls._instance
+
+    def __init__(self, directory=None, delay_ms=JOURNAL_DELAY_MS, parent=None):
+        super().__init__(parent)
+
+        self.directory = directory or backup_directory()
+        self.backups = load_backups(self.directory) # Left over by the previous session, read before anything is written
+        self.writer = JournalWriter(self.directory)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="HotExitJournal") # One thread keeps records in order
+        self.pending = {} # Tab -> [(changes, eol, is flush), ...] not handed to the writer yet
+        self.journal_ids = {} # Tab -> id of its journal, once one was started
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def take_backups(self):
+        """The previous session's backups; only the first window to ask gets them."""
+        backups, self.backups = self.backups, []
+
+        return backups
+
+    def delete_backups(self, backups):
+        for backup in backups:
+            self.executor.submit(self._run, self.writer.discard, backup.journal_id)
+
+    def record(self, tab, changes, eol, is_flush):
+        self.pending.setdefault(tab, []).append((changes, eol, is_flush))
+
+        if not self.timer.isActive():
+            self.timer.start() # Not restarted by later changes, so continuous typing is still saved every interval
+
+    def flush(self):
+        """Hands every change collected so far to the writer."""
+        self.timer.stop()
+        pending, self.pending = self.pending, {}
+
+        for tab, changes in pending.items():
+            if tab.disposed or not tab.modified:
+                continue
+
+            journal_id = self.journal_ids.get(tab)
+
+            if journal_id is None:
+                # The first record is the whole document, which already includes the changes collected so far
+                journal_id = self.journal_ids[tab] = uuid.uuid4().hex
+                self.executor.submit(self._run, self.writer.begin, journal_id, tab.backup_header(), tab.document.get_text())
+            else:
+                self.executor.submit(self._run, self.writer.append, journal_id, changes)
+
+    def discard(self, tab):
+        """Drops the journal of a tab that was saved, went back to its saved content or was closed unsaved."""
+        self.pending.pop(tab, None)
+        journal_id = self.journal_ids.pop(tab, None)
+
+        if journal_id is not None:
+            self.executor.submit(self._run, self.writer.discard, journal_id)
+
+    def _run(self, operation, journal_id, *args):
+        try:
+            operation(journal_id, *args)
+        except Exception as e:
+            logging.error(f"Failed to update the backup {journal_id}: {e}.")
+
+    def close(self):
+        """Writes out everything still pending; the journals stay behind for the next launch to restore."""
+        self.flush()
+        self.executor.shutdown(wait=True)
+        self.writer.close()
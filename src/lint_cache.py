@@ -0,0 +1,220 @@
+import os, sys, hashlib, logging, functools, importlib.metadata
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QStandardPaths, QCoreApplication, pyqtSignal
+
+from src.file_saver import write_atomically
+
+APPLICATION_DIR = "VSCodeClone"
+ENTRY_SUFFIX = ".lint"
+MEMORY_ENTRIES = 256 # Results kept in memory, most recently used last
+
+def cache_directory():
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+
+    return os.path.join(cache_root, APPLICATION_DIR, "LintCache")
+
+@functools.cache
+def tool_versions():
+    """What the lint server runs with; a new pylint or astroid can report different problems for the same code."""
+    versions = [sys.version]
+
+    for package in ("pylint", "astroid"):
+        try:
+            versions.append(f"{package} {importlib.metadata.version(package)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{package} missing")
+
+    return "\n".join(versions).encode("utf-8")
+
+_config_file_digests = {} # Path -> ((mtime, size), digest of the content)
+
+def config_file_digest(config_path):
+    """Digest of an rc file's content, read again only when its modification time or size changes."""
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return b""
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_file_digests.get(config_path)
+
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(config_path, 'rb') as file:
+            file_digest = hashlib.blake2b(file.read(), digest_size=16).digest()
+    except OSError:
+        return b""
+
+    _config_file_digests[config_path] = (signature, file_digest)
+
+    return file_digest
+
+def config_digest(config_paths):
+    """Digest of the effective rc configuration: the rc files the lint server found, as they are now. Finding them
+    is left to the server, so pylint is never imported into the editor."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    for config_path in config_paths:
+        digest.update(config_path.encode("utf-8", "surrogatepass"))
+        digest.update(config_file_digest(config_path))
+
+    return digest.digest()
+
+def cache_key(text, args=(), file_path="", sys_path=(), config=b""):
+    """Content address of a lint result: the text, the tools, the arguments, the effective rc configuration as
+    config_digest() gives it, the document's path, which names its module, and the import path its imports are
+    resolved on."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(tool_versions())
+    digest.update(repr([list(args), file_path, list(sys_path)]).encode("utf-8", "surrogatepass"))
+    digest.update(config)
+    digest.update(text.encode("utf-8", "surrogatepass"))
+
+    return digest.hexdigest()
+
+class LintCache(QObject):
+    """Lint results by content address, so linting a buffer that was linted before as it is now costs nothing.
+
+    Recent results are kept in memory. Every result is also written to its own file in the cache directory by a
+    single writer thread, so they survive restarts; when the directory outgrows its limit, the least recently used
+    files are deleted.
+    """
+
+    stats_changed = pyqtSignal()
+
+    _instance = None
+
+    @classmethod
+    def instance(cls, max_disk_mb=32):
+        if cls._instance is None:
+            cls._instance = LintCache(max_disk_mb=max_disk_mb)
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.close)
+
+        return cls._instance
+
+    def __init__(self, directory=None, max_disk_mb=32, parent=None):
+        super().__init__(parent)
+
+        self.directory = directory or cache_directory()
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.memory = OrderedDict() # Key -> output
+        self.disk_entries = OrderedDict() # Key -> size in bytes, least recently used first; only touched by the writer
+        self.disk_bytes = 0 # Written by the writer, read by the developer tools
+        self.hits = 0
+        self.misses = 0
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LintCache") # One thread keeps the index consistent
+
+        self.executor.submit(self._run, self._scan)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def get(self, key):
+        """The cached output for key, or None. A result only on disk is read in; they are a few kilobytes."""
+        output = self.memory.get(key)
+
+        if output is not None:
+            self.memory.move_to_end(key)
+        else:
+            output = self._read(key)
+
+            if output is not None:
+                self._remember(key, output)
+
+        if output is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.executor.submit(self._run, self._touch, key)
+
+        self.stats_changed.emit()
+
+        return output
+
+    def put(self, key, output):
+        self._remember(key, output)
+        self.executor.submit(self._run, self._write, key, output)
+
+    def _remember(self, key, output):
+        self.memory[key] = output
+        self.memory.move_to_end(key)
+
+        if len(self.memory) > MEMORY_ENTRIES:
+            self.memory.popitem(last=False)
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _read(self, key):
+        try:
+            with open(self.entry_path(key), 'rb') as file:
+                return file.read().decode("utf-8", "surrogatepass")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read the lint cache entry {key}: {e}.")
+
+            return None
+
+    def _scan(self):
+        """Indexes what earlier sessions left, oldest use first."""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(ENTRY_SUFFIX)]
+        except FileNotFoundError:
+            return
+
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime_ns):
+            self.disk_entries[entry.name[:-len(ENTRY_SUFFIX)]] = entry.stat().st_size
+
+        self._set_disk_bytes(sum(self.disk_entries.values()))
+        self._evict()
+
+    def _write(self, key, output):
+        data = output.encode("utf-8", "surrogatepass")
+        os.makedirs(self.directory, exist_ok=True)
+        write_atomically(self.entry_path(key), data)
+
+        self._set_disk_bytes(self.disk_bytes - self.disk_entries.pop(key, 0) + len(data))
+        self.disk_entries[key] = len(data)
+        self._evict()
+
+    def _touch(self, key):
+        if key in self.disk_entries:
+            self.disk_entries.move_to_end(key)
+            os.utime(self.entry_path(key)) # The next session's scan orders by this
+
+    def _evict(self):
+        disk_bytes = self.disk_bytes
+
+        while disk_bytes > self.max_disk_bytes and self.disk_entries:
+            key, size = self.disk_entries.popitem(last=False)
+            disk_bytes -= size
+
+            try:
+                os.remove(self.entry_path(key))
+            except FileNotFoundError:
+                pass
+
+        self._set_disk_bytes(disk_bytes)
+
+    def _set_disk_bytes(self, disk_bytes):
+        if disk_bytes != self.disk_bytes:
+            self.disk_bytes = disk_bytes
+            self.stats_changed.emit() # Queued over to the UI thread
+
+    def _run(self, operation, *args):
+        try:
+            operation(*args)
+        except Exception as e:
+            logging.error(f"Failed to update the lint cache: {e}.")
+
+    def close(self):
+        self.executor.shutdown(wait=True)
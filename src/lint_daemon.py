@@ -0,0 +1,175 @@
+import os, sys, json, itertools, logging
+
+from PyQt6.QtCore import QObject, QProcess, QTimer, QCoreApplication, pyqtSignal
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lint_server.py")
+MAX_ATTEMPTS = 2 # A job the server died on this many times is failed instead of being sent again
+RESTART_DELAY_MS = 250 # Wait before restarting a lost server, doubled with every loss until one comes up
+MAX_RESTART_DELAY_MS = 8000
+
+class LintDaemon(QObject):
+    """Runs pylint in one long-lived lint server process instead of a fresh interpreter per check, so a check costs
+    the analysis and not importing pylint and astroid again.
+
+    The server is started with the first job and restarted, after a growing delay, if it dies or fails to start;
+    jobs it had not answered are sent to the new one. Each job's pylint output comes back through finished, or what
+    went wrong through failed.
+    """
+
+    finished = pyqtSignal(int, str) # Job id, pylint output
+    failed = pyqtSignal(int, str) # Job id, error message
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = LintDaemon()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.stop)
+
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.process = None
+        self.buffer = b""
+        self.jobs = {} # Job id -> [request, attempts]; in flight until answered
+        self.job_ids = itertools.count(1)
+        self.pylint_version = None
+        self.config_files = None # Rc files the server found, as it reported when it came up
+        self.starts = 0
+        self.losses = 0 # Servers lost in a row, without one coming up in between
+        self.stopping = False
+
+        self.restart_timer = QTimer(self)
+        self.restart_timer.setSingleShot(True)
+        self.restart_timer.timeout.connect(self.start)
+
+    def lint(self, file_path, args=(), sys_path=(), document=None):
+        """Queues a pylint run over file_path, relative to the editor's working directory, with sys_path put in front
+        of the server's import path. A job for a document supersedes the document's earlier jobs. Returns the job
+        id."""
+        job_id = next(self.job_ids)
+        request = {"id": job_id, "path": file_path, "args": list(args), "sys_path": list(sys_path)}
+
+        if document is not None:
+            request["document"] = document
+
+            for earlier_id, (earlier, _) in list(self.jobs.items()):
+                if earlier.get("document") == document:
+                    del self.jobs[earlier_id] # The server drops it too, unless it is already running it
+
+        self.jobs[job_id] = [request, 0]
+
+        if self.process is None:
+            if not self.restart_timer.isActive():
+                self.start() # Sends every waiting job, this one included
+        else:
+            self._send(request)
+
+        return job_id
+
+    def cancel(self, job_id):
+        """Drops a job. One the server has already started still runs to the end, but nobody hears about it."""
+        if self.jobs.pop(job_id, None) is not None and self.process is not None:
+            self._send({"cancel": job_id})
+
+    def start(self):
+        self.starts += 1
+        self.stopping = False
+        self.buffer = b""
+
+        self.process = QProcess(self)
+        self.process.setProgram(sys.executable)
+        self.process.setArguments([SERVER_SCRIPT])
+        self.process.setWorkingDirectory(os.getcwd()) # Paths and pylintrc lookup as for a pylint run from here
+        self.process.readyReadStandardOutput.connect(self.on_output)
+        self.process.readyReadStandardError.connect(self.on_error_output)
+        self.process.finished.connect(self.on_exited)
+        self.process.errorOccurred.connect(self.on_process_error)
+        self.process.start()
+
+        if self.process is None:
+            return # Failed to start, and on_lost has dealt with it
+
+        logging.info(f"Started the lint server (start {self.starts}).")
+
+        for request, _ in self.jobs.values():
+            self._send(request)
+
+    def _send(self, request):
+        self.process.write((json.dumps(request) + "\n").encode("utf-8"))
+
+    def on_output(self):
+        self.buffer += bytes(self.process.readAllStandardOutput())
+
+        while b"\n" in self.buffer:
+            line, self.buffer = self.buffer.split(b"\n", 1)
+            message = json.loads(line)
+
+            if "ready" in message:
+                self.pylint_version = message["pylint"]
+                self.losses = 0
+                self.config_files = message.get("config_files", [])
+                continue
+
+            if self.jobs.pop(message["id"], None) is None:
+                continue
+
+            logging.debug(f"Lint job {message['id']} took {message['seconds'] * 1000:.0f} ms.")
+
+            if "error" in message:
+                self.failed.emit(message["id"], message["error"])
+            else:
+                self.finished.emit(message["id"], message["output"])
+
+    def on_error_output(self):
+        for line in bytes(self.process.readAllStandardError()).decode("utf-8", errors="replace").splitlines():
+            logging.debug(f"Lint server: {line}")
+
+    def on_exited(self, exit_code, exit_status):
+        if exit_status == QProcess.ExitStatus.CrashExit:
+            self.on_lost("the lint server crashed")
+        else:
+            self.on_lost(f"the lint server exited with code {exit_code}")
+
+    def on_process_error(self, error):
+        # A server that never started does not report finished; every other error is followed by it
+        if error == QProcess.ProcessError.FailedToStart and self.process is not None:
+            self.on_lost(f"the lint server failed to start ({self.process.errorString()})")
+
+    def on_lost(self, reason):
+        process, self.process = self.process, None
+        process.deleteLater()
+
+        if self.stopping:
+            return
+
+        logging.warning(f"Lost the lint server: {reason}.")
+
+        for job_id, job in list(self.jobs.items()):
+            job[1] += 1
+
+            if job[1] >= MAX_ATTEMPTS:
+                del self.jobs[job_id]
+                self.failed.emit(job_id, reason)
+
+        self.losses += 1
+
+        if self.jobs:
+            # Jobs still waiting go to a fresh server; otherwise the next job starts one
+            self.restart_timer.start(min(RESTART_DELAY_MS * 2 ** (self.losses - 1), MAX_RESTART_DELAY_MS))
+
+    def stop(self):
+        self.stopping = True
+        self.restart_timer.stop()
+
+        if self.process is None:
+            return
+
+        self.process.closeWriteChannel() # The server's loop ends with its stdin
+
+        if not self.process.waitForFinished(2000):
+            self.process.kill()
+            self.process.waitForFinished(1000)
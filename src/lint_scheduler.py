@@ -0,0 +1,206 @@
+import os, shutil, logging, tempfile
+
+from PyQt6.QtCore import QObject, QTimer, QCoreApplication, pyqtSignal
+
+from src.lint_cache import cache_key, config_digest
+from src.diagnostics import parse_pylint_json
+
+LINT_DELAY_MS = 750 # Typing pause after which a document is linted
+LINT_ARGS = ("--output-format=json",)
+
+class LintJob:
+    """A document version handed to the lint server."""
+
+    __slots__ = ("version", "key", "job_id", "scratch_dir", "key_parts")
+
+    def __init__(self, version, key, job_id, scratch_dir, key_parts=None):
+        self.version = version
+        self.key = key # Lint cache key of the text, None if it could not be known when the job was sent
+        self.job_id = job_id
+        self.scratch_dir = scratch_dir # Private directory holding the job's copy of the text
+        self.key_parts = key_parts # (text, file path, import path) to build the key from once the result is in
+
+class LintScheduler(QObject):
+    """Decides when each document of a window is linted.
+
+    Edits restart a per-document delay, so a document is linted once typing pauses. Every version is looked up in
+    the lint cache first; only misses go to the lint server, each in a scratch directory of its own. A newer version
+    supersedes a document's job that is still waiting, and results are only published while the version they were
+    computed for is still the document's current one.
+    """
+
+    results_ready = pyqtSignal(object, int, list) # EditorTab, document version, Diagnostics
+    failed = pyqtSignal(object, str) # EditorTab, error message
+
+    def __init__(self, daemon, cache, delay_ms=LINT_DELAY_MS, parent=None):
+        super().__init__(parent)
+
+        self.daemon = daemon
+        self.cache = cache
+        self.delay_ms = delay_ms
+        self.timers = {} # Tab -> debounce QTimer
+        self.jobs = {} # Tab -> LintJob in flight
+        self.tabs_by_job = {} # Job id -> tab
+        self.scratch_root = None # Created with the first job
+
+        self.daemon.finished.connect(self.on_finished)
+        self.daemon.failed.connect(self.on_failed)
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown)
+
+    @staticmethod
+    def is_lintable(tab):
+        return tab.materialized and not tab.disposed and not tab.large_file and not tab.is_loading and tab.language == "python"
+
+    def schedule(self, tab):
+        """Lints tab once it has not been edited for the delay."""
+        if not self.is_lintable(tab):
+            return
+
+        self.cancel(tab) # Its result would be for an outdated version anyway
+        timer = self.timers.get(tab)
+
+        if timer is None:
+            timer = self.timers[tab] = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.delay_ms)
+            timer.timeout.connect(lambda: self.lint(tab))
+
+        timer.start()
+
+    def lint(self, tab, force=False):
+        """Lints tab's current version now. force lints documents that are not Python as well."""
+        timer = self.timers.get(tab)
+
+        if timer is not None:
+            timer.stop()
+
+        if not (force and tab.materialized and not tab.disposed) and not self.is_lintable(tab):
+            return
+
+        version = tab.document.version
+        job = self.jobs.get(tab)
+
+        if job is not None and job.version == version:
+            return # Already on its way
+
+        self.cancel(tab)
+        text = tab.document.get_text() # The shadow copy, no round trip to the page
+        sys_path = self.import_path(tab)
+        key = self.cache_key(text, tab.file_path, sys_path)
+        output = self.cache.get(key) if key is not None else None
+
+        if output is not None:
+            self.publish(tab, version, output)
+
+            return
+
+        scratch_dir = tempfile.mkdtemp(prefix="job-", dir=self.scratch_directory())
+        scratch_path = os.path.join(scratch_dir, self.scratch_name(tab))
+
+        with open(scratch_path, 'w', encoding="utf-8", errors="surrogatepass", newline="") as file:
+            file.write(text)
+
+        job_id = self.daemon.lint(scratch_path, LINT_ARGS, sys_path=sys_path, document=tab.model_id)
+        self.jobs[tab] = LintJob(version, key, job_id, scratch_dir, (text, tab.file_path, sys_path) if key is None else None)
+        self.tabs_by_job[job_id] = tab
+
+    def cache_key(self, text, file_path, sys_path):
+        """The lint cache key, or None until the lint server has said which rc files it reads."""
+        if self.daemon.config_files is None:
+            return None
+
+        return cache_key(text, LINT_ARGS, file_path, sys_path, config_digest(self.daemon.config_files))
+
+    @staticmethod
+    def scratch_name(tab):
+        """The document's own file name, so pylint reports the module under its real name."""
+        name = os.path.basename(tab.file_path) or "untitled.py"
+
+        return name if name.endswith(".py") else name + ".py"
+
+    @staticmethod
+    def source_directory(tab):
+        return os.path.dirname(os.path.abspath(tab.file_path)) if tab.file_path else os.getcwd()
+
+    @classmethod
+    def import_path(cls, tab):
+        """Where tab's imports resolve from: its own directory, then the working directory the lint server runs in,
+        which is the project root that `python -m pylint` run from here would see. The server's own directory
+        comes after both."""
+        return list(dict.fromkeys([cls.source_directory(tab), os.getcwd()]))
+
+    def scratch_directory(self):
+        if self.scratch_root is None:
+            self.scratch_root = tempfile.mkdtemp(prefix="vscodeclone-lint-")
+
+        return self.scratch_root
+
+    def cancel(self, tab):
+        """Drops tab's job in flight, if any."""
+        job = self.jobs.pop(tab, None)
+
+        if job is None:
+            return
+
+        del self.tabs_by_job[job.job_id]
+        self.daemon.cancel(job.job_id)
+        shutil.rmtree(job.scratch_dir, ignore_errors=True)
+
+    def forget(self, tab):
+        """Stops everything scheduled for a tab that is being closed."""
+        self.cancel(tab)
+        timer = self.timers.pop(tab, None)
+
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+
+    def take_job(self, job_id):
+        tab = self.tabs_by_job.pop(job_id, None)
+
+        if tab is None:
+            return None, None
+
+        job = self.jobs.pop(tab)
+        shutil.rmtree(job.scratch_dir, ignore_errors=True)
+
+        return tab, job
+
+    def on_finished(self, job_id, output):
+        tab, job = self.take_job(job_id)
+
+        if tab is None:
+            return
+
+        key = job.key if job.key is not None else self.cache_key(*job.key_parts) # The server is up by now
+
+        if key is not None:
+            self.cache.put(key, output) # Valid for that text whether or not the document has moved on
+
+        if not tab.disposed and job.version == tab.document.version:
+            self.publish(tab, job.version, output)
+        else:
+            logging.debug(f"Dropped lint results for version {job.version} of {tab.model_id}.")
+
+    def publish(self, tab, version, output):
+        try:
+            diagnostics = parse_pylint_json(output, version)
+        except (ValueError, KeyError, TypeError) as e:
+            self.failed.emit(tab, f"unreadable pylint output ({e})")
+
+            return
+
+        self.results_ready.emit(tab, version, diagnostics)
+
+    def on_failed(self, job_id, error):
+        tab, job = self.take_job(job_id)
+
+        if tab is not None and not tab.disposed and job.version == tab.document.version:
+            self.failed.emit(tab, error)
+
+    def shutdown(self):
+        for tab in list(self.jobs):
+            self.cancel(tab)
+
+        if self.scratch_root is not None:
+            shutil.rmtree(self.scratch_root, ignore_errors=True)
@@ -0,0 +1,111 @@
+"""Lint server, started by LintDaemon as `python src/lint_server.py`.
+
+Imports pylint and astroid once, then takes jobs as JSON lines on stdin and answers each with a JSON line on stdout,
+so astroid's caches stay warm from one job to the next. Exits when stdin is closed.
+
+Jobs are run one at a time, oldest first. A job for a document replaces any job for the same document that has not
+started yet, and {"cancel": id} drops a job that has not started; neither kind of dropped job is answered.
+"""
+import os, io, sys, json, time, threading, contextlib
+
+from collections import OrderedDict
+
+import astroid
+import pylint
+
+from pylint.lint import Run
+
+class JobQueue:
+    """Requests read from stdin by a reader thread, waiting for the main thread to run them."""
+
+    def __init__(self):
+        self.jobs = OrderedDict() # Job id -> request
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def read(self, stream):
+        for line in stream:
+            request = json.loads(line)
+
+            with self.condition:
+                if "cancel" in request:
+                    self.jobs.pop(request["cancel"], None)
+                    continue
+
+                document = request.get("document")
+
+                if document is not None:
+                    for job_id, job in list(self.jobs.items()):
+                        if job.get("document") == document:
+                            del self.jobs[job_id] # Superseded
+
+                self.jobs[request["id"]] = request
+                self.condition.notify()
+
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def next(self):
+        """The oldest waiting request, or None once stdin is closed and nothing is left."""
+        with self.condition:
+            while not self.jobs and not self.closed:
+                self.condition.wait()
+
+            return self.jobs.popitem(last=False)[1] if self.jobs else None
+
+def config_files():
+    """The rc files pylint reads when started in this directory, for the editor's lint cache key."""
+    try:
+        from pylint.config.find_default_config_files import find_default_config_files
+    except ImportError:
+        return []
+
+    return [os.path.abspath(config_path) for config_path in find_default_config_files()]
+
+def forget_module(file_path):
+    """Drops astroid's tree of a file, which would otherwise stay cached for a file that is never linted again or
+    be reused for new content at the same path."""
+    file_path = os.path.abspath(file_path)
+
+    for name, module in list(astroid.MANAGER.astroid_cache.items()):
+        if module.file and os.path.abspath(module.file) == file_path:
+            del astroid.MANAGER.astroid_cache[name]
+
+def lint(file_path, args, sys_path):
+    output = io.StringIO()
+    original_sys_path = list(sys.path)
+    sys.path[:0] = sys_path # Where the document's own imports resolve from, the file itself being a scratch copy
+
+    try:
+        with contextlib.redirect_stdout(output): # Where the reporter chosen by --output-format writes
+            Run(args + [file_path], exit=False)
+    finally:
+        sys.path[:] = original_sys_path
+        forget_module(file_path)
+
+    return output.getvalue()
+
+def serve():
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w', buffering=1)
+    sys.stdout = sys.stderr # Whatever pylint or a plugin prints must stay out of the protocol
+
+    queue = JobQueue()
+    threading.Thread(target=queue.read, args=(sys.stdin,), daemon=True).start()
+
+    protocol.write(json.dumps({"ready": True, "pylint": pylint.__version__, "config_files": config_files()}) + "\n")
+
+    while (request := queue.next()) is not None:
+        started = time.perf_counter()
+        reply = {"id": request["id"]}
+
+        try:
+            reply["output"] = lint(request["path"], request.get("args", []), request.get("sys_path", []))
+        except (Exception, SystemExit) as e:
+            reply["error"] = str(e) or e.__class__.__name__
+
+        reply["seconds"] = time.perf_counter() - started
+        protocol.write(json.dumps(reply) + "\n")
+
+if __name__ == "__main__":
+    serve()
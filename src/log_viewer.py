@@ -0,0 +1,306 @@
+import re, mmap, logging
+
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QThread, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QIntValidator
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QListView, QLineEdit, QPushButton, QLabel
+
+SPARSE_STEP = 1024 # Only every 1024th line start is stored; the rest are found by scanning from the closest one
+PROGRESS_BYTES = 8 * 1024 * 1024 # How often the indexer reports new lines to the view
+MAX_LINE_CHARS = 10000 # Longer lines are cut off for display
+OFFSET_CACHE_SIZE = 4096
+SEARCH_SLICE_BYTES = 16 * 1024 * 1024 # A search runs over the file in slices of about this size, so it can be stopped
+SEARCH_OVERLAP_BYTES = 64 * 1024 # Matches spanning a slice boundary are found if they are at most this long
+
+class LineIndexer(QThread):
+    """Scans a mapped file for line breaks in the background, recording the start offset of every SPARSE_STEP-th line."""
+
+    progress = pyqtSignal(int) # Lines indexed so far
+
+    def __init__(self, mapped_file):
+        super().__init__()
+
+        self.mapped_file = mapped_file
+        self.checkpoints = array('Q', [0])
+        self.line_count = 0
+        self.indexed_bytes = 0
+
+    def run(self):
+        mapped_file = self.mapped_file
+        size = len(mapped_file)
+        position = 0
+        next_report = PROGRESS_BYTES
+        lines = 0
+
+        while position < size and not self.isInterruptionRequested():
+            newline = mapped_file.find(b"\n", position)
+            position = size if newline < 0 else newline + 1
+            lines += 1
+
+            if lines % SPARSE_STEP == 0 and position < size:
+                self.checkpoints.append(position)
+
+            if position >= next_report:
+                self.line_count, self.indexed_bytes = lines, position
+                self.progress.emit(lines)
+                next_report = position + PROGRESS_BYTES
+
+        self.line_count, self.indexed_bytes = lines, position
+        self.progress.emit(lines)
+
+class RegexSearchWorker(QThread):
+    """Runs a bytes regex over the mapped file from a given offset without copying it into memory.
+
+    The file is searched in slices that end at line breaks, checking for interruption between them. Each slice after
+    the first starts at a line start up to SEARCH_OVERLAP_BYTES back, so a match cut by a boundary is found whole.
+    """
+
+    found = pyqtSignal(int) # Byte offset of the match, or -1
+
+    def __init__(self, mapped_file, pattern, start_offset):
+        super().__init__()
+
+        self.mapped_file = mapped_file
+        self.pattern = pattern
+        self.start_offset = start_offset
+
+    def run(self):
+        mapped_file = self.mapped_file
+        size = len(mapped_file)
+        position = self.start_offset # Always a line start, where ^ matches
+
+        while position < size:
+            if self.isInterruptionRequested():
+                return
+
+            newline = mapped_file.find(b"\n", min(position + SEARCH_SLICE_BYTES, size))
+            end = size if newline < 0 else newline + 1
+            match = self.pattern.search(mapped_file, position, end)
+
+            if match:
+                self.found.emit(match.start())
+
+                return
+
+            overlap = mapped_file.rfind(b"\n", position, end - SEARCH_OVERLAP_BYTES)
+            position = overlap + 1 if overlap >= 0 else end
+
+        self.found.emit(-1)
+
+class LogViewModel(QAbstractListModel):
+    """Exposes the lines of a mapped file as rows. Only rows the view asks for are ever decoded."""
+
+    def __init__(self, mapped_file, indexer, parent=None):
+        super().__init__(parent)
+
+        self.mapped_file = mapped_file
+        self.indexer = indexer
+        self.rows = 0
+        self.offset_cache = OrderedDict() # Row -> start offset of recently resolved rows
+
+        self.indexer.progress.connect(self.on_lines_indexed)
+
+    def on_lines_indexed(self, line_count):
+        if line_count > self.rows:
+            self.beginInsertRows(QModelIndex(), self.rows, line_count - 1)
+            self.rows = line_count
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        start, end = self.line_span(index.row())
+        text = self.mapped_file[start:min(end, start + MAX_LINE_CHARS * 4)].decode("utf-8", errors="replace")
+
+        return text.rstrip("\r")[:MAX_LINE_CHARS]
+
+    def line_start(self, row):
+        """Start offset of a row, walking forward from the previous row or the closest checkpoint."""
+        start = self.offset_cache.get(row)
+
+        if start is not None:
+            return start
+
+        previous = self.offset_cache.get(row - 1)
+
+        if previous is not None and row % SPARSE_STEP:
+            start = self.mapped_file.find(b"\n", previous) + 1
+        else:
+            start = self.indexer.checkpoints[row // SPARSE_STEP]
+
+            for _ in range(row % SPARSE_STEP):
+                start = self.mapped_file.find(b"\n", start) + 1
+
+        self.offset_cache[row] = start
+
+        if len(self.offset_cache) > OFFSET_CACHE_SIZE:
+            self.offset_cache.popitem(last=False)
+
+        return start
+
+    def line_span(self, row):
+        start = self.line_start(row)
+        end = self.mapped_file.find(b"\n", start)
+
+        return start, len(self.mapped_file) if end < 0 else end
+
+    def row_at_offset(self, offset):
+        """Line number (0-based) containing the given byte offset."""
+        checkpoints = self.indexer.checkpoints
+        block = bisect_right(checkpoints, offset) - 1
+        row = block * SPARSE_STEP
+        position = checkpoints[block]
+
+        while True:
+            newline = self.mapped_file.find(b"\n", position, offset)
+
+            if newline < 0:
+                return row
+
+            row += 1
+            position = newline + 1
+
+class LogViewer(QWidget):
+    """Read-only tab for multi-gigabyte files. The file is memory-mapped and only the visible lines are decoded."""
+
+    def __init__(self, parent, file_path):
+        super().__init__(parent)
+
+        self.setObjectName("LogViewer")
+
+        self.file_path = file_path
+        self.file = open(file_path, 'rb')
+        self.mapped_file = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.search_worker = None
+        self.disposed = False # Signals queued by the workers may still arrive after the file is unmapped
+
+        self.indexer = LineIndexer(self.mapped_file)
+        self.model = LogViewModel(self.mapped_file, self.indexer, self)
+
+        self.view = QListView(self)
+        self.view.setObjectName("LogView")
+        self.view.setUniformItemSizes(True) # Lets the view lay out millions of rows without measuring them
+        self.view.setFont(QFont("Consolas", 10))
+        self.view.setModel(self.model)
+
+        self.goto_line_edit = QLineEdit(self)
+        self.goto_line_edit.setPlaceholderText("Go to line")
+        self.goto_line_edit.setValidator(QIntValidator(1, 2 ** 31 - 1, self))
+        self.goto_line_edit.setFixedWidth(120)
+        self.goto_line_edit.returnPressed.connect(self.go_to_line)
+
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setPlaceholderText("Search (regular expression)")
+        self.search_edit.returnPressed.connect(self.find_next)
+
+        self.find_next_button = QPushButton("Find Next", self)
+        self.find_next_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.find_next_button.clicked.connect(self.find_next)
+
+        self.status_label = QLabel("Indexing...", self)
+
+        toolbar = QHBoxLayout()
+        toolbar.setContentsMargins(8, 4, 8, 4)
+        toolbar.addWidget(self.goto_line_edit)
+        toolbar.addWidget(self.search_edit, 1)
+        toolbar.addWidget(self.find_next_button)
+        toolbar.addWidget(self.status_label)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addLayout(toolbar)
+        layout.addWidget(self.view)
+
+        self.indexer.progress.connect(self.on_lines_indexed)
+        self.indexer.start()
+
+        logging.info(f"Opened {file_path} ({len(self.mapped_file) // (1024 * 1024)} MB) in the log viewer.")
+
+    def on_lines_indexed(self, line_count):
+        if self.disposed:
+            return
+
+        total_bytes = len(self.mapped_file)
+        percent = 100 * self.indexer.indexed_bytes // total_bytes if total_bytes else 100
+        self.status_label.setText(f"{line_count:,} lines" + ("" if percent >= 100 else f" ({percent}% indexed)"))
+
+    def go_to_line(self):
+        line = int(self.goto_line_edit.text() or 0)
+
+        if not 1 <= line <= self.model.rowCount():
+            self.status_label.setText(f"Line {line} is not indexed yet." if self.indexer.isRunning() else f"No line {line}.")
+
+            return
+
+        self.select_row(line - 1)
+
+    def select_row(self, row):
+        index = self.model.index(row)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QListView.ScrollHint.PositionAtCenter)
+
+    def find_next(self):
+        """Searches forward from the end of the current line."""
+        if self.search_worker is not None or not self.search_edit.text():
+            return
+
+        try:
+            pattern = re.compile(self.search_edit.text().encode("utf-8"), re.MULTILINE)
+        except re.error as e:
+            self.status_label.setText(f"Invalid pattern: {e}.")
+
+            return
+
+        current = self.view.currentIndex()
+        start_offset = self.model.line_span(current.row())[1] + 1 if current.isValid() else 0
+
+        self.status_label.setText("Searching...")
+        self.search_worker = RegexSearchWorker(self.mapped_file, pattern, start_offset)
+        self.search_worker.found.connect(self.on_match_found)
+        self.search_worker.finished.connect(self.search_worker.deleteLater)
+        self.search_worker.start()
+
+    def on_match_found(self, offset):
+        self.search_worker = None
+
+        if self.disposed:
+            return
+
+        if offset < 0:
+            self.status_label.setText("No more matches.")
+
+            return
+
+        row = self.model.row_at_offset(offset)
+
+        if row >= self.model.rowCount():
+            self.status_label.setText(f"Match on line {row + 1:,}, which is not indexed yet.")
+
+            return
+
+        self.status_label.setText(f"Match on line {row + 1:,}.")
+        self.select_row(row)
+
+    def dispose(self):
+        """Stops the background work and unmaps the file."""
+        self.disposed = True
+        self.indexer.progress.disconnect()
+        self.indexer.requestInterruption()
+        self.indexer.wait()
+
+        if self.search_worker is not None:
+            self.search_worker.found.disconnect()
+            self.search_worker.requestInterruption() # Stops it after the slice it is in
+            self.search_worker.wait()
+
+        self.view.setModel(None)
+        self.mapped_file.close()
+        self.file.close()
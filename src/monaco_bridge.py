@@ -0,0 +1,29 @@
+import json
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+class MonacoBridge(QObject):
+    """Object published to the Monaco page over QWebChannel. The page calls its slots as events happen,
+    and they are re-emitted as signals so Python never has to poll the page."""
+
+    ready = pyqtSignal()
+    content_changed = pyqtSignal(str, int, int, str, bool, list) # Model id, version id, alternative version id, model EOL, is flush, changes
+    cursor_changed = pyqtSignal(str, int, int) # Model id, line, column
+    chunk_appended = pyqtSignal(str) # Model id
+
+    @pyqtSlot()
+    def notifyReady(self):
+        self.ready.emit()
+
+    @pyqtSlot(str, int, int, str, bool, str)
+    def notifyContentChanged(self, model_id, version_id, alternative_version_id, eol, is_flush, changes):
+        # Changes arrive as one JSON array of [start line, start column, end line, end column, text]
+        self.content_changed.emit(model_id, version_id, alternative_version_id, eol, is_flush, json.loads(changes))
+
+    @pyqtSlot(str, int, int)
+    def notifyCursorChanged(self, model_id, line, column):
+        self.cursor_changed.emit(model_id, line, column)
+
+    @pyqtSlot(str)
+    def notifyChunkAppended(self, model_id):
+        self.chunk_appended.emit(model_id)
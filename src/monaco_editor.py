@@ -1,207 +1,337 @@
-import os, json, logging
+import os, json, time, psutil, itertools, logging
 
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QUrl, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile
+from PyQt6.QtWebEngineCore import QWebEnginePage
+from PyQt6.QtWebChannel import QWebChannel
+
+from src.monaco_scheme import monaco_base_url, MONACO_LOCAL_URL
+from src.editor_profile import editor_profile, boot_kind
+from src.monaco_bridge import MonacoBridge
 
 logging.basicConfig(level=logging.DEBUG, format="[%(asctime)s] [%(levelname)s] - %(message)s", datefmt="%d/%m/%Y %H:%M:%S")
 
+HTML_PATH = "html/monaco_editor.html"
+FRAME_INTERVAL_MS = 16 # Queued commands are sent to the page at most once per frame
+
+# Maps file extensions to Monaco language ids
+MONACO_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".html": "html",
+    ".css": "css",
+    ".qss": "css",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".md": "markdown",
+    ".json": "json",
+}
+
+def model_language(file_path):
+    """Monaco language id for a file; untitled documents keep the editor's historical Python default."""
+    if not file_path:
+        return "python"
+
+    return MONACO_LANGUAGES.get(os.path.splitext(file_path)[1].lower(), "plaintext")
+
 class MonacoEditor(QWebEngineView):
-    def __init__(self, parent, object_name="MonacoEditor", font="Consolas", font_size=11, content=None, theme="vs-light", file_path=None):
+    """A Monaco page that can host any number of text models, one of them attached to the editor at a time."""
+
+    ready = pyqtSignal()
+
+    def __init__(self, parent, object_name="MonacoEditor", font="Consolas", font_size=11, theme="vs-light"):
         super().__init__(parent)
 
-        profile = QWebEngineProfile.defaultProfile()
-        profile.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-        profile.settings().setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
-        profile.settings().setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
-        profile.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
+        # All editors in all windows share one persistent profile, so Monaco is cached and compiled once
+        self.setPage(QWebEnginePage(editor_profile(), self))
 
         self.setObjectName(object_name)
         self.setFont(QFont(font, font_size))
         self.loadFinished.connect(self.setup_monaco_editor)
 
         self.monaco_ready = False
-        self.retry_count = 0
-        self.max_retries = 5
         self.theme = theme
 
-        if content:
-            self.content = content
-            QTimer.singleShot(1000, lambda: self.set_content(content))
+        # The page pushes readiness, edits and cursor moves through this bridge instead of being polled
+        self.bridge = MonacoBridge(self)
+        self.bridge.ready.connect(self.on_monaco_ready)
+        self.channel = QWebChannel(self.page())
+        self.channel.registerObject("bridge", self.bridge)
+        self.page().setWebChannel(self.channel)
+
+        self.models = {} # Maps model ids to the file path they were opened for
+        self.active_model_id = None
+        self.command_queue = {} # Key -> (script, callback) of the operations not yet sent to the page, in order
+        self.command_ids = itertools.count() # Keys of operations queued without one, which never replace each other
+        self.ops_submitted = 0
+        self.scripts_issued = 0
 
-        self.file_path = file_path or ""
-        self.folder_path = os.path.dirname(self.file_path).split('/')[-1]
-        self.file_name = os.path.basename(self.file_path)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_commands)
 
-        self.setHtml(self.create_editor_html())
+        self.created_at = time.perf_counter()
+        self.ready_time = None # Seconds from construction until Monaco reported ready
 
-    def create_editor_html(self):
-        """Generates the HTML needed to initialize Monaco editor."""
-        with open("D:/Projects/GitHub/VSCodeClone/html/monaco_editor.html", 'r') as file:
+        base_url = monaco_base_url()
+
+        # Pages served from the local scheme share its origin, so Monaco can spawn its web workers
+        self.setHtml(self.create_editor_html(base_url), QUrl(base_url + "/") if base_url == MONACO_LOCAL_URL else QUrl())
+
+    def create_editor_html(self, base_url):
+        """Generates the HTML needed to initialize Monaco editor, loading Monaco from base_url."""
+        with open(HTML_PATH, 'r') as file:
             html_content = file.read()
 
-        return html_content
+        return html_content.replace("{{MONACO_BASE_URL}}", base_url)
 
-    def setup_monaco_editor(self):
+    def setup_monaco_editor(self, ok):
         """This method will be called when the page finishes loading"""
-        logging.debug("Monaco Editor has finished loading.")
+        if ok:
+            logging.debug("Monaco Editor page has finished loading.")
+        else:
+            logging.error("Failed to load the Monaco Editor page.")
 
-        self.check_monaco_ready()
+    def on_monaco_ready(self):
+        """Called through the bridge as soon as both Monaco and the web channel are up."""
+        if self.monaco_ready:
+            return
 
-    def check_monaco_ready(self):
-        """Checks if Monaco editor is ready by running JavaScript."""
-        self.page().runJavaScript(
-            """
-                function checkMonacoReady() {
-                    if (window.monacoReady) {
-                        return 'ready';
-                    }
-                    return 'not_ready';
-                }
-                checkMonacoReady();
-            """, self.on_monaco_ready
-        )
+        self.monaco_ready = True
+        self.ready_time = time.perf_counter() - self.created_at
 
-    def on_monaco_ready(self, result):
-        """Callback for when Monaco is ready."""
-        if result == "ready":
-            logging.info("Monaco Editor is fully initialized.")
-            
-            self.monaco_ready = True
+        logging.info(f"Monaco Editor is fully initialized in {self.ready_time * 1000:.0f} ms ({boot_kind()} boot).")
 
-            if hasattr(self, 'content'):
-                self.set_content(self.content) # Set initial content once Monaco is ready
-        else:
-            logging.warning("Monaco Editor is not ready yet. Retrying...")
+        if "theme" not in self.command_queue:
+            self.command_queue = {"theme": (f"monaco.editor.setTheme({json.dumps(self.theme)});", None), **self.command_queue}
 
-            self.retry_count += 1
+        # Everything requested while the page was still loading goes out now, in order
+        self.flush_commands()
 
-            if self.retry_count < self.max_retries:
-                QTimer.singleShot(1000 * self.retry_count, self.check_monaco_ready)
-            else:
-                logging.error("Failed to initialize Monaco Editor after multiple retries.")
+        self.ready.emit()
 
-    def on_content_received(self, content):
-        """Handles the content returned from Monaco editor."""
-        logging.debug(f"Received content: {content}.")
+    def _run_script(self, js_code, callback=None, key=None):
+        """Queues a script for the next frame. A script with a key replaces any queued script with the same key, and
+        is queued after everything queued before it, like any other."""
+        self.ops_submitted += 1
 
-        return content
+        if key is None:
+            key = next(self.command_ids)
+        else:
+            self.command_queue.pop(key, None) # Running it where the older one was could put it before a close_model
 
-    def is_modified(self):
-        """Check if Monaco editor content is modified by querying the JS flag."""
-        self.page().runJavaScript(
-            """
-                function isModified() {
-                    if (window.isModified) {
-                        return true;
-                    }
-                    return false;
-                }
-                isModified();
-            """, self._on_is_modified
-        )
+        self.command_queue[key] = (js_code, callback)
 
-    def _on_is_modified(self, result):
-        self.is_modified = result
-        logging.debug(f"Monaco content modified: {self.is_modified}")
+        if self.monaco_ready and not self.flush_timer.isActive():
+            self.flush_timer.start()
 
-    def get_content(self, callback, file_path, retry_count=0):
-        """Retrieves content from the Monaco editor and calls the provided callback."""
+    def flush_commands(self):
+        """Sends the queued operations as few scripts as possible: one, unless some operations need their result
+        back, in which case each of those ends a script so its value is what the callback receives."""
         if not self.monaco_ready:
-            if retry_count < self.max_retries:
-                logging.warning("Monaco Editor is not ready. Retrying to get content...")
-                QTimer.singleShot(1000, lambda: self.get_content(callback, retry_count + 1))
+            return # Flushed once the page reports ready
+
+        queue, self.command_queue = self.command_queue, {}
+        batch = []
+
+        for js_code, callback in queue.values():
+            if callback:
+                # The script's value is the value of its last statement, so this one goes unwrapped at the end
+                self._issue_script("\n".join(batch + [js_code]), callback)
+                batch = []
             else:
-                logging.error("Failed to get content after multiple retries.")
+                # One failing operation must not keep the rest of the frame from running
+                batch.append(f"try {{ {js_code} }} catch (e) {{ console.error(e); }}")
+
+        if batch:
+            self._issue_script("\n".join(batch))
 
+    def _issue_script(self, js_code, callback=None):
+        self.scripts_issued += 1
+
+        if callback:
+            self.page().runJavaScript(js_code, callback)
+        else:
+            self.page().runJavaScript(js_code)
+
+    def _model_ref(self, model_id):
+        """Returns a JS expression resolving to the given model, or the attached one if model_id is None."""
+        return f"getModel({json.dumps(model_id)})"
+
+    def open_model(self, model_id, content="", file_path=None):
+        """Creates a text model for a document inside this page without attaching it to the editor."""
+        if model_id in self.models:
             return
 
-        js_code = """
-            var model = monaco.editor.getModels()[0]; // Get the first editor model
-            model.getValue(); // Get content from the model
-        """
+        file_path = file_path or ""
+        self.models[model_id] = file_path
 
-        return self.page().runJavaScript(js_code, lambda result: callback(result, file_path))
+        language = model_language(file_path)
+        folder_name = os.path.basename(os.path.dirname(file_path)) or "Unknown Folder"
+        file_name = os.path.basename(file_path) or model_id
 
-    def append_content(self, additional_content, retry_count=0):
-        """Appends content to the Monaco editor's current content."""
-        if not self.monaco_ready:
-            if retry_count < self.max_retries:
-                logging.warning("Monaco Editor is not ready. Retrying to append content...")
-                QTimer.singleShot(1000, lambda: self.append_content(additional_content, retry_count + 1))
-            else:
-                logging.error("Failed to append content after multiple retries.")
+        self._run_script(
+            f"openModel({json.dumps(model_id)}, {json.dumps(content)}, {json.dumps(language)}, "
+            f"{json.dumps(folder_name)}, {json.dumps(file_name)});"
+        )
+
+    def activate_model(self, model_id):
+        """Attaches the given model to the editor, restoring its cursor and scroll position."""
+        if model_id not in self.models:
+            logging.error(f"Cannot activate unknown model {model_id}.")
 
             return
-        
-        # Escape the content properly using json.dumps() to handle special characters
-        additional_content = json.dumps(additional_content)
-        
+
+        self.active_model_id = model_id
+        self._run_script(f"activateModel({json.dumps(model_id)});")
+
+    def close_model(self, model_id):
+        """Disposes the given model and everything the page tracked for it."""
+        if self.models.pop(model_id, None) is None:
+            return
+
+        if self.active_model_id == model_id:
+            self.active_model_id = None
+
+        self._run_script(f"closeModel({json.dumps(model_id)});")
+
+    def set_breadcrumb_scope(self, model_id, scope):
+        """Shows the names of the symbols around the cursor in the model's breadcrumbs."""
+        self._run_script(f"setBreadcrumbScope({json.dumps(model_id)}, {json.dumps(scope)});", key=f"breadcrumbs:{model_id}")
+
+    def set_folding_ranges(self, model_id, ranges):
+        """Replaces the model's folding ranges with (start line, end line) pairs from the outline."""
+        self._run_script(f"setFoldingRanges({json.dumps(model_id)}, {json.dumps(ranges)});", key=f"folding:{model_id}")
+
+    def reveal_line(self, model_id, line, column=1):
+        self._run_script(f"revealModelLine({json.dumps(model_id)}, {int(line)}, {int(column)});")
+
+    def snapshot_model(self, model_id, callback):
+        """Passes a JSON snapshot of the model's view state and breakpoints to the callback."""
+        self._run_script(f"snapshotModel({json.dumps(model_id)});", callback)
+
+    def restore_model(self, model_id, snapshot):
+        """Reapplies a snapshot taken by snapshot_model to a freshly reopened model."""
+        self._run_script(f"restoreModel({json.dumps(model_id)}, {json.dumps(snapshot)});")
+
+    def renderer_memory(self):
+        """Resident memory of the page's renderer process in bytes, or 0 if it cannot be read."""
+        try:
+            return psutil.Process(self.page().renderProcessPid()).memory_info().rss
+        except (psutil.Error, ValueError):
+            return 0
+
+    def discard(self):
+        """Releases the page's renderer state. The page reloads Monaco when it is woken up again."""
+        self.monaco_ready = False
+        self.models.clear()
+        self.active_model_id = None
+        self.command_queue.clear()
+        self.flush_timer.stop()
+
+        self.page().setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+        self.page().setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+
+    def wake(self):
+        if self.page().lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            self.created_at = time.perf_counter()
+            self.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def on_content_received(self, content):
+        """Handles the content returned from Monaco editor."""
+        logging.debug(f"Received content: {content}.")
+
+        return content
+
+    def get_content(self, callback, file_path, model_id=None):
+        """Retrieves content from a Monaco model and calls the provided callback."""
         js_code = f"""
-            var model = monaco.editor.getModels()[0];  // Get the first editor model
-            var currentContent = model.getValue();  // Get the current content
-            model.setValue(currentContent + {additional_content});  // Append the new content
+            var model = {self._model_ref(model_id)};
+            model ? model.getValue() : null; // Get content from the model
         """
-    
-        self.page().runJavaScript(js_code)
 
-    def set_content(self, content, retry_count=0):
-        if not self.monaco_ready:
-            if retry_count < self.max_retries:
-                logging.warning("Monaco Editor is not ready. Retrying to set content...")
-                QTimer.singleShot(1000, lambda: self.set_content(content, retry_count + 1))
-            else:
-                logging.error("Failed to set content after multiple retries.")
+        self._run_script(js_code, lambda result: callback(result, file_path))
 
-            return
+    def append_content(self, additional_content, model_id=None):
+        """Appends content to a Monaco model's current content."""
+        # An edit at the end of the model, rather than reading the whole value back and setting it again
+        self._run_script(f"appendToModel({json.dumps(model_id)}, {json.dumps(additional_content)});")
 
+    def set_content(self, content, model_id=None):
+        """Replaces a Monaco model's content."""
         # Ensure that the content is safely escaped, handling quotes and newlines
         escaped_content = json.dumps(content)
 
-        js_code = f"""
-            var model = monaco.editor.getModels()[0];  // Get the first editor model
-            model.setValue({escaped_content});  // Set content in the model
-        """
-        
-        self.page().runJavaScript(js_code)
+        js_code = f"setModelValue({json.dumps(model_id)}, {escaped_content});"
+
+        self._run_script(js_code)
+
+    def begin_stream(self, model_id, large_file=False):
+        """Empties a model before a file is streamed into it; large files get the large-file mode."""
+        self._run_script(f"beginModelStream({json.dumps(model_id)}, {json.dumps(large_file)});")
+
+    def append_chunk(self, chunk, model_id):
+        """Appends one streamed chunk at the end of a model. The page reports it through bridge.chunk_appended once
+        it is in."""
+        self._run_script(f"appendModelChunk({json.dumps(model_id)}, {json.dumps(chunk)});")
+
+    def end_stream(self, model_id):
+        self._run_script(f"endModelStream({json.dumps(model_id)});")
+
+    def apply_edits(self, model_id, edits):
+        """Replaces ranges of a model, given as (start line, start column, end line, end column, text) in the model as
+        it is now, as one undoable edit."""
+        self._run_script(f"applyModelEdits({json.dumps(model_id)}, {json.dumps(edits)});")
+
+    def set_markers(self, model_id, owner, markers):
+        """Replaces the markers an owner has on a model. Only the latest set within a frame is sent."""
+        self._run_script(f"setModelMarkers({json.dumps(model_id)}, {json.dumps(owner)}, {json.dumps(markers)});",
+                         key=f"markers:{owner}:{model_id}")
+
+    def set_model_format(self, model_id, language, insert_spaces, tab_size):
+        """Applies a sniffed language and indentation to a model."""
+        self._run_script(
+            f"""
+                var model = {self._model_ref(model_id)};
+
+                if (model) {{
+                    monaco.editor.setModelLanguage(model, {json.dumps(language)});
+                    model.updateOptions({{ insertSpaces: {json.dumps(insert_spaces)}, tabSize: {int(tab_size)} }});
+                }}
+            """,
+            key=f"format:{model_id}"
+        )
 
     def set_font(self, font, size):
         """Sets the font for the Monaco editor."""
-        if not self.monaco_ready:
-            logging.error("Monaco Editor is not ready. Cannot set font.")
-
-            return
-        
-        self.page().runJavaScript(
+        self._run_script(
             f"""
-                document.getElementById('container').style.fontFamily = '{font}';
-                document.getElementById('container').style.fontSize = '{size}px';
-            """
+                document.getElementById('container').style.fontFamily = {json.dumps(font)};
+                document.getElementById('container').style.fontSize = '{int(size)}px';
+            """,
+            key="font"
         )
 
         logging.info(f"Font set to: {font}.")
 
     def set_theme(self, theme):
         """Dynamically changes the Monaco Editor theme."""
-        if not self.monaco_ready:
-            logging.error("Monaco Editor is not ready. Cannot set theme.")
-
-            return
-        
         self.theme = theme
-        self.page().runJavaScript(f"monaco.editor.setTheme('{theme}');")
+        self._run_script(f"monaco.editor.setTheme({json.dumps(theme)});", key="theme")
 
         logging.info(f"Theme set to: {theme}.")
 
     def resize_monaco_editor(self):
         """Resizes Monaco editor when the parent widget is resized."""
-        self.page().runJavaScript(
+        self._run_script(
             """
                 if (window.monacoEditor) {
                     window.monacoEditor.layout();  // Adjust Monaco editor size to match the container's new size
                 }
-            """
+            """,
+            key="layout"
         )
 
     def resizeEvent(self, event):
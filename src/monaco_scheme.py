@@ -0,0 +1,118 @@
+import os, sys, zipfile, mimetypes, logging
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import QBuffer, QIODevice
+from PyQt6.QtWebEngineCore import QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+
+SCHEME_NAME = b"vsclone"
+MONACO_HOST = "monaco"
+MONACO_VERSION = "0.52.0"
+MONACO_ARCHIVE = f"resources/monaco/monaco-editor-{MONACO_VERSION}.zip"
+MONACO_CDN_URL = f"https://cdnjs.cloudflare.com/ajax/libs/monaco-editor/{MONACO_VERSION}/min/vs"
+MONACO_LOCAL_URL = f"{SCHEME_NAME.decode()}://{MONACO_HOST}/vs"
+MAX_CACHE_BYTES = 32 * 1024 * 1024 # Budget for decompressed assets kept in memory
+
+def register_monaco_scheme():
+    """Registers the vsclone:// scheme. Must be called before the QApplication is created."""
+    scheme = QWebEngineUrlScheme(SCHEME_NAME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setDefaultPort(QWebEngineUrlScheme.SpecialPort.PortUnspecified)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme | QWebEngineUrlScheme.Flag.LocalAccessAllowed | QWebEngineUrlScheme.Flag.CorsEnabled)
+
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+def is_local_monaco_available():
+    return os.path.isfile(MONACO_ARCHIVE)
+
+def monaco_base_url():
+    """Returns where the editor page should load Monaco from: the packed archive if present, the CDN otherwise."""
+    return MONACO_LOCAL_URL if is_local_monaco_available() else MONACO_CDN_URL
+
+def install_monaco_scheme_handler(profile):
+    """Installs the archive-backed handler on the given profile, once."""
+    if profile.urlSchemeHandler(SCHEME_NAME) is not None or not is_local_monaco_available():
+        return
+
+    profile.installUrlSchemeHandler(SCHEME_NAME, MonacoSchemeHandler(MONACO_ARCHIVE, profile))
+
+class MonacoSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves vsclone://monaco/<path> out of a single zip archive, keeping recently served assets in memory."""
+
+    def __init__(self, archive_path, parent=None):
+        super().__init__(parent)
+
+        self.archive = zipfile.ZipFile(archive_path)
+        self.members = set(self.archive.namelist())
+        self.cache = OrderedDict() # Archive member -> bytes, least recently used first
+        self.cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        logging.info(f"Serving Monaco from '{archive_path}' ({len(self.members)} files).")
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        member = url.path().lstrip('/')
+
+        if url.host() != MONACO_HOST or member not in self.members:
+            logging.warning(f"Monaco asset not found: {url.toString()}.")
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+
+            return
+
+        data = self.read_member(member)
+        content_type = mimetypes.guess_type(member)[0] or "application/octet-stream"
+
+        # The buffer is parented to the job so it lives exactly as long as the request does
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+
+        job.reply(content_type.encode(), buffer)
+
+    def read_member(self, member):
+        """Returns the member's bytes, from the cache when possible."""
+        data = self.cache.get(member)
+
+        if data is not None:
+            self.hits += 1
+            self.cache.move_to_end(member)
+
+            return data
+
+        self.misses += 1
+        data = self.archive.read(member)
+
+        if len(data) <= MAX_CACHE_BYTES:
+            self.cache[member] = data
+            self.cache_bytes += len(data)
+
+            while self.cache_bytes > MAX_CACHE_BYTES:
+                _, evicted = self.cache.popitem(last=False)
+                self.cache_bytes -= len(evicted)
+
+        return data
+
+def pack_monaco_archive(package_dir, archive_path=MONACO_ARCHIVE):
+    """Packs the min/vs tree of an extracted monaco-editor npm package into the archive served by the handler."""
+    source_dir = os.path.join(package_dir, "min", "vs")
+
+    if not os.path.isdir(source_dir):
+        raise FileNotFoundError(f"'{source_dir}' does not exist. Pass the extracted monaco-editor package directory.")
+
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+
+    with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for root, _, files in os.walk(source_dir):
+            for file_name in files:
+                file_path = os.path.join(root, file_name)
+                member = os.path.relpath(file_path, os.path.dirname(source_dir)).replace("\\", "/")
+                archive.write(file_path, member)
+
+    logging.info(f"Packed Monaco from '{source_dir}' into '{archive_path}'.")
+
+if __name__ == "__main__":
+    # Usage: python -m src.monaco_scheme path/to/extracted/monaco-editor/package
+    logging.basicConfig(level=logging.INFO)
+    pack_monaco_archive(sys.argv[1])
@@ -0,0 +1,298 @@
+import re, ast, queue, logging
+
+from PyQt6.QtCore import QThread, QCoreApplication, pyqtSignal
+
+BLOCK_CONTINUATIONS = ("else", "elif", "except", "finally", "case") # Column-0 lines that belong to the block above
+MAX_BLOCK_MERGE = 8 # Blocks tried together before an unparsable block is scanned line by line instead
+DEFINITION = re.compile(r"^([ \t]*)(?:async[ \t]+)?(def|class)[ \t]+(\w+)")
+
+class OutlineSymbol:
+    """A class or function, spanning 1-based lines start_line to end_line inclusive."""
+
+    __slots__ = ("name", "kind", "start_line", "end_line", "children")
+
+    def __init__(self, name, kind, start_line, end_line, children=None):
+        self.name = name
+        self.kind = kind # "class" or "function"
+        self.start_line = start_line
+        self.end_line = end_line
+        self.children = children or []
+
+    def shifted(self, offset):
+        """Copy of the symbol and its children moved down by offset lines."""
+        if not offset:
+            return self
+
+        return OutlineSymbol(self.name, self.kind, self.start_line + offset, self.end_line + offset,
+                             [child.shifted(offset) for child in self.children])
+
+class IntervalTree:
+    """Centered interval tree over closed [start, end] intervals. Finding the k intervals containing a point costs
+    O(log n + k)."""
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals):
+        """intervals: non-empty list of (start, end, value) tuples."""
+        points = sorted(point for start, end, _ in intervals for point in (start, end))
+        self.center = points[len(points) // 2]
+
+        left = [interval for interval in intervals if interval[1] < self.center]
+        right = [interval for interval in intervals if interval[0] > self.center]
+        overlapping = [interval for interval in intervals if interval[0] <= self.center <= interval[1]]
+
+        self.by_start = sorted(overlapping, key=lambda interval: interval[0])
+        self.by_end = sorted(overlapping, key=lambda interval: interval[1], reverse=True)
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    def query(self, point):
+        """Values of all intervals containing point."""
+        found = []
+        node = self
+
+        while node is not None:
+            if point < node.center:
+                for start, _, value in node.by_start:
+                    if start > point:
+                        break
+
+                    found.append(value)
+
+                node = node.left
+            elif point > node.center:
+                for _, end, value in node.by_end:
+                    if end < point:
+                        break
+
+                    found.append(value)
+
+                node = node.right
+            else:
+                found.extend(value for _, _, value in node.by_start)
+                break
+
+        return found
+
+class OutlineIndex:
+    """The symbols and folding ranges of one version of a document."""
+
+    def __init__(self, version, symbols, folding_ranges):
+        self.version = version
+        self.symbols = symbols # Top-level symbols; nested ones hang off their parents
+        self.folding_ranges = folding_ranges # (start line, end line) pairs
+        self.tree = None
+
+        intervals = [(symbol.start_line, symbol.end_line, symbol) for symbol in self.walk()]
+
+        if intervals:
+            self.tree = IntervalTree(intervals)
+
+    def walk(self):
+        return walk_symbols(self.symbols)
+
+    def scope_at(self, line):
+        """Symbols enclosing a 1-based line, outermost first."""
+        if self.tree is None:
+            return []
+
+        return sorted(self.tree.query(line), key=lambda symbol: (symbol.start_line, -symbol.end_line))
+
+def walk_symbols(symbols):
+    """All symbols in document order, nested ones included."""
+    stack = list(reversed(symbols))
+
+    while stack:
+        symbol = stack.pop()
+        yield symbol
+        stack.extend(reversed(symbol.children))
+
+def collect_outline(node, symbols, folding_ranges):
+    """Appends the classes and functions under an ast node to symbols, and every multi-line compound statement
+    to folding_ranges."""
+    for child in ast.iter_child_nodes(node):
+        if not isinstance(child, ast.stmt):
+            continue
+
+        if hasattr(child, "body") and child.end_lineno > child.lineno:
+            folding_ranges.append((child.lineno, child.end_lineno))
+
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            kind = "class" if isinstance(child, ast.ClassDef) else "function"
+            symbol = OutlineSymbol(child.name, kind, child.lineno, child.end_lineno)
+            collect_outline(child, symbol.children, folding_ranges)
+            symbols.append(symbol)
+        else:
+            collect_outline(child, symbols, folding_ranges) # Definitions inside if/try/with bodies
+
+def scan_outline(lines):
+    """Indentation-based fallback for code that does not parse, e.g. while a definition is being typed."""
+    symbols, stack = [], [] # stack: (indentation, symbol) of the definitions still open
+
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        indentation = len(line) - len(line.lstrip())
+
+        while stack and stack[-1][0] >= indentation:
+            stack.pop()
+
+        for _, symbol in stack:
+            symbol.end_line = line_number
+
+        match = DEFINITION.match(line)
+
+        if match:
+            symbol = OutlineSymbol(match.group(3), "class" if match.group(2) == "class" else "function", line_number, line_number)
+            (stack[-1][1].children if stack else symbols).append(symbol)
+            stack.append((indentation, symbol))
+
+    return symbols, [(symbol.start_line, symbol.end_line) for symbol in walk_symbols(symbols) if symbol.end_line > symbol.start_line]
+
+def starts_block(line):
+    """Whether a line can start a new top-level statement."""
+    if not line or line[0] in " \t\r\n#)]}@":
+        return False
+
+    word = line.split(None, 1)[0].rstrip(":")
+
+    return word not in BLOCK_CONTINUATIONS
+
+class OutlineBuilder:
+    """Builds outlines for successive versions of one document, reparsing only the top-level blocks whose text
+    changed since the previous version."""
+
+    def __init__(self):
+        self.index = None
+        self.block_cache = {} # Block text -> (symbols, folding ranges) relative to the block's first line
+
+    def build(self, version, text):
+        if self.index is not None and self.index.version == version:
+            return self.index
+
+        lines = text.splitlines(keepends=True)
+        starts, decorators_start = [0], None
+
+        for i in range(1, len(lines)):
+            if lines[i].startswith("@"):
+                decorators_start = i if decorators_start is None else decorators_start
+                continue
+
+            if starts_block(lines[i]):
+                starts.append(i if decorators_start is None else decorators_start) # Decorators stay with their definition
+
+            decorators_start = None
+
+        starts.append(len(lines))
+
+        symbols, folding_ranges, block_cache = [], [], {}
+        i = 0
+
+        while i < len(starts) - 1:
+            block_symbols, block_folds, block_text, j = None, None, None, i + 1
+
+            # A block that does not parse alone may be cut through a multi-line string; try it with the next ones
+            while j < len(starts) and j - i <= MAX_BLOCK_MERGE:
+                block_text = "".join(lines[starts[i]:starts[j]])
+                result = self.block_cache.get(block_text) or block_cache.get(block_text) or self.parse_block(block_text)
+
+                if result is not None:
+                    block_symbols, block_folds = result
+                    block_cache[block_text] = result
+                    break
+
+                j += 1
+
+            if block_symbols is None:
+                j = i + 1
+                block_symbols, block_folds = scan_outline(lines[starts[i]:starts[j]])
+
+            offset = starts[i]
+            symbols.extend(symbol.shifted(offset) for symbol in block_symbols)
+            folding_ranges.extend((start + offset, end + offset) for start, end in block_folds)
+            i = j
+
+        self.block_cache = block_cache # Only blocks of the current version are worth keeping
+        self.index = OutlineIndex(version, symbols, folding_ranges)
+
+        return self.index
+
+    @staticmethod
+    def parse_block(block_text):
+        try:
+            tree = ast.parse(block_text)
+        except (SyntaxError, ValueError):
+            return None
+
+        symbols, folding_ranges = [], []
+        collect_outline(tree, symbols, folding_ranges)
+
+        return symbols, folding_ranges
+
+class OutlineIndexer(QThread):
+    """Builds document outlines off the UI thread. Requests that pile up are coalesced to the latest version of
+    each document."""
+
+    outline_ready = pyqtSignal(str, object) # Model id, OutlineIndex
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = OutlineIndexer()
+            cls._instance.start()
+            QCoreApplication.instance().aboutToQuit.connect(cls._instance.stop)
+
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+
+        self.requests = queue.Queue()
+        self.builders = {} # Model id -> OutlineBuilder, only ever touched by the worker thread
+
+    def submit(self, model_id, version, text):
+        self.requests.put((model_id, version, text))
+
+    def forget(self, model_id):
+        """Drops everything cached for a closed document."""
+        self.requests.put((model_id, None, None))
+
+    def run(self):
+        while True:
+            request = self.requests.get()
+
+            if request is None:
+                return
+
+            latest = {request[0]: request}
+
+            try:
+                while True:
+                    request = self.requests.get_nowait()
+
+                    if request is None:
+                        return
+
+                    latest[request[0]] = request
+            except queue.Empty:
+                pass
+
+            for model_id, version, text in latest.values():
+                if version is None:
+                    self.builders.pop(model_id, None)
+                    continue
+
+                try:
+                    index = self.builders.setdefault(model_id, OutlineBuilder()).build(version, text)
+                except Exception as e:
+                    logging.error(f"Failed to build the outline of {model_id}: {e}.")
+                    continue
+
+                self.outline_ready.emit(model_id, index)
+
+    def stop(self):
+        self.requests.put(None)
+        self.wait()
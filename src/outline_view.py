@@ -0,0 +1,51 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+class OutlineView(QTreeWidget):
+    """Tree of the classes and functions of the current editor tab, built from its outline index."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setObjectName("OutlineView")
+        self.setHeaderHidden(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.itemClicked.connect(self.on_item_clicked)
+
+        self.tab = None
+
+    def set_tab(self, tab):
+        """Follows the outline of the given editor tab, or shows nothing for None."""
+        if self.tab is not None:
+            try:
+                self.tab.outline_changed.disconnect(self.refresh)
+            except (TypeError, RuntimeError):
+                pass # The tab has already been closed
+
+        self.tab = tab
+
+        if tab is not None:
+            tab.outline_changed.connect(self.refresh)
+
+        self.refresh()
+
+    def refresh(self):
+        self.clear()
+
+        if self.tab is None or self.tab.outline is None:
+            return
+
+        self.add_items(self.invisibleRootItem(), self.tab.outline.symbols)
+        self.expandAll()
+
+    def add_items(self, parent_item, symbols):
+        for symbol in symbols:
+            item = QTreeWidgetItem(parent_item, [symbol.name])
+            item.setData(0, Qt.ItemDataRole.UserRole, symbol.start_line)
+            item.setToolTip(0, f"{symbol.kind} {symbol.name}, line {symbol.start_line}")
+
+            self.add_items(item, symbol.children)
+
+    def on_item_clicked(self, item):
+        if self.tab is not None:
+            self.tab.reveal_line(item.data(0, Qt.ItemDataRole.UserRole))
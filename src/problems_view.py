@@ -0,0 +1,370 @@
+import bisect
+
+from array import array
+
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QLineEdit, QPushButton, QComboBox
+
+from src.diagnostics import ERROR, WARNING, INFO, HINT, count_severities
+
+SORT_BY_POSITION = 0
+SORT_BY_SEVERITY = 1
+ALL_SEVERITIES = ERROR | WARNING | INFO | HINT # Severities are single bits, so a set of them is a mask
+
+SEVERITY_COLORS = {ERROR: QColor(Qt.GlobalColor.red), WARNING: QColor(255, 165, 0)}
+
+def diagnostic_signature(diagnostic):
+    return (diagnostic.severity, diagnostic.line, diagnostic.column, diagnostic.message_id, diagnostic.message)
+
+class FileProblems:
+    """The diagnostics of one file, and which of them are shown in what order."""
+
+    __slots__ = ("key", "label", "path", "diagnostics", "severities", "search_texts", "errors", "warnings", "rows", "row")
+
+    def __init__(self, key, label, path):
+        self.key = key # Whatever the owner identifies the file by; the EditorTab for open documents
+        self.label = label
+        self.path = path
+        self.diagnostics = [] # In position order
+        self.severities = array('B') # Severity of each diagnostic, for filtering without touching the records
+        self.search_texts = None # Lowercased text of each diagnostic, built when a text filter first needs it
+        self.errors = 0
+        self.warnings = 0
+        self.rows = array('l') # Indices into diagnostics of the shown ones, in display order
+        self.row = -1 # Row among the shown files, -1 while none of its diagnostics is shown
+
+    @property
+    def sort_key(self):
+        return (self.label.lower(), self.path)
+
+class ProblemsModel(QAbstractItemModel):
+    """Diagnostics of every file, grouped by file: files are the top-level rows and their diagnostics the child rows.
+
+    Nothing is created per row. Each file keeps its diagnostics with parallel arrays of their severities and search
+    texts, and an index array of the rows that pass the filters, in display order; the view reads records through it.
+    Replacing a file's diagnostics only removes and inserts the rows that changed, and only that file's.
+    """
+
+    counts_changed = pyqtSignal(int, int) # Errors, warnings in all files, whatever the filters hide
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.files = {} # Key -> FileProblems
+        self.shown = [] # FileProblems with at least one shown diagnostic, by label
+        self.severity_mask = ALL_SEVERITIES
+        self.filter_text = ""
+        self.sort_mode = SORT_BY_POSITION
+        self.errors = 0
+        self.warnings = 0
+
+    # Qt model interface. Top-level indexes carry no pointer; a diagnostic's index points at its FileProblems.
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid():
+            if parent.internalPointer() is not None:
+                return QModelIndex() # Diagnostics have no children
+
+            file = self.shown[parent.row()]
+
+            return self.createIndex(row, column, file) if 0 <= row < len(file.rows) else QModelIndex()
+
+        return self.createIndex(row, column) if 0 <= row < len(self.shown) else QModelIndex()
+
+    def parent(self, index):
+        file = index.internalPointer() if index.isValid() else None
+
+        if file is None or file.row < 0:
+            return QModelIndex()
+
+        return self.createIndex(file.row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.shown)
+
+        if parent.internalPointer() is not None:
+            return 0 # Diagnostics have no children
+
+        return len(self.shown[parent.row()].rows)
+
+    def columnCount(self, _parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        file = index.internalPointer()
+
+        if file is None:
+            file = self.shown[index.row()]
+
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"{file.label}  ({len(file.rows)})"
+            elif role == Qt.ItemDataRole.ToolTipRole:
+                return file.path or file.label
+
+            return None
+
+        diagnostic = file.diagnostics[file.rows[index.row()]]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (f"{diagnostic.severity_name}: {diagnostic.message}  {diagnostic.symbol}({diagnostic.message_id}) "
+                    f"[Ln {diagnostic.line}, Col {diagnostic.column}]")
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            return SEVERITY_COLORS.get(diagnostic.severity)
+        elif role == Qt.ItemDataRole.UserRole:
+            return (diagnostic.line, diagnostic.column)
+
+        return None
+
+    def diagnostic_at(self, index):
+        """(file key, Diagnostic) of a diagnostic's index, or None for a file's."""
+        file = index.internalPointer() if index.isValid() else None
+
+        return (file.key, file.diagnostics[file.rows[index.row()]]) if file is not None else None
+
+    # Updates
+
+    def set_file_problems(self, key, label, path, diagnostics):
+        """Replaces the diagnostics of a file."""
+        file = self.files.get(key)
+
+        if file is None:
+            file = self.files[key] = FileProblems(key, label, path)
+
+        # Built on the side, as the view may read the old rows until they are removed
+        staged = FileProblems(key, label, path)
+        staged.diagnostics = sorted(diagnostics, key=lambda diagnostic: (diagnostic.line, diagnostic.column))
+        staged.severities = array('B', [diagnostic.severity for diagnostic in staged.diagnostics])
+        staged.errors, staged.warnings = count_severities(staged.diagnostics)
+        new_rows = self.filter_rows(staged)
+
+        self.errors += staged.errors - file.errors
+        self.warnings += staged.warnings - file.warnings
+
+        if file.row >= 0 and (not new_rows or staged.sort_key != file.sort_key):
+            self._hide(file) # Renamed files are moved by being shown again where they now belong
+
+        if file.row < 0:
+            self._adopt(file, staged, new_rows)
+
+            if new_rows:
+                self._show(file)
+        else:
+            self._replace_rows(file, staged, new_rows)
+
+        self.counts_changed.emit(self.errors, self.warnings)
+
+    def remove_file(self, key):
+        file = self.files.pop(key, None)
+
+        if file is None:
+            return
+
+        if file.row >= 0:
+            self._hide(file)
+
+        self.errors -= file.errors
+        self.warnings -= file.warnings
+        self.counts_changed.emit(self.errors, self.warnings)
+
+    @staticmethod
+    def _adopt(file, staged, rows):
+        file.label, file.path = staged.label, staged.path
+        file.diagnostics, file.severities, file.search_texts = staged.diagnostics, staged.severities, staged.search_texts
+        file.errors, file.warnings = staged.errors, staged.warnings
+        file.rows = rows
+
+    def _replace_rows(self, file, staged, new_rows):
+        """Swaps a shown file's rows for new ones, removing and inserting only the changed middle."""
+        old_diagnostics, old_rows = file.diagnostics, file.rows
+        new_diagnostics = staged.diagnostics
+        old_count, new_count = len(old_rows), len(new_rows)
+        limit = min(old_count, new_count)
+        prefix = 0
+
+        while prefix < limit and diagnostic_signature(old_diagnostics[old_rows[prefix]]) == diagnostic_signature(new_diagnostics[new_rows[prefix]]):
+            prefix += 1
+
+        suffix = 0
+        limit -= prefix
+
+        while suffix < limit and diagnostic_signature(old_diagnostics[old_rows[-1 - suffix]]) == diagnostic_signature(new_diagnostics[new_rows[-1 - suffix]]):
+            suffix += 1
+
+        parent = self.createIndex(file.row, 0)
+
+        if old_count - suffix > prefix:
+            self.beginRemoveRows(parent, prefix, old_count - suffix - 1)
+            file.rows = old_rows[:prefix] + old_rows[old_count - suffix:]
+            self.endRemoveRows()
+
+        # The rows left are equal in the new records, so switching to them changes nothing the view shows
+        self._adopt(file, staged, new_rows[:prefix] + new_rows[new_count - suffix:])
+
+        if new_count - suffix > prefix:
+            self.beginInsertRows(parent, prefix, new_count - suffix - 1)
+            file.rows = new_rows
+            self.endInsertRows()
+
+        self.dataChanged.emit(parent, parent) # Its count
+
+    def _show(self, file):
+        position = bisect.bisect_left([shown.sort_key for shown in self.shown], file.sort_key)
+
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.shown.insert(position, file)
+        self._renumber(position)
+        self.endInsertRows()
+
+    def _hide(self, file):
+        position = file.row
+
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self.shown[position]
+        self._renumber(position)
+        self.endRemoveRows()
+        file.row = -1 # Only now, as parent() of its diagnostics must keep working while the rows are removed
+
+    def _renumber(self, start):
+        for row in range(start, len(self.shown)):
+            self.shown[row].row = row
+
+    # Filters and sorting
+
+    def filter_rows(self, file):
+        """Indices of the diagnostics of file that pass the filters, in display order."""
+        mask = self.severity_mask
+        rows = [i for i, severity in enumerate(file.severities) if severity & mask]
+
+        if self.filter_text:
+            if file.search_texts is None:
+                file.search_texts = [f"{diagnostic.message} {diagnostic.symbol} {diagnostic.message_id}".lower()
+                                     for diagnostic in file.diagnostics]
+
+            texts, text = file.search_texts, self.filter_text
+            rows = [i for i in rows if text in texts[i]]
+
+        if self.sort_mode == SORT_BY_SEVERITY:
+            severities = file.severities
+            rows.sort(key=lambda i: -severities[i]) # Stable, so position order holds within a severity
+
+        return array('l', rows)
+
+    def set_severity_mask(self, mask):
+        if mask != self.severity_mask:
+            self.severity_mask = mask
+            self.refilter()
+
+    def set_filter_text(self, text):
+        text = text.strip().lower()
+
+        if text != self.filter_text:
+            self.filter_text = text
+            self.refilter()
+
+    def set_sort_mode(self, sort_mode):
+        if sort_mode != self.sort_mode:
+            self.sort_mode = sort_mode
+            self.refilter()
+
+    def refilter(self):
+        """Recomputes every file's rows for changed filters or sorting, which affects every row anyway."""
+        self.beginResetModel()
+
+        for file in self.files.values():
+            file.rows = self.filter_rows(file)
+            file.row = -1
+
+        self.shown = sorted((file for file in self.files.values() if file.rows), key=lambda file: file.sort_key)
+        self._renumber(0)
+        self.endResetModel()
+
+    @property
+    def shown_count(self):
+        return sum(len(file.rows) for file in self.shown)
+
+class ProblemsView(QWidget):
+    """The PROBLEMS panel: a filter bar over a tree of the problems of every linted file."""
+
+    problem_activated = pyqtSignal(object, int, int) # File key, line, column
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setObjectName("ProblemsPanel")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground) # So the panel's stylesheet background applies
+
+        self.model = ProblemsModel(self)
+
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText("Filter (e.g. text, W0611, unused-import)")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.model.set_filter_text)
+
+        self.severity_buttons = {}
+
+        for severity, name in ((ERROR, "Errors"), (WARNING, "Warnings"), (INFO | HINT, "Infos")):
+            button = QPushButton(name, self)
+            button.setCheckable(True)
+            button.setChecked(True)
+            button.setCursor(Qt.CursorShape.PointingHandCursor)
+            button.toggled.connect(self.update_severity_mask)
+            self.severity_buttons[severity] = button
+
+        self.sort_combo = QComboBox(self)
+        self.sort_combo.addItem("Sort by Position", SORT_BY_POSITION)
+        self.sort_combo.addItem("Sort by Severity", SORT_BY_SEVERITY)
+        self.sort_combo.currentIndexChanged.connect(lambda: self.model.set_sort_mode(self.sort_combo.currentData()))
+
+        self.view = QTreeView(self)
+        self.view.setObjectName("ProblemsView")
+        self.view.setHeaderHidden(True)
+        self.view.setUniformRowHeights(True) # Lets the view lay out a hundred thousand rows without measuring them
+        self.view.setModel(self.model)
+        self.view.activated.connect(self.on_activated)
+
+        # New files show up expanded, as they do after a filter change
+        self.model.rowsInserted.connect(self.on_rows_inserted)
+        self.model.modelReset.connect(self.view.expandAll)
+
+        toolbar = QHBoxLayout()
+        toolbar.setContentsMargins(8, 4, 8, 4)
+        toolbar.addWidget(self.filter_edit, 1)
+
+        for button in self.severity_buttons.values():
+            toolbar.addWidget(button)
+
+        toolbar.addWidget(self.sort_combo)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addLayout(toolbar)
+        layout.addWidget(self.view)
+
+    def update_severity_mask(self):
+        mask = 0
+
+        for severity, button in self.severity_buttons.items():
+            if button.isChecked():
+                mask |= severity
+
+        self.model.set_severity_mask(mask)
+
+    def on_rows_inserted(self, parent, first, last):
+        if parent.isValid():
+            return
+
+        for row in range(first, last + 1):
+            self.view.expand(self.model.index(row, 0))
+
+    def on_activated(self, index):
+        problem = self.model.diagnostic_at(index)
+
+        if problem is not None:
+            key, diagnostic = problem
+            self.problem_activated.emit(key, diagnostic.line, diagnostic.column)
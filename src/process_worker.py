@@ -1,7 +1,7 @@
 import os, psutil
 
 from PyQt6.QtCore import QThread, pyqtSignal, Qt
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QLabel
 
 class ProcessWorker(QThread):
     # Signal to send data back to the main thread
@@ -77,6 +77,9 @@ class ProcessMonitor(QWidget):
         # Add the table to the layout
         layout.addWidget(self.tableWidget)
 
+        self.hibernation_label = QLabel("Hibernated Tabs: N/A", self)
+        layout.addWidget(self.hibernation_label)
+
         # Get the project directory and create the worker thread to fetch process data
         project_dir = os.path.dirname(os.path.abspath(__file__))  # Get the project directory
         self.worker = ProcessWorker(project_dir)
@@ -85,6 +88,19 @@ class ProcessMonitor(QWidget):
 
         self.setLayout(layout)
 
+    def set_tab_hibernator(self, tab_hibernator):
+        """Show how many tabs are hibernated and how much memory that freed."""
+        self.tab_hibernator = tab_hibernator
+        self.tab_hibernator.stats_changed.connect(self.update_hibernation_info)
+        self.update_hibernation_info()
+
+    def update_hibernation_info(self):
+        hibernator = self.tab_hibernator
+        self.hibernation_label.setText(
+            f"Hibernated Tabs: {hibernator.hibernated_count} hibernated, {hibernator.active_count} active | "
+            f"Reclaimed: {hibernator.reclaimed_bytes / (1024 * 1024):.1f} MB"
+        )
+
     def update_process_list(self, processes):
         """Update the QTableWidget with new process data."""
         self.tableWidget.setRowCount(len(processes))  # Update the table row count
@@ -1,4 +1,6 @@
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+from src.outline_view import OutlineView
 
 class SecondaryBar(QWidget):
     def __init__(self, parent=None):
@@ -6,4 +8,14 @@ class SecondaryBar(QWidget):
         
         self.setAutoFillBackground(True)
         self.setObjectName("SecondaryBar")
-        
\ No newline at end of file
+
+        self.outline_label = QLabel("OUTLINE", self)
+        self.outline_label.setObjectName("OutlineLabel")
+
+        self.outline_view = OutlineView(self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.outline_label)
+        layout.addWidget(self.outline_view)
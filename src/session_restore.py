@@ -0,0 +1,41 @@
+from collections import deque
+
+from PyQt6.QtCore import QObject, QTimer
+
+IDLE_INTERVAL_MS = 250 # Pause between restoring two background tabs
+
+class SessionRestorer(QObject):
+    """Materializes the placeholder tabs of a restored session in the background, one at a time and only while
+    no other tab is still loading, so restoring never competes with the tab the user is looking at."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.queue = deque()
+        self.loading = None # Tab whose file is being streamed in, if any
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(IDLE_INTERVAL_MS)
+        self.timer.timeout.connect(self.restore_next)
+
+    def restore(self, tabs, current=None):
+        """Queues placeholder tabs; current is the tab shown first, which the rest wait for."""
+        self.queue.extend(tabs)
+        self.loading = current
+        self.timer.start()
+
+    def restore_next(self):
+        # Drop tabs that were closed or shown in the meantime
+        while self.queue and (self.queue[0].disposed or self.queue[0].materialized):
+            self.queue.popleft()
+
+        if not self.queue:
+            return
+
+        # Wait while the previous tab is still streaming its file
+        if self.loading is None or self.loading.disposed or not self.loading.is_loading:
+            self.loading = self.queue.popleft()
+            self.loading.materialize()
+
+        self.timer.start()
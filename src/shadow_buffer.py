@@ -0,0 +1,144 @@
+import re
+
+from bisect import bisect_right
+
+LINE_BREAK = re.compile(r"\r\n|\r|\n")
+BLOCK_SIZE = 512 # Lines per block; blocks are split at twice this size
+
+def utf16_column_to_index(line, column):
+    """Converts a 0-based UTF-16 column, as Monaco reports it, into an index into the Python string."""
+    if line.isascii():
+        return column
+
+    units = 0
+
+    for index, char in enumerate(line):
+        if units >= column:
+            return index
+
+        units += 2 if ord(char) > 0xFFFF else 1
+
+    return len(line)
+
+class ShadowDocument:
+    """Python-side copy of a Monaco model, kept in sync by applying the model's change events.
+
+    Lines are stored in blocks of a few hundred, so an edit only touches the blocks it spans and costs the
+    same in a 50k-line file as in a small one. A prefix index over the blocks maps line numbers to blocks.
+    """
+
+    def __init__(self, text=""):
+        self.version = 0
+        self.set_text(text)
+
+    def set_text(self, text):
+        """Replaces the whole document, e.g. when a file is loaded."""
+        lines = LINE_BREAK.split(text)
+
+        self.eol = "\r\n" if "\r\n" in text else "\n"
+        self.blocks = [lines[i:i + BLOCK_SIZE] for i in range(0, len(lines), BLOCK_SIZE)]
+        self._block_starts = None
+        self._text = text
+
+    @property
+    def block_starts(self):
+        """First line number (0-based) of every block, rebuilt only after the line count changed."""
+        if self._block_starts is None:
+            starts, total = [], 0
+
+            for block in self.blocks:
+                starts.append(total)
+                total += len(block)
+
+            self._block_starts = starts
+
+        return self._block_starts
+
+    @property
+    def line_count(self):
+        return self.block_starts[-1] + len(self.blocks[-1])
+
+    def _locate(self, line_index):
+        """Returns (block index, index within block) for a 0-based line number."""
+        block_index = bisect_right(self.block_starts, line_index) - 1
+
+        return block_index, line_index - self.block_starts[block_index]
+
+    def get_line(self, line_number):
+        """Returns the text of a 1-based line, without its line break."""
+        block_index, offset = self._locate(line_number - 1)
+
+        return self.blocks[block_index][offset]
+
+    def get_text(self):
+        if self._text is None:
+            self._text = self.eol.join(line for block in self.blocks for line in block)
+
+        return self._text
+
+    def append(self, text):
+        """Appends text at the end of the document, e.g. a chunk of a file that is being streamed in."""
+        new_lines = LINE_BREAK.split(text)
+        last_block = self.blocks[-1]
+        last_block[-1] += new_lines[0]
+
+        if len(new_lines) > 1:
+            last_block.extend(new_lines[1:])
+
+            if len(last_block) > 2 * BLOCK_SIZE:
+                self._rebalance(len(self.blocks) - 1)
+
+            self._block_starts = None
+
+        self._text = None
+
+    def apply_changes(self, version, changes, eol=None, is_flush=False):
+        """Applies one Monaco content change event. Changes are (start line, start column, end line, end column, text)
+        tuples with 1-based positions, ordered so they can be applied one after another."""
+        if version <= self.version:
+            return # Already applied, e.g. replayed after a reload
+
+        if is_flush:
+            self.set_text(changes[0][4] if changes else "")
+        else:
+            for start_line, start_column, end_line, end_column, text in changes:
+                self.replace(start_line, start_column, end_line, end_column, text)
+
+        if eol:
+            self.eol = eol
+
+        self.version = version
+
+    def replace(self, start_line, start_column, end_line, end_column, text):
+        """Replaces a 1-based, end-exclusive Monaco range with text."""
+        first_block, first_offset = self._locate(start_line - 1)
+        last_block, last_offset = self._locate(end_line - 1)
+
+        first_line = self.blocks[first_block][first_offset]
+        last_line = self.blocks[last_block][last_offset]
+
+        new_lines = LINE_BREAK.split(text)
+        new_lines[0] = first_line[:utf16_column_to_index(first_line, start_column - 1)] + new_lines[0]
+        new_lines[-1] += last_line[utf16_column_to_index(last_line, end_column - 1):]
+
+        if first_block == last_block:
+            self.blocks[first_block][first_offset:last_offset + 1] = new_lines
+        else:
+            self.blocks[first_block][first_offset:] = new_lines
+            self.blocks[first_block].extend(self.blocks[last_block][last_offset + 1:])
+            del self.blocks[first_block + 1:last_block + 1]
+
+        if end_line != start_line or len(new_lines) != 1:
+            self._rebalance(first_block)
+            self._block_starts = None
+
+        self._text = None
+
+    def _rebalance(self, block_index):
+        """Splits an oversized block and drops an emptied one."""
+        block = self.blocks[block_index]
+
+        if len(block) > 2 * BLOCK_SIZE:
+            self.blocks[block_index:block_index + 1] = [block[i:i + BLOCK_SIZE] for i in range(0, len(block), BLOCK_SIZE)]
+        elif not block and len(self.blocks) > 1:
+            del self.blocks[block_index]
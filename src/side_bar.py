@@ -1,10 +1,8 @@
-import os, logging
+import os
 
-from PyQt6.QtCore import Qt, QFileInfo
+from PyQt6.QtCore import QFileInfo
 from PyQt6.QtWidgets import QTreeView, QAbstractItemView
-from PyQt6.QtGui import QIcon, QFileSystemModel
-
-from src.monaco_editor import MonacoEditor
+from PyQt6.QtGui import QFileSystemModel
 
 class SideBar(QTreeView):
     def __init__(self, parent):
@@ -14,7 +12,6 @@ class SideBar(QTreeView):
         self.file_system_model = FileSystemModel(self)
         self.tabs = parent.tabs
         self.save_recent_file = parent.save_recent_file
-        self.file_paths = parent.file_paths
         self.check_for_problems = parent.check_for_problems
         self.update_status_bar = parent.status_bar.update_status_bar
 
@@ -56,55 +53,8 @@ class SideBar(QTreeView):
 
         # Check if the clicked item is a file
         if QFileInfo(file_path).isFile():
-            
-            # Check if the file is already opened in a tab
-            for tab_index in range(self.tabs.count()):
-                current_widget = self.tabs.widget(tab_index)
-
-                if self.file_paths.get(current_widget) == file_path:
-                    self.tabs.setCurrentIndex(tab_index) # Swith to the existing tab
-                    logging.info("File is already open in another tab.")
-
-                    return
-
-            # If the file is not already opened, create a new QTextEdit widget
-            new_tab = MonacoEditor(self, file_path=file_path)
-
-            logging.info(f"Opening file: {file_path}.")
-
-            # Load the file content
-            try:
-                with open(file_path, 'r') as file:
-                    content = file.read()
-                    new_tab.set_content(content)
-
-                    # Connect the textChanged signal to a method that checks for problems
-                    #new_tab.textChanged.connect(self.check_for_problems)
-                    #new_tab.cursorPositionChanged.connect(self.update_status_bar)
-            except Exception as e:
-                new_tab.set_content(f"Error loading file: {e}.")
-                logging.error(f"Failed to open file {file_path}: {e}.")
-
-            self.save_recent_file(file_path)
-
-            icon_index = self.file_system_model.index(file_path)
-            icon = self.file_system_model.data(icon_index, role=Qt.ItemDataRole.DecorationRole)
-
-            # Add the new tab
-            self.tabs.addTab(new_tab, QIcon(icon), QFileInfo(file_path).fileName())
-            self.tabs.setCurrentWidget(new_tab) # Switch to the new tab
-            self.tabs.tabBar().setTabToolTip(self.tabs.indexOf(new_tab), file_path)
-
-            self.tabs.setStyleSheet(
-                """
-                    QTabWidget#TabBar::pane {
-                        border-top: 1px solid #e5e5e5;
-                    }
-                """
-            )
-
-            # Store the file path for this tab
-            self.file_paths[new_tab] = file_path
+            # Switches to the file's tab if it is already open; the registry finds it without scanning the tabs
+            self.main_window.open_file_in_tab(file_path)
 
     def resizeEvent(self, event):
         print(event.size())
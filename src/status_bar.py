@@ -2,7 +2,7 @@ from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QSpacerItem, QSizePolicy
 from PyQt6.QtGui import QIcon
 
-from src.monaco_editor import MonacoEditor
+from src.editor_tab import EditorTab
 
 ICON_PATH = "resources/icons/"
 
@@ -12,9 +12,7 @@ class StatusBar(QHBoxLayout):
         
         self.parent = parent
         self.tabs = parent.tabs
-        self.file_paths = parent.file_paths
-        self.detect_encoding = parent.detect_encoding
-        self.detect_line_endings = parent.detect_line_endings
+        self.documents = parent.documents
         self.detect_language = parent.detect_language
 
         self.remote_window_button = QPushButton(parent)
@@ -85,75 +83,57 @@ class StatusBar(QHBoxLayout):
         self.addWidget(self.version_label)
         self.addWidget(self.notification_button)
 
+    def set_problem_counts(self, errors, warnings):
+        self.error_button.setText(str(errors))
+        self.warning_button.setText(str(warnings))
+
+        tooltip = f"Errors: {errors}, Warnings: {warnings}" if errors or warnings else "No Problems"
+        self.error_button.setToolTip(tooltip)
+        self.warning_button.setToolTip(tooltip)
+
     def update_status_bar(self):
+        """Refreshes the labels for the current tab from the state its editor has already pushed."""
         if not self.tabs.currentWidget():
             return
 
         current_widget = self.tabs.currentWidget()
 
-        if not isinstance(current_widget, MonacoEditor):
+        if not isinstance(current_widget, EditorTab):
             return
 
-        return 
-    
-        current_widget.page().runJavaScript(
-            """
-                function cursorPosition() {
-                    var editor = monaco.editor.getModels()[0];
-                    var position = editor.getPosition(); // Get the cursor position
-                    var line = position.lineNumber;
-                    var col = position.column;
-                    
-                    return { line, col };
-                }
-                cursorPosition();
-            """, self._on_cursor_position)
-
-        current_widget.page().runJavaScript(
-            """
-                function editorContent() {
-                    var model = monaco.editor.getModels()[0];  // Get the first editor model
-                    var text = model.getValue();  // Get the content of the model
-                    
-                    return text;
-                }
-                editorContent();
-            """, self._on_editor_content_received)
-
-        current_widget.page().runJavaScript(
-            """
-                function lineEndings() {
-                    var model = monaco.editor.getModels()[0];  // Get the first editor model
-                    var text = model.getValue();  // Get the content of the model
-                    var lineEndings = text.includes("\\r\\n") ? "CRLF" : "LF";  // Detect line endings
-                
-                    return lineEndings;
-                }
-                lineEndings();
-            """, self._on_line_endings_received)
-
-        file_path = self.file_paths.get(current_widget, "Unknown File")
-        encoding = self.detect_encoding(file_path)
-
-        if self.spaces_label.text() != f"Spaces: 4":
-            self.spaces_label.setText(f"Spaces: 4")
+        line, col = current_widget.cursor_position
+        self._set_cursor_position(line, col)
+
+        file_path = self.documents.file_path(current_widget)
+        encoding = current_widget.encoding.upper() # Detected off the UI thread while the file was loading
+
+        file_info = current_widget.file_info # Sniffed once while the file was loading
+        indentation = file_info.indentation_label if file_info is not None else "Spaces: 4"
+
+        if self.spaces_label.text() != indentation:
+            self.spaces_label.setText(indentation)
 
         if self.encoding_label.text() != encoding:
-            self.encoding_label.setText(encoding)        
-
-        current_widget.page().runJavaScript(
-            """
-                function language() {
-                    var language = monaco.editor.getModels()[0].getModeId(); // Get current language
-                
-                    return language;
-                }
-                language();
-            """, self._on_language_received)
+            self.encoding_label.setText(encoding)
+
+        line_endings = "CRLF" if current_widget.document.eol == "\r\n" else "LF"
+
+        if self.crlf_label.text() != line_endings:
+            self.crlf_label.setText(line_endings)
+
+        language = f"{{ }} {file_info.language_name}" if file_info is not None else self.detect_language(file_path or "")
+
+        if self.language_label.text() != language:
+            self.language_label.setText(language)
 
         if self.version_label.text() != "3.10.0 ('.venv': venv)":
             self.version_label.setText("3.10.0 ('.venv': venv)")
 
+    def on_cursor_position_changed(self, widget, line, col):
+        """Called as the cursor moves in any tab; only the current tab is shown."""
+        if widget is self.tabs.currentWidget():
+            self._set_cursor_position(line, col)
+
     def show_remote_window(self):
         print("Remote Window")
 
@@ -172,31 +152,10 @@ class StatusBar(QHBoxLayout):
     def show_notifications(self):
         print("Notifications")
 
-    def _on_cursor_position(self, result):
-        """Callback for the cursor position returned by Monaco"""
-        if result:
-            line = result["line"]
-            col = result["col"]
-
-            # Update the line and column status in the status bar
-            if self.line_col_label.text() != f"Ln {line}, Col {col}":
-                self.line_col_label.setText(f"Ln {line}, Col {col}")
-
-    def _on_editor_content_received(self, content):
-        """Callback for the content of Monaco editor"""
-        # You can use this callback to handle other updates like word count, unsaved changes, etc.
-        pass
-
-    def _on_line_endings_received(self, line_endings):
-        """Callback for the line endings of the Monaco editor content"""
-        # Update the line endings status in the status bar
-        if self.crlf_label.text() != line_endings:
-            self.crlf_label.setText(line_endings)
-
-    def _on_language_received(self, language):
-        """Callback for the language mode of the Monaco editor"""
-        if self.language_label.text() != f"{language}":
-            self.language_label.setText(f"{language}")
+    def _set_cursor_position(self, line, col):
+        # Update the line and column status in the status bar
+        if self.line_col_label.text() != f"Ln {line}, Col {col}":
+            self.line_col_label.setText(f"Ln {line}, Col {col}")
 
 class StatusBarButton(QPushButton):
     def __init__(self, icon_path, icon_size, parent=None):
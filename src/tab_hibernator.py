@@ -0,0 +1,95 @@
+import os, time, psutil, logging
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from src.editor_tab import EditorTab
+
+CHECK_INTERVAL_MS = 60 * 1000
+
+class TabHibernator(QObject):
+    """Periodically hibernates background editor tabs that have been idle for a while, and the least recently
+    used ones whenever the editor's memory goes over budget. Hibernated tabs come back when activated."""
+
+    stats_changed = pyqtSignal()
+
+    def __init__(self, tabs, idle_minutes, memory_budget_mb, parent=None):
+        super().__init__(parent)
+
+        self.tabs = tabs
+        self.idle_seconds = idle_minutes * 60
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.process = psutil.Process(os.getpid())
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check_tabs)
+        self.timer.start(CHECK_INTERVAL_MS)
+
+    def editor_tabs(self):
+        return [self.tabs.widget(i) for i in range(self.tabs.count()) if isinstance(self.tabs.widget(i), EditorTab)]
+
+    def candidates(self):
+        """Background tabs that can be hibernated, least recently used first."""
+        current = self.tabs.currentWidget()
+        tabs = [tab for tab in self.editor_tabs() if tab is not current and tab.materialized
+                and tab.hibernation_state == "active" and not tab.is_loading]
+
+        return sorted(tabs, key=lambda tab: tab.last_active)
+
+    def memory_usage(self):
+        """Resident memory of the editor and its child processes, which include the web engine renderers."""
+        try:
+            processes = [self.process] + self.process.children(recursive=True)
+        except psutil.Error:
+            return 0
+
+        total = 0
+
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+
+        return total
+
+    def check_tabs(self):
+        now = time.monotonic()
+        candidates = self.candidates()
+
+        for tab in candidates:
+            if now - tab.last_active >= self.idle_seconds:
+                self.hibernate(tab)
+
+        # Over budget: give up one more tab per check, since the memory only drops once the snapshot is in
+        remaining = [tab for tab in candidates if tab.hibernation_state == "active"]
+
+        if remaining and self.memory_usage() > self.memory_budget:
+            logging.info(f"Editor memory is over the {self.memory_budget // (1024 * 1024)} MB budget.")
+            self.hibernate(remaining[0])
+
+    def hibernate(self, tab):
+        try:
+            tab.hibernation_changed.disconnect(self.on_hibernation_changed) # Left over if a snapshot was cancelled
+        except TypeError:
+            pass
+
+        tab.hibernation_changed.connect(self.on_hibernation_changed)
+        tab.hibernate()
+
+    def on_hibernation_changed(self, hibernated):
+        if not hibernated:
+            self.sender().hibernation_changed.disconnect(self.on_hibernation_changed)
+
+        self.stats_changed.emit()
+
+    @property
+    def hibernated_count(self):
+        return sum(tab.is_hibernated for tab in self.editor_tabs())
+
+    @property
+    def active_count(self):
+        return len(self.editor_tabs()) - self.hibernated_count
+
+    @property
+    def reclaimed_bytes(self):
+        return sum(tab.reclaimed_bytes for tab in self.editor_tabs() if tab.is_hibernated)
@@ -0,0 +1,58 @@
+import os, sys, time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from PyQt6.QtWidgets import QApplication
+
+from src.log_viewer import LogViewer
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def slot_errors(monkeypatch):
+    """Exceptions raised in slots; PyQt hands them to sys.excepthook instead of aborting once it is replaced."""
+    errors = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info[1]))
+
+    return errors
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "big.log"
+
+    with open(path, "wb") as file:
+        file.write(b"".join(b"2024-01-01 12:00:00 INFO line %d of the log\n" % i for i in range(3000000)))
+
+    return str(path)
+
+def process_events(app, seconds):
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        app.processEvents()
+
+def test_dispose_while_indexing(app, slot_errors, log_file):
+    viewer = LogViewer(None, log_file)
+    process_events(app, 0.005)
+
+    viewer.dispose()
+    viewer.deleteLater()
+    process_events(app, 0.2) # Delivers whatever the indexer queued before it stopped
+
+    assert slot_errors == []
+
+def test_dispose_while_searching(app, slot_errors, log_file):
+    viewer = LogViewer(None, log_file)
+    viewer.search_edit.setText("no such line")
+    viewer.find_next()
+
+    viewer.dispose()
+    viewer.deleteLater()
+    process_events(app, 0.2)
+
+    assert slot_errors == []